@@ -4,6 +4,12 @@ __version__ = "1.0.0"
 __author__ = "RS Systems"
 __description__ = "Comprehensive health monitoring for RS Systems Django windshield repair application"
 
-from .config import settings
+from .config import get_settings
 
-__all__ = ["settings"]
\ No newline at end of file
+__all__ = ["get_settings", "settings"]
+
+
+def __getattr__(name: str):
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
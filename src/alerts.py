@@ -6,7 +6,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import uuid
-from collections import deque
+from collections import Counter, deque
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -14,7 +14,7 @@ from email.mime.multipart import MIMEMultipart
 import aiohttp
 from slack_sdk.webhook.async_client import AsyncWebhookClient
 
-from .config import settings
+from .config import get_settings
 from .models.django_models import Alert
 
 logger = logging.getLogger(__name__)
@@ -24,9 +24,12 @@ class AlertManager:
     """Manage system alerts and notifications."""
 
     def __init__(self):
-        self.config = settings.alerts
+        self.config = get_settings().alerts
         self.alert_history = deque(maxlen=1000)
         self.active_alerts = {}
+        # Maintained alongside active_alerts so the summary needn't rescan it
+        self._severity_counts = Counter()
+        self._component_counts = Counter()
         self.cooldown_tracker = {}
 
         # Initialize Slack client if configured
@@ -76,6 +79,8 @@ class AlertManager:
 
         # Add to active alerts
         self.active_alerts[alert.id] = alert
+        self._severity_counts[alert.severity] += 1
+        self._component_counts[alert.component] += 1
 
         # Add to history
         self.alert_history.append(alert)
@@ -206,13 +211,13 @@ class AlertManager:
 
     async def resolve_alert(self, alert_id: str):
         """Mark an alert as resolved."""
-        if alert_id in self.active_alerts:
-            alert = self.active_alerts[alert_id]
+        # Remove from active alerts
+        alert = self.active_alerts.pop(alert_id, None)
+        if alert:
             alert.is_resolved = True
             alert.resolved_at = datetime.now()
-
-            # Remove from active alerts
-            del self.active_alerts[alert_id]
+            self._severity_counts[alert.severity] -= 1
+            self._component_counts[alert.component] -= 1
 
             logger.info(f"Alert resolved: {alert.title}")
 
@@ -313,33 +318,30 @@ class AlertManager:
 
     def get_alert_summary(self) -> Dict[str, Any]:
         """Get summary of alert statistics."""
-        active = self.get_active_alerts()
-        history = list(self.alert_history)
-
         # Count by severity
         severity_counts = {
             "critical": 0,
             "warning": 0,
             "info": 0
         }
+        severity_counts.update(+self._severity_counts)
 
-        for alert in active:
-            severity_counts[alert.severity] = severity_counts.get(alert.severity, 0) + 1
-
-        # Count by component
-        component_counts = {}
-        for alert in active:
-            component_counts[alert.component] = component_counts.get(alert.component, 0) + 1
-
-        # Recent trends (last 24 hours)
+        # Recent trends (last 24 hours); history is in creation order, so
+        # walk back from the newest alert until the cutoff
         cutoff = datetime.now() - timedelta(hours=24)
-        recent_alerts = [a for a in history if a.created_at > cutoff]
+        alerts_last_24h = 0
+        for alert in reversed(self.alert_history):
+            if alert.created_at <= cutoff:
+                break
+            alerts_last_24h += 1
+
+        first_active = next(iter(self.active_alerts.values()), None)
 
         return {
-            "active_alerts_count": len(active),
+            "active_alerts_count": len(self.active_alerts),
             "severity_breakdown": severity_counts,
-            "component_breakdown": component_counts,
-            "alerts_last_24h": len(recent_alerts),
-            "most_recent_alert": active[0].dict() if active else None,
+            "component_breakdown": dict(+self._component_counts),
+            "alerts_last_24h": alerts_last_24h,
+            "most_recent_alert": first_active.model_dump() if first_active else None,
             "timestamp": datetime.now().isoformat()
         }
\ No newline at end of file
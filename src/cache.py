@@ -0,0 +1,54 @@
+"""In-process TTL cache for monitor results."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """Cache coroutine results for a fixed number of seconds.
+
+    Concurrent callers asking for the same key while it is being computed
+    share one in-flight task instead of each hitting the backend.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_set(
+        self, key: str, factory: Callable[[], Awaitable[Any]], force_refresh: bool = False
+    ) -> Any:
+        """Return the cached value for ``key``, computing it with ``factory`` if stale.
+
+        ``force_refresh`` recomputes the value even if a fresh one is cached.
+        """
+        entry = self._entries.get(key)
+        if (
+            force_refresh
+            or entry is None
+            or entry[1].cancelled()
+            or time.monotonic() - entry[0] >= self.ttl_seconds
+        ):
+            self.misses += 1
+            entry = (time.monotonic(), asyncio.ensure_future(factory()))
+            self._entries[key] = entry
+        else:
+            self.hits += 1
+
+        try:
+            return await asyncio.shield(entry[1])
+        except Exception:
+            # Don't cache failures; the next caller retries.
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            raise
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one cached key, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -1,62 +1,74 @@
 """Configuration management for RS Systems Health Monitor."""
 
+import logging
 import os
-from typing import Optional, List
-from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from functools import cached_property, lru_cache
+from typing import Annotated, Optional, List
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+from pydantic import Field, field_validator, model_validator
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseConfig(BaseSettings):
     """Database configuration settings."""
 
     database_url: str = Field(
-        default=os.getenv("DATABASE_URL", ""),
+        default="",
+        validation_alias="DATABASE_URL",
         description="PostgreSQL connection URL"
     )
-    db_host: str = Field(default=os.getenv("DB_HOST", "localhost"))
-    db_port: int = Field(default=int(os.getenv("DB_PORT", "5432")))
-    db_name: str = Field(default=os.getenv("DB_NAME", "rs_systems"))
-    db_user: str = Field(default=os.getenv("DB_USER", ""))
-    db_password: str = Field(default=os.getenv("DB_PASSWORD", ""))
-    connection_pool_size: int = Field(default=int(os.getenv("CONNECTION_POOL_SIZE", "20")))
-    query_timeout_seconds: int = Field(default=int(os.getenv("QUERY_TIMEOUT_SECONDS", "30")))
-
-    @validator("database_url", pre=True, always=True)
-    def build_database_url(cls, v, values):
+    db_host: str = Field(default="localhost", validation_alias="DB_HOST")
+    db_port: int = Field(default=5432, validation_alias="DB_PORT")
+    db_name: str = Field(default="rs_systems", validation_alias="DB_NAME")
+    db_user: str = Field(default="", validation_alias="DB_USER")
+    db_password: str = Field(default="", validation_alias="DB_PASSWORD")
+    connection_pool_size: int = Field(default=4, validation_alias="CONNECTION_POOL_SIZE")
+    prepared_statements: bool = Field(default=True, validation_alias="DB_PREPARED_STATEMENTS")
+    query_timeout_seconds: int = Field(default=30, validation_alias="QUERY_TIMEOUT_SECONDS")
+    pool_pre_ping: bool = Field(default=True, validation_alias="DB_POOL_PRE_PING")
+    pool_recycle_seconds: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE_SECONDS")
+    keepalives_idle_seconds: int = Field(default=30, validation_alias="DB_KEEPALIVES_IDLE_SECONDS")
+
+    @model_validator(mode="after")
+    def build_database_url(self) -> "DatabaseConfig":
         """Build database URL from individual components if not provided."""
-        if v:
-            return v
-
-        host = values.get("db_host", "localhost")
-        port = values.get("db_port", 5432)
-        name = values.get("db_name", "rs_systems")
-        user = values.get("db_user", "")
-        password = values.get("db_password", "")
+        if self.database_url:
+            return self
 
-        if user and password:
-            return f"postgresql://{user}:{password}@{host}:{port}/{name}"
-        return f"postgresql://{host}:{port}/{name}"
+        if self.db_user and self.db_password:
+            self.database_url = (
+                f"postgresql://{self.db_user}:{self.db_password}"
+                f"@{self.db_host}:{self.db_port}/{self.db_name}"
+            )
+        else:
+            self.database_url = f"postgresql://{self.db_host}:{self.db_port}/{self.db_name}"
+        return self
 
-    class Config:
-        env_prefix = "DB_"
+    model_config = SettingsConfigDict(env_prefix="DB_", populate_by_name=True)
 
 
 class AWSConfig(BaseSettings):
     """AWS configuration settings."""
 
-    access_key_id: str = Field(default=os.getenv("AWS_ACCESS_KEY_ID", ""))
-    secret_access_key: str = Field(default=os.getenv("AWS_SECRET_ACCESS_KEY", ""))
-    region: str = Field(default=os.getenv("AWS_REGION", "us-east-1"))
-    s3_bucket_name: str = Field(default=os.getenv("S3_BUCKET_NAME", "rs-systems-media"))
+    access_key_id: str = Field(default="", validation_alias="AWS_ACCESS_KEY_ID")
+    secret_access_key: str = Field(default="", validation_alias="AWS_SECRET_ACCESS_KEY")
+    region: str = Field(default="us-east-1", validation_alias="AWS_REGION")
+    s3_bucket_name: str = Field(default="rs-systems-media", validation_alias="S3_BUCKET_NAME")
     s3_damage_photos_prefix: str = Field(
-        default=os.getenv("S3_DAMAGE_PHOTOS_PREFIX", "damage-photos/")
+        default="damage-photos/", validation_alias="S3_DAMAGE_PHOTOS_PREFIX"
+    )
+    s3_inventory_bucket: str = Field(default="", validation_alias="S3_INVENTORY_BUCKET")
+    s3_inventory_prefix: str = Field(
+        default="",
+        validation_alias="S3_INVENTORY_PREFIX",
+        description="Prefix holding the bucket's daily S3 Inventory manifests (CSV format)"
     )
 
-    class Config:
-        env_prefix = "AWS_"
+    model_config = SettingsConfigDict(env_prefix="AWS_", populate_by_name=True)
 
 
 class MonitoringThresholds(BaseSettings):
@@ -64,177 +76,191 @@ class MonitoringThresholds(BaseSettings):
 
     # Database thresholds
     db_query_ms: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_DB_QUERY_MS", "500"))
+        default=500, validation_alias="ALERT_THRESHOLD_DB_QUERY_MS"
     )
     db_connections_pct: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_DB_CONNECTIONS_PCT", "80"))
+        default=80, validation_alias="ALERT_THRESHOLD_DB_CONNECTIONS_PCT"
     )
     db_lock_wait_ms: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_DB_LOCK_WAIT_MS", "1000"))
+        default=1000, validation_alias="ALERT_THRESHOLD_DB_LOCK_WAIT_MS"
     )
 
     # Queue thresholds
     queue_stuck_hours: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_QUEUE_STUCK_HOURS", "24"))
+        default=24, validation_alias="ALERT_THRESHOLD_QUEUE_STUCK_HOURS"
     )
     queue_depth: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_QUEUE_DEPTH", "100"))
+        default=100, validation_alias="ALERT_THRESHOLD_QUEUE_DEPTH"
     )
     pending_repairs: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_PENDING_REPAIRS", "50"))
+        default=50, validation_alias="ALERT_THRESHOLD_PENDING_REPAIRS"
     )
 
     # API thresholds
     api_response_ms: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_API_RESPONSE_MS", "2000"))
+        default=2000, validation_alias="ALERT_THRESHOLD_API_RESPONSE_MS"
     )
     api_error_rate_pct: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_API_ERROR_RATE_PCT", "5"))
+        default=5, validation_alias="ALERT_THRESHOLD_API_ERROR_RATE_PCT"
     )
     api_requests_per_min: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_API_REQUESTS_PER_MIN", "1000"))
+        default=1000, validation_alias="ALERT_THRESHOLD_API_REQUESTS_PER_MIN"
     )
 
     # Storage thresholds
     s3_storage_gb: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_S3_STORAGE_GB", "100"))
+        default=100, validation_alias="ALERT_THRESHOLD_S3_STORAGE_GB"
     )
     s3_cost_usd: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_S3_COST_USD", "500"))
+        default=500, validation_alias="ALERT_THRESHOLD_S3_COST_USD"
+    )
+    s3_growth_gb: int = Field(
+        default=10, validation_alias="ALERT_THRESHOLD_S3_GROWTH_GB"
     )
     photo_size_mb: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_PHOTO_SIZE_MB", "10"))
+        default=10, validation_alias="ALERT_THRESHOLD_PHOTO_SIZE_MB"
     )
 
     # Activity thresholds
     inactive_technicians_hours: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_INACTIVE_TECHNICIANS_HOURS", "2"))
+        default=2, validation_alias="ALERT_THRESHOLD_INACTIVE_TECHNICIANS_HOURS"
     )
     low_activity_hours: int = Field(
-        default=int(os.getenv("ALERT_THRESHOLD_LOW_ACTIVITY_HOURS", "4"))
+        default=4, validation_alias="ALERT_THRESHOLD_LOW_ACTIVITY_HOURS"
     )
 
-    class Config:
-        env_prefix = "ALERT_THRESHOLD_"
+    model_config = SettingsConfigDict(env_prefix="ALERT_THRESHOLD_", populate_by_name=True)
 
 
 class AlertConfig(BaseSettings):
     """Alert configuration settings."""
 
-    enabled: bool = Field(default=os.getenv("ALERT_ENABLED", "true").lower() == "true")
-    cooldown_minutes: int = Field(default=int(os.getenv("ALERT_COOLDOWN_MINUTES", "15")))
+    enabled: bool = Field(default=True, validation_alias="ALERT_ENABLED")
+    cooldown_minutes: int = Field(default=15, validation_alias="ALERT_COOLDOWN_MINUTES")
 
     # Slack configuration
-    slack_webhook_url: Optional[str] = Field(default=os.getenv("SLACK_WEBHOOK_URL"))
-    slack_channel: str = Field(default=os.getenv("SLACK_CHANNEL", "#rs-systems-alerts"))
-    slack_username: str = Field(default=os.getenv("SLACK_USERNAME", "RS Health Monitor"))
+    slack_webhook_url: Optional[str] = Field(default=None, validation_alias="SLACK_WEBHOOK_URL")
+    slack_channel: str = Field(default="#rs-systems-alerts", validation_alias="SLACK_CHANNEL")
+    slack_username: str = Field(default="RS Health Monitor", validation_alias="SLACK_USERNAME")
 
     # Email configuration
     email_enabled: bool = Field(
-        default=os.getenv("EMAIL_ALERT_ENABLED", "false").lower() == "true"
+        default=False, validation_alias="EMAIL_ALERT_ENABLED"
+    )
+    email_from: str = Field(default="monitoring@rssystems.com", validation_alias="EMAIL_ALERT_FROM")
+    email_to: Annotated[List[str], NoDecode] = Field(
+        default=["admin@rssystems.com"], validation_alias="EMAIL_ALERT_TO"
     )
-    email_from: str = Field(default=os.getenv("EMAIL_ALERT_FROM", "monitoring@rssystems.com"))
-    email_to: List[str] = Field(default_factory=lambda: [
-        email.strip()
-        for email in os.getenv("EMAIL_ALERT_TO", "admin@rssystems.com").split(",")
-    ])
-    email_smtp_host: str = Field(default=os.getenv("EMAIL_SMTP_HOST", "smtp.gmail.com"))
-    email_smtp_port: int = Field(default=int(os.getenv("EMAIL_SMTP_PORT", "587")))
-    email_smtp_user: Optional[str] = Field(default=os.getenv("EMAIL_SMTP_USER"))
-    email_smtp_password: Optional[str] = Field(default=os.getenv("EMAIL_SMTP_PASSWORD"))
+    email_smtp_host: str = Field(default="smtp.gmail.com", validation_alias="EMAIL_SMTP_HOST")
+    email_smtp_port: int = Field(default=587, validation_alias="EMAIL_SMTP_PORT")
+    email_smtp_user: Optional[str] = Field(default=None, validation_alias="EMAIL_SMTP_USER")
+    email_smtp_password: Optional[str] = Field(default=None, validation_alias="EMAIL_SMTP_PASSWORD")
 
-    class Config:
-        env_prefix = "ALERT_"
+    model_config = SettingsConfigDict(env_prefix="ALERT_", populate_by_name=True)
+
+    @field_validator("email_to", mode="before")
+    @classmethod
+    def split_email_to(cls, v):
+        """Split a comma-separated EMAIL_ALERT_TO value into addresses."""
+        if isinstance(v, str):
+            return [email.strip() for email in v.split(",") if email.strip()]
+        return v
 
 
 class MCPConfig(BaseSettings):
     """MCP server configuration settings."""
 
-    server_name: str = Field(default=os.getenv("MCP_SERVER_NAME", "rs-health-monitor"))
-    server_version: str = Field(default=os.getenv("MCP_SERVER_VERSION", "1.0.0"))
-    server_port: int = Field(default=int(os.getenv("MCP_SERVER_PORT", "8080")))
+    server_name: str = Field(default="rs-health-monitor", validation_alias="MCP_SERVER_NAME")
+    server_version: str = Field(default="1.0.0", validation_alias="MCP_SERVER_VERSION")
+    server_port: int = Field(default=8080, validation_alias="MCP_SERVER_PORT")
     websocket_enabled: bool = Field(
-        default=os.getenv("MCP_WEBSOCKET_ENABLED", "true").lower() == "true"
+        default=True, validation_alias="MCP_WEBSOCKET_ENABLED"
     )
-    websocket_port: int = Field(default=int(os.getenv("MCP_WEBSOCKET_PORT", "8081")))
+    websocket_port: int = Field(default=8081, validation_alias="MCP_WEBSOCKET_PORT")
 
-    class Config:
-        env_prefix = "MCP_"
+    model_config = SettingsConfigDict(env_prefix="MCP_", populate_by_name=True)
 
 
 class MonitoringConfig(BaseSettings):
     """General monitoring configuration."""
 
     interval_seconds: int = Field(
-        default=int(os.getenv("MONITORING_INTERVAL_SECONDS", "30"))
+        default=30, validation_alias="MONITORING_INTERVAL_SECONDS"
     )
     health_check_interval_seconds: int = Field(
-        default=int(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", "60"))
+        default=60, validation_alias="HEALTH_CHECK_INTERVAL_SECONDS"
     )
     metrics_retention_days: int = Field(
-        default=int(os.getenv("METRICS_RETENTION_DAYS", "30"))
+        default=30, validation_alias="METRICS_RETENTION_DAYS"
+    )
+    summary_refresh_seconds: int = Field(
+        default=300, validation_alias="SUMMARY_REFRESH_SECONDS"
+    )
+    s3_config_refresh_seconds: int = Field(
+        default=3600, validation_alias="S3_CONFIG_REFRESH_SECONDS"
+    )
+    max_interval_seconds: int = Field(
+        default=120, validation_alias="MONITORING_MAX_INTERVAL_SECONDS"
+    )
+    api_max_concurrent_requests: int = Field(
+        default=10, validation_alias="API_MAX_CONCURRENT_REQUESTS"
     )
     max_concurrent_monitors: int = Field(
-        default=int(os.getenv("MAX_CONCURRENT_MONITORS", "5"))
+        default=5, validation_alias="MAX_CONCURRENT_MONITORS"
     )
 
-    class Config:
-        env_prefix = "MONITORING_"
+    model_config = SettingsConfigDict(env_prefix="MONITORING_", populate_by_name=True)
 
 
 class FeatureFlags(BaseSettings):
     """Feature flag settings."""
 
     enable_database_monitoring: bool = Field(
-        default=os.getenv("ENABLE_DATABASE_MONITORING", "true").lower() == "true"
+        default=True, validation_alias="ENABLE_DATABASE_MONITORING"
     )
     enable_api_monitoring: bool = Field(
-        default=os.getenv("ENABLE_API_MONITORING", "true").lower() == "true"
+        default=True, validation_alias="ENABLE_API_MONITORING"
     )
     enable_queue_monitoring: bool = Field(
-        default=os.getenv("ENABLE_QUEUE_MONITORING", "true").lower() == "true"
+        default=True, validation_alias="ENABLE_QUEUE_MONITORING"
     )
     enable_s3_monitoring: bool = Field(
-        default=os.getenv("ENABLE_S3_MONITORING", "true").lower() == "true"
+        default=True, validation_alias="ENABLE_S3_MONITORING"
     )
     enable_activity_monitoring: bool = Field(
-        default=os.getenv("ENABLE_ACTIVITY_MONITORING", "true").lower() == "true"
+        default=True, validation_alias="ENABLE_ACTIVITY_MONITORING"
     )
     enable_predictive_alerts: bool = Field(
-        default=os.getenv("ENABLE_PREDICTIVE_ALERTS", "false").lower() == "true"
+        default=False, validation_alias="ENABLE_PREDICTIVE_ALERTS"
+    )
+    enable_index_creation: bool = Field(
+        default=False, validation_alias="ENABLE_INDEX_CREATION"
     )
 
-    class Config:
-        env_prefix = "ENABLE_"
+    model_config = SettingsConfigDict(env_prefix="ENABLE_", populate_by_name=True)
 
 
 class LoggingConfig(BaseSettings):
     """Logging configuration settings."""
 
-    level: str = Field(default=os.getenv("LOG_LEVEL", "INFO"))
+    level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
     file_path: str = Field(
-        default=os.getenv("LOG_FILE_PATH", "/var/log/rs-health-monitor/health.log")
+        default="/var/log/rs-health-monitor/health.log", validation_alias="LOG_FILE_PATH"
     )
-    max_size_mb: int = Field(default=int(os.getenv("LOG_MAX_SIZE_MB", "100")))
-    backup_count: int = Field(default=int(os.getenv("LOG_BACKUP_COUNT", "5")))
+    max_size_mb: int = Field(default=100, validation_alias="LOG_MAX_SIZE_MB")
+    backup_count: int = Field(default=5, validation_alias="LOG_BACKUP_COUNT")
 
-    class Config:
-        env_prefix = "LOG_"
+    model_config = SettingsConfigDict(env_prefix="LOG_", populate_by_name=True)
 
 
 class Settings:
-    """Main settings class combining all configurations."""
+    """Main settings class combining all configurations.
 
-    def __init__(self):
-        self.database = DatabaseConfig()
-        self.aws = AWSConfig()
-        self.thresholds = MonitoringThresholds()
-        self.alerts = AlertConfig()
-        self.mcp = MCPConfig()
-        self.monitoring = MonitoringConfig()
-        self.features = FeatureFlags()
-        self.logging = LoggingConfig()
+    Each configuration section is built on first access, so callers that
+    only touch one section don't pay for parsing the others.
+    """
 
+    def __init__(self):
         # Environment
         self.environment = os.getenv("ENVIRONMENT", "development")
         self.is_production = self.environment == "production"
@@ -252,32 +278,79 @@ class Settings:
         self.api_key = os.getenv("API_KEY", "")
         self.enable_ssl_verification = os.getenv("ENABLE_SSL_VERIFICATION", "true").lower() == "true"
 
-    def validate(self) -> bool:
-        """Validate required settings."""
-        errors = []
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        return DatabaseConfig()
+
+    @cached_property
+    def aws(self) -> AWSConfig:
+        return AWSConfig()
+
+    @cached_property
+    def thresholds(self) -> MonitoringThresholds:
+        return MonitoringThresholds()
 
-        # Check database configuration
-        if not self.database.database_url and not (self.database.db_user and self.database.db_password):
-            errors.append("Database configuration is incomplete")
+    @cached_property
+    def alerts(self) -> AlertConfig:
+        return AlertConfig()
 
-        # Check AWS configuration if S3 monitoring is enabled
-        if self.features.enable_s3_monitoring:
-            if not self.aws.access_key_id or not self.aws.secret_access_key:
-                errors.append("AWS credentials are required for S3 monitoring")
+    @cached_property
+    def mcp(self) -> MCPConfig:
+        return MCPConfig()
 
-        # Check alert configuration
-        if self.alerts.enabled:
-            if not self.alerts.slack_webhook_url and not self.alerts.email_enabled:
-                errors.append("At least one alert channel must be configured")
+    @cached_property
+    def monitoring(self) -> MonitoringConfig:
+        return MonitoringConfig()
+
+    @cached_property
+    def features(self) -> FeatureFlags:
+        return FeatureFlags()
+
+    @cached_property
+    def logging(self) -> LoggingConfig:
+        return LoggingConfig()
+
+    def validate(self) -> bool:
+        """Validate required settings."""
+        errors = [message for check, message in _VALIDATION_CHECKS if not check(self)]
 
         if errors:
-            print("Configuration errors:")
-            for error in errors:
-                print(f"  - {error}")
+            logger.error("Configuration errors:\n%s", "\n".join(f"  - {error}" for error in errors))
             return False
 
         return True
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+# (check, error message) pairs evaluated by Settings.validate()
+_VALIDATION_CHECKS = (
+    # Database configuration
+    (
+        lambda s: bool(s.database.database_url or (s.database.db_user and s.database.db_password)),
+        "Database configuration is incomplete"
+    ),
+    # AWS configuration if S3 monitoring is enabled
+    (
+        lambda s: not s.features.enable_s3_monitoring
+        or bool(s.aws.access_key_id and s.aws.secret_access_key),
+        "AWS credentials are required for S3 monitoring"
+    ),
+    # Alert configuration
+    (
+        lambda s: not s.alerts.enabled or bool(s.alerts.slack_webhook_url or s.alerts.email_enabled),
+        "At least one alert channel must be configured"
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, creating it on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keep ``from .config import settings`` working without building the
+    # settings object at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
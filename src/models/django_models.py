@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RepairStatus(str, Enum):
@@ -43,8 +43,7 @@ class CustomerModel(BaseModel):
     updated_at: Optional[datetime] = None
     is_active: bool = True
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TechnicianModel(BaseModel):
@@ -63,8 +62,7 @@ class TechnicianModel(BaseModel):
     last_repair_date: Optional[datetime] = None
     total_repairs: int = 0
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RepairModel(BaseModel):
@@ -88,8 +86,7 @@ class RepairModel(BaseModel):
     completion_time: Optional[datetime] = None
     points_awarded: int = 0
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserModel(BaseModel):
@@ -106,8 +103,7 @@ class UserModel(BaseModel):
     last_login: Optional[datetime] = None
     date_joined: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RewardModel(BaseModel):
@@ -123,8 +119,7 @@ class RewardModel(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SystemMetrics(BaseModel):
@@ -177,6 +172,9 @@ class SystemMetrics(BaseModel):
 class HealthCheckResult(BaseModel):
     """Health check result for a specific component."""
 
+    # Results are never modified after construction
+    model_config = ConfigDict(frozen=True)
+
     component: str
     status: str  # "healthy", "degraded", "unhealthy"
     message: str
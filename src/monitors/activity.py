@@ -1,62 +1,264 @@
 """User and customer activity monitoring for RS Systems."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 import logging
 
-from ..config import settings
+from psycopg2.extras import RealDictCursor
+
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
 
+# Query text shared by the per-metric methods and the combined snapshot
+# query used by ``monitor()``.
+_ACTIVE_USERS_SQL = """
+SELECT
+    COUNT(*) as total_users,
+    COUNT(*) FILTER (WHERE u.last_login > now() - %s * interval '1 day') as active_users,
+    COUNT(*) FILTER (WHERE u.last_login > now() - interval '1 day') as active_today,
+    COUNT(*) FILTER (WHERE u.last_login > now() - interval '7 days') as active_week,
+    COUNT(t.id) as total_technicians,
+    COUNT(t.id) FILTER (WHERE u.last_login > now() - interval '1 day') as active_technicians_today
+FROM auth_user u
+LEFT JOIN LATERAL (
+    SELECT id FROM technician_portal_technician WHERE user_id = u.id LIMIT 1
+) t ON true
+WHERE u.is_active = true
+"""
+
+_CUSTOMER_ACTIVITY_SQL = """
+SELECT
+    COUNT(*) as total_customers,
+    COUNT(*) FILTER (WHERE last_repair > now() - interval '30 days') as active_customers_30d,
+    COUNT(*) FILTER (WHERE created_at > now() - interval '1 day') as new_customers_today,
+    COUNT(*) FILTER (WHERE created_at > now() - interval '7 days') as new_customers_week,
+    AVG(repair_count) FILTER (WHERE repair_count > 0) as avg_repairs_per_customer
+FROM (
+    SELECT
+        c.id,
+        c.created_at,
+        MAX(r.created_at) as last_repair,
+        COUNT(r.id) as repair_count
+    FROM core_customer c
+    LEFT JOIN technician_portal_repair r ON c.id = r.customer_id
+    GROUP BY c.id, c.created_at
+) customer_repairs
+"""
+
+_TECHNICIAN_PERFORMANCE_SQL = """
+SELECT
+    t.id as technician_id,
+    u.username,
+    u.last_login,
+    COUNT(r.id) as total_repairs,
+    COUNT(CASE WHEN r.queue_status = 'COMPLETED' THEN 1 END) as completed_repairs,
+    COUNT(CASE WHEN r.created_at > now() - interval '7 days' THEN 1 END) as repairs_last_week,
+    AVG(CASE
+        WHEN r.queue_status = 'COMPLETED' THEN
+            EXTRACT(EPOCH FROM (r.updated_at - r.created_at)) / 3600
+    END) as avg_completion_hours,
+    MAX(r.repair_date) as last_repair_date
+FROM technician_portal_technician t
+JOIN auth_user u ON t.user_id = u.id
+LEFT JOIN technician_portal_repair r ON t.id = r.technician_id
+GROUP BY t.id, u.username, u.last_login
+ORDER BY total_repairs DESC, t.id
+LIMIT %s
+"""
+
+_INACTIVE_TECHNICIANS_SQL = """
+SELECT
+    t.id as technician_id,
+    u.username,
+    u.last_login
+FROM technician_portal_technician t
+JOIN auth_user u ON t.user_id = u.id
+WHERE u.last_login IS NULL
+   OR u.last_login < now() - %s * interval '1 hour'
+ORDER BY u.last_login NULLS FIRST, t.id
+LIMIT 50
+"""
+
+# Hourly/daily counts and the top-3 peaks are all computed here, so the
+# Python side only relabels keys regardless of how many logins there are.
+_LOGIN_PATTERNS_SQL = """
+WITH login_counts AS (
+    SELECT
+        EXTRACT(HOUR FROM last_login)::int as hour,
+        EXTRACT(DOW FROM last_login)::int as day_of_week,
+        COUNT(*) as login_count
+    FROM auth_user
+    WHERE last_login > now() - interval '30 days'
+    GROUP BY GROUPING SETS ((EXTRACT(HOUR FROM last_login)), (EXTRACT(DOW FROM last_login)))
+),
+hourly AS (
+    SELECT hour, login_count FROM login_counts WHERE hour IS NOT NULL
+),
+daily AS (
+    SELECT day_of_week, login_count FROM login_counts WHERE day_of_week IS NOT NULL
+)
+SELECT json_build_object(
+    'by_hour', (SELECT COALESCE(json_object_agg(hour, login_count), '{}') FROM hourly),
+    'by_day', (SELECT COALESCE(json_object_agg(day_of_week, login_count), '{}') FROM daily),
+    'peak_hours', (
+        SELECT COALESCE(json_agg(hour ORDER BY login_count DESC, hour), '[]')
+        FROM (SELECT * FROM hourly ORDER BY login_count DESC, hour LIMIT 3) top_hours
+    ),
+    'peak_days', (
+        SELECT COALESCE(json_agg(day_of_week ORDER BY login_count DESC, day_of_week), '[]')
+        FROM (SELECT * FROM daily ORDER BY login_count DESC, day_of_week LIMIT 3) top_days
+    )
+) as login_patterns
+"""
+
+# All four activity queries in a single round trip. Each section is
+# returned as JSON so one row carries every result set.
+_ACTIVITY_SNAPSHOT_SQL = f"""
+WITH user_stats AS ({_ACTIVE_USERS_SQL}),
+customer_stats AS ({_CUSTOMER_ACTIVITY_SQL}),
+technician_stats AS ({_TECHNICIAN_PERFORMANCE_SQL}),
+inactive_stats AS ({_INACTIVE_TECHNICIANS_SQL}),
+login_stats AS ({_LOGIN_PATTERNS_SQL})
+SELECT
+    (SELECT row_to_json(user_stats) FROM user_stats) as user_activity,
+    (SELECT row_to_json(customer_stats) FROM customer_stats) as customer_activity,
+    (SELECT COALESCE(json_agg(technician_stats ORDER BY total_repairs DESC, technician_id), '[]')
+     FROM technician_stats) as technician_performance,
+    (SELECT COALESCE(json_agg(inactive_stats ORDER BY last_login NULLS FIRST, technician_id), '[]')
+     FROM inactive_stats) as inactive_technicians,
+    (SELECT login_patterns FROM login_stats) as login_patterns
+"""
+
+
+# Indexed by PostgreSQL's EXTRACT(DOW ...), where Sunday is 0
+_DAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    """Format a timestamp that may already be an ISO string (from JSON rows)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
 class ActivityMonitor:
     """Monitor user and customer activity patterns."""
 
     def __init__(self, db_monitor):
         self.db_monitor = db_monitor
+        settings = get_settings()
         self.thresholds = settings.thresholds
+        # Activity data changes slowly; reuse results between health check intervals
+        self._cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
 
-    async def get_active_users(self, days: int = 30) -> Dict[str, Any]:
-        """Get active user statistics."""
-        query = """
-        SELECT
-            COUNT(DISTINCT u.id) as total_users,
-            COUNT(DISTINCT CASE 
-                WHEN u.last_login > now() - interval '%s days' THEN u.id 
-            END) as active_users,
-            COUNT(DISTINCT CASE 
-                WHEN u.last_login > now() - interval '1 day' THEN u.id 
-            END) as active_today,
-            COUNT(DISTINCT CASE 
-                WHEN u.last_login > now() - interval '7 days' THEN u.id 
-            END) as active_week,
-            COUNT(DISTINCT t.id) as total_technicians,
-            COUNT(DISTINCT CASE 
-                WHEN t.id IS NOT NULL AND u.last_login > now() - interval '1 day' THEN t.id 
-            END) as active_technicians_today
-        FROM auth_user u
-        LEFT JOIN technician_portal_technician t ON u.id = t.user_id
-        WHERE u.is_active = true
+    def _fetchone(self, query: str, params: Optional[tuple] = None, cursor_factory=RealDictCursor):
+        """Run a query on a pooled connection and return the first row (blocking)."""
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchone()
+
+    def _fetch_streamed(self, name: str, query: str, build, params: Optional[tuple] = None, itersize: int = 100):
+        """Run a query on a server-side cursor, building rows as they arrive (blocking).
+
+        Rows are pulled ``itersize`` at a time, so the raw result set is never
+        held in memory alongside the built entries.
         """
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor(name=name, cursor_factory=RealDictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, params)
+                return [build(row) for row in cursor]
+
+    @staticmethod
+    def _build_user_activity(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an active-users row into the user activity payload."""
+        total_users = row["total_users"]
+        return {
+            "total_users": total_users,
+            "active_users_30d": row["active_users"],
+            "active_today": row["active_today"],
+            "active_week": row["active_week"],
+            "total_technicians": row["total_technicians"],
+            "active_technicians_today": row["active_technicians_today"],
+            "activity_rate_pct": round((row["active_users"] / total_users * 100) if total_users > 0 else 0, 2)
+        }
+
+    @staticmethod
+    def _build_customer_activity(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a customer-activity row into the customer activity payload."""
+        total_customers = row["total_customers"]
+        return {
+            "total_customers": total_customers,
+            "active_customers_30d": row["active_customers_30d"],
+            "new_customers_today": row["new_customers_today"],
+            "new_customers_week": row["new_customers_week"],
+            "avg_repairs_per_customer": round(float(row["avg_repairs_per_customer"] or 0), 2),
+            "engagement_rate_pct": round(
+                (row["active_customers_30d"] / total_customers * 100) if total_customers > 0 else 0, 2
+            )
+        }
+
+    @staticmethod
+    def _build_technician(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a technician-performance row into a technician entry."""
+        total_repairs = row["total_repairs"]
+        completed_repairs = row["completed_repairs"]
+        avg_completion_hours = row["avg_completion_hours"]
+        completion_rate = completed_repairs / total_repairs * 100 if total_repairs else 0
+        return {
+            "technician_id": row["technician_id"],
+            "username": row["username"],
+            "last_login": _isoformat(row["last_login"]),
+            "total_repairs": total_repairs,
+            "completed_repairs": completed_repairs,
+            "repairs_last_week": row["repairs_last_week"],
+            "avg_completion_hours": round(float(avg_completion_hours), 2) if avg_completion_hours else None,
+            "last_repair_date": _isoformat(row["last_repair_date"]),
+            "completion_rate_pct": round(completion_rate, 2)
+        }
+
+    @staticmethod
+    def _build_inactive_technician(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an inactive-technician row into an inactive technician entry."""
+        return {
+            "technician_id": row["technician_id"],
+            "username": row["username"],
+            "last_login": _isoformat(row["last_login"])
+        }
 
+    @staticmethod
+    def _build_login_patterns(aggregates: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert the SQL-side login aggregates into the login pattern payload."""
+        if not aggregates:
+            return {
+                "peak_hours": [],
+                "peak_days": [],
+                "by_hour": {},
+                "by_day": {}
+            }
+
+        return {
+            "peak_hours": aggregates["peak_hours"],
+            "peak_days": [_DAY_NAMES[day] for day in aggregates["peak_days"]],
+            # JSON object keys come back as strings
+            "by_hour": {int(hour): count for hour, count in aggregates["by_hour"].items()},
+            "by_day": {int(day): count for day, count in aggregates["by_day"].items()}
+        }
+
+    async def get_active_users(self, days: int = 30) -> Dict[str, Any]:
+        """Get active user statistics."""
         try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, (days,))
-                    row = cursor.fetchone()
-
-                    if row:
-                        return {
-                            "total_users": row[0],
-                            "active_users_30d": row[1],
-                            "active_today": row[2],
-                            "active_week": row[3],
-                            "total_technicians": row[4],
-                            "active_technicians_today": row[5],
-                            "activity_rate_pct": round((row[1] / row[0] * 100) if row[0] > 0 else 0, 2)
-                        }
+            row = await asyncio.to_thread(self._fetchone, _ACTIVE_USERS_SQL, (days,))
+            if row:
+                return self._build_user_activity(row)
         except Exception as e:
             logger.error(f"Failed to get active users: {e}")
 
@@ -64,184 +266,93 @@ class ActivityMonitor:
 
     async def get_customer_activity(self) -> Dict[str, Any]:
         """Get customer activity metrics."""
-        query = """
-        SELECT
-            COUNT(DISTINCT c.id) as total_customers,
-            COUNT(DISTINCT CASE 
-                WHEN r.created_at > now() - interval '30 days' THEN c.id 
-            END) as active_customers_30d,
-            COUNT(DISTINCT CASE 
-                WHEN c.created_at > now() - interval '1 day' THEN c.id 
-            END) as new_customers_today,
-            COUNT(DISTINCT CASE 
-                WHEN c.created_at > now() - interval '7 days' THEN c.id 
-            END) as new_customers_week,
-            AVG(CASE 
-                WHEN r.customer_id IS NOT NULL THEN repair_count.count 
-            END) as avg_repairs_per_customer
-        FROM core_customer c
-        LEFT JOIN technician_portal_repair r ON c.id = r.customer_id
-        LEFT JOIN (
-            SELECT customer_id, COUNT(*) as count
-            FROM technician_portal_repair
-            GROUP BY customer_id
-        ) repair_count ON c.id = repair_count.customer_id
-        """
-
         try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
-
-                    if row:
-                        return {
-                            "total_customers": row[0],
-                            "active_customers_30d": row[1],
-                            "new_customers_today": row[2],
-                            "new_customers_week": row[3],
-                            "avg_repairs_per_customer": round(row[4] or 0, 2),
-                            "engagement_rate_pct": round((row[1] / row[0] * 100) if row[0] > 0 else 0, 2)
-                        }
+            row = await asyncio.to_thread(self._fetchone, _CUSTOMER_ACTIVITY_SQL)
+            if row:
+                return self._build_customer_activity(row)
         except Exception as e:
             logger.error(f"Failed to get customer activity: {e}")
 
         return {}
 
-    async def get_technician_performance(self) -> List[Dict[str, Any]]:
-        """Get technician performance metrics."""
-        query = """
-        SELECT
-            t.id,
-            u.username,
-            u.last_login,
-            COUNT(r.id) as total_repairs,
-            COUNT(CASE WHEN r.queue_status = 'COMPLETED' THEN 1 END) as completed_repairs,
-            COUNT(CASE WHEN r.created_at > now() - interval '7 days' THEN 1 END) as repairs_last_week,
-            AVG(CASE 
-                WHEN r.queue_status = 'COMPLETED' THEN 
-                    EXTRACT(EPOCH FROM (r.updated_at - r.created_at)) / 3600 
-            END) as avg_completion_hours,
-            MAX(r.repair_date) as last_repair_date
-        FROM technician_portal_technician t
-        JOIN auth_user u ON t.user_id = u.id
-        LEFT JOIN technician_portal_repair r ON t.id = r.technician_id
-        GROUP BY t.id, u.username, u.last_login
-        ORDER BY total_repairs DESC
-        LIMIT 50
-        """
-
-        technicians = []
+    async def get_technician_performance(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get performance metrics for the ``limit`` busiest technicians."""
         try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        technicians.append({
-                            "technician_id": row[0],
-                            "username": row[1],
-                            "last_login": row[2].isoformat() if row[2] else None,
-                            "total_repairs": row[3],
-                            "completed_repairs": row[4],
-                            "repairs_last_week": row[5],
-                            "avg_completion_hours": round(row[6] or 0, 2) if row[6] else None,
-                            "last_repair_date": row[7].isoformat() if row[7] else None,
-                            "completion_rate_pct": round((row[4] / row[3] * 100) if row[3] > 0 else 0, 2)
-                        })
+            return await asyncio.to_thread(
+                self._fetch_streamed,
+                "technician_performance",
+                _TECHNICIAN_PERFORMANCE_SQL,
+                self._build_technician,
+                (limit,)
+            )
         except Exception as e:
             logger.error(f"Failed to get technician performance: {e}")
 
-        return technicians
+        return []
 
     async def get_login_patterns(self) -> Dict[str, Any]:
         """Analyze login patterns."""
-        query = """
-        WITH hourly_logins AS (
-            SELECT
-                EXTRACT(HOUR FROM last_login) as hour,
-                EXTRACT(DOW FROM last_login) as day_of_week,
-                COUNT(*) as login_count
-            FROM auth_user
-            WHERE last_login > now() - interval '30 days'
-            GROUP BY EXTRACT(HOUR FROM last_login), EXTRACT(DOW FROM last_login)
-        )
-        SELECT
-            hour,
-            day_of_week,
-            login_count
-        FROM hourly_logins
-        ORDER BY login_count DESC
-        LIMIT 20
-        """
-
-        patterns = {
-            "peak_hours": [],
-            "peak_days": [],
-            "by_hour": {},
-            "by_day": {}
-        }
-
         try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        hour = int(row[0])
-                        day = int(row[1])
-                        count = row[2]
-
-                        if hour not in patterns["by_hour"]:
-                            patterns["by_hour"][hour] = 0
-                        patterns["by_hour"][hour] += count
-
-                        if day not in patterns["by_day"]:
-                            patterns["by_day"][day] = 0
-                        patterns["by_day"][day] += count
-
-                    # Identify peak hours
-                    if patterns["by_hour"]:
-                        sorted_hours = sorted(patterns["by_hour"].items(), key=lambda x: x[1], reverse=True)
-                        patterns["peak_hours"] = [h[0] for h in sorted_hours[:3]]
-
-                    # Identify peak days
-                    day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-                    if patterns["by_day"]:
-                        sorted_days = sorted(patterns["by_day"].items(), key=lambda x: x[1], reverse=True)
-                        patterns["peak_days"] = [day_names[d[0]] for d in sorted_days[:3]]
-
+            row = await asyncio.to_thread(self._fetchone, _LOGIN_PATTERNS_SQL, None, None)
+            return self._build_login_patterns(row[0] if row else None)
         except Exception as e:
             logger.error(f"Failed to get login patterns: {e}")
 
-        return patterns
+        return self._build_login_patterns(None)
 
-    async def check_health(self) -> HealthCheckResult:
-        """Check activity health."""
-        try:
-            user_activity = await self.get_active_users()
-            
-            inactive_hours = datetime.now() - timedelta(hours=self.thresholds.inactive_technicians_hours)
-            
-            if user_activity.get("active_technicians_today", 0) == 0:
-                status = "degraded"
-                message = "No technician activity today"
-            elif user_activity.get("activity_rate_pct", 0) < 20:
-                status = "degraded"
-                message = "Low user activity rate"
-            else:
-                status = "healthy"
-                message = "Normal user activity levels"
+    async def get_activity_snapshot(self, days: int = 30, technician_limit: int = 10) -> Dict[str, Any]:
+        """Fetch user, customer, technician and login activity in one query.
 
-            return HealthCheckResult(
-                component="activity",
-                status=status,
-                message=message,
-                details=user_activity
-            )
+        Inactive technicians are selected by their own ``last_login`` filter
+        rather than from the top performers, so any technician can show up.
+        """
+        (
+            user_row,
+            customer_row,
+            technician_rows,
+            inactive_rows,
+            login_aggregates
+        ) = await asyncio.to_thread(
+            self._fetchone,
+            _ACTIVITY_SNAPSHOT_SQL,
+            (days, technician_limit, self.thresholds.inactive_technicians_hours),
+            None
+        )
+
+        return {
+            "user_activity": self._build_user_activity(user_row) if user_row else {},
+            "customer_activity": self._build_customer_activity(customer_row) if customer_row else {},
+            "technician_performance": [self._build_technician(row) for row in technician_rows],
+            "inactive_technicians": [self._build_inactive_technician(row) for row in inactive_rows],
+            "login_patterns": self._build_login_patterns(login_aggregates)
+        }
+
+    @staticmethod
+    def _health_from_user_activity(user_activity: Dict[str, Any]) -> HealthCheckResult:
+        """Derive the activity health result from user activity statistics."""
+        if user_activity.get("active_technicians_today", 0) == 0:
+            status = "degraded"
+            message = "No technician activity today"
+        elif user_activity.get("activity_rate_pct", 0) < 20:
+            status = "degraded"
+            message = "Low user activity rate"
+        else:
+            status = "healthy"
+            message = "Normal user activity levels"
+
+        return HealthCheckResult(
+            component="activity",
+            status=status,
+            message=message,
+            details=user_activity
+        )
+
+    async def check_health(self, force_refresh: bool = False) -> HealthCheckResult:
+        """Check activity health (cached for the health check interval)."""
+        try:
+            result = await self._cache.get_or_set("check_health", self._check_health, force_refresh)
         except Exception as e:
+            # Built outside the cache so an outage is re-checked on the next call
             logger.error(f"Activity health check failed: {e}")
             return HealthCheckResult(
                 component="activity",
@@ -249,56 +360,59 @@ class ActivityMonitor:
                 message=f"Activity health check failed: {str(e)}"
             )
 
-    async def monitor(self) -> Dict[str, Any]:
-        """Perform comprehensive activity monitoring."""
-        try:
-            tasks = [
-                self.get_active_users(),
-                self.get_customer_activity(),
-                self.get_technician_performance(),
-                self.get_login_patterns(),
-                self.check_health()
-            ]
-
-            (
-                user_activity,
-                customer_activity,
-                technician_performance,
-                login_patterns,
-                health
-            ) = await asyncio.gather(*tasks)
-
-            # Check for inactive technicians
-            inactive_technicians = [
-                t for t in technician_performance
-                if not t["last_login"] or 
-                datetime.fromisoformat(t["last_login"]) < datetime.now() - timedelta(hours=self.thresholds.inactive_technicians_hours)
-            ]
-
-            issues = []
-            if inactive_technicians:
-                issues.append({
-                    "type": "inactive_technicians",
-                    "severity": "warning",
-                    "message": f"Found {len(inactive_technicians)} inactive technicians",
-                    "technicians": [t["username"] for t in inactive_technicians[:5]]
-                })
+        if result.status != "healthy":
+            # get_active_users reports a failed query as empty stats, which
+            # reads as degraded; don't keep serving that from cache
+            self._cache.invalidate("check_health")
+        return result
 
-            return {
-                "health": health.dict(),
-                "user_activity": user_activity,
-                "customer_activity": customer_activity,
-                "technician_performance": technician_performance[:10],  # Top 10
-                "login_patterns": login_patterns,
-                "inactive_technicians": inactive_technicians,
-                "issues": issues,
-                "has_issues": len(issues) > 0,
-                "timestamp": datetime.now().isoformat()
-            }
+    async def _check_health(self) -> HealthCheckResult:
+        """Check activity health."""
+        user_activity = await self.get_active_users()
+        return self._health_from_user_activity(user_activity)
 
+    async def monitor(self) -> Dict[str, Any]:
+        """Perform comprehensive activity monitoring (cached for the health check interval)."""
+        try:
+            return await self._cache.get_or_set("monitor", self._monitor)
         except Exception as e:
             logger.error(f"Activity monitoring failed: {e}")
             return {
                 "error": str(e),
                 "timestamp": datetime.now().isoformat()
-            }
\ No newline at end of file
+            }
+
+    async def _monitor(self) -> Dict[str, Any]:
+        """Perform comprehensive activity monitoring."""
+        now = datetime.now()
+
+        # One query on one pooled connection; the health result is derived
+        # from the same user statistics instead of querying them again.
+        snapshot = await self.get_activity_snapshot()
+        user_activity = snapshot["user_activity"]
+        health = self._health_from_user_activity(user_activity)
+        customer_activity = snapshot["customer_activity"]
+        technician_performance = snapshot["technician_performance"]
+        login_patterns = snapshot["login_patterns"]
+        inactive_technicians = snapshot["inactive_technicians"]
+
+        issues = []
+        if inactive_technicians:
+            issues.append({
+                "type": "inactive_technicians",
+                "severity": "warning",
+                "message": f"Found {len(inactive_technicians)} inactive technicians",
+                "technicians": [t["username"] for t in inactive_technicians[:5]]
+            })
+
+        return {
+            "health": health.model_dump(mode="json"),
+            "user_activity": user_activity,
+            "customer_activity": customer_activity,
+            "technician_performance": technician_performance,
+            "login_patterns": login_patterns,
+            "inactive_technicians": inactive_technicians,
+            "issues": issues,
+            "has_issues": len(issues) > 0,
+            "timestamp": now.isoformat()
+        }
@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult
 
 logger = logging.getLogger(__name__)
@@ -16,20 +17,39 @@ class ActivityMonitor:
 
     def __init__(self, db_monitor):
         self.db_monitor = db_monitor
+        settings = get_settings()
         self.thresholds = settings.thresholds
-
-    async def get_active_users(self, days: int = 30) -> Dict[str, Any]:
-        """Get simplified active user statistics."""
-        # For SQLite, we'll use simpler queries
-        query = """
-        SELECT
-            COUNT(DISTINCT u.id) as total_users,
-            COUNT(DISTINCT t.id) as total_technicians
-        FROM auth_user u
-        LEFT JOIN technician_portal_technician t ON t.user_id = u.id
-        """
-
-        user_stats = {
+        # Technician aggregates scan every repair, so they are kept as an
+        # in-process summary and recomputed at most once per refresh interval
+        self._summary_cache = AsyncTTLCache(settings.monitoring.summary_refresh_seconds)
+        self.technician_summary_refreshed_at: Optional[datetime] = None
+        # User and customer totals change slowly relative to the monitor loop
+        self._totals_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
+
+    def _fetchone(self, query: str):
+        """Run a query on the shared connection and return the first row (blocking)."""
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                return cursor.fetchone()
+
+    def _fetchall(self, query: str) -> List[Dict[str, Any]]:
+        """Run a query on the shared connection and return rows as dicts (blocking)."""
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                # Key by column name so both sqlite3 and psycopg2 tuple rows work
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def refresh(self):
+        """Drop cached totals and summaries so the next call re-queries."""
+        self._totals_cache.invalidate()
+        self._summary_cache.invalidate()
+
+    @staticmethod
+    def _empty_user_stats() -> Dict[str, Any]:
+        return {
             "total_users": 0,
             "total_technicians": 0,
             "active_users": 0,
@@ -38,74 +58,107 @@ class ActivityMonitor:
             "active_technicians_today": 0
         }
 
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
-
-                    if row:
-                        user_stats["total_users"] = row[0] or 0
-                        user_stats["total_technicians"] = row[1] or 0
-
-                    # Get recent activity (simplified)
-                    recent_query = """
-                    SELECT COUNT(DISTINCT technician_id)
-                    FROM technician_portal_repair
-                    WHERE repair_date > date('now', '-1 day')
-                    """
-                    cursor.execute(recent_query)
-                    recent = cursor.fetchone()
-                    if recent:
-                        user_stats["active_technicians_today"] = recent[0] or 0
+    @staticmethod
+    def _empty_customer_stats() -> Dict[str, Any]:
+        return {
+            "total_customers": 0,
+            "customers_with_repairs": 0,
+            "active_customers_30d": 0,
+            "new_customers_today": 0,
+            "new_customers_week": 0
+        }
 
+    async def get_active_users(self, days: int = 30) -> Dict[str, Any]:
+        """Get simplified active user statistics (cached for the health check interval)."""
+        try:
+            return await self._totals_cache.get_or_set("active_users", self._query_active_users)
         except Exception as e:
             logger.error(f"Failed to get active users: {e}")
 
-        return user_stats
+        return self._empty_user_stats()
 
-    async def get_customer_activity(self) -> Dict[str, Any]:
-        """Get simplified customer activity metrics."""
+    async def _query_active_users(self) -> Dict[str, Any]:
+        """Query active user statistics."""
+        # For SQLite, we'll use simpler queries; totals and recent activity
+        # come back in one row
         query = """
-        SELECT
-            COUNT(DISTINCT c.id) as total_customers,
-            COUNT(DISTINCT r.customer_id) as customers_with_repairs
-        FROM core_customer c
-        LEFT JOIN technician_portal_repair r ON r.customer_id = c.id
+        WITH totals AS (
+            SELECT
+                (SELECT COUNT(*) FROM auth_user) as total_users,
+                (SELECT COUNT(*) FROM technician_portal_technician) as total_technicians
+        ),
+        recent AS (
+            SELECT COUNT(DISTINCT technician_id) as active_technicians_today
+            FROM technician_portal_repair
+            WHERE repair_date > date('now', '-1 day')
+        )
+        SELECT totals.total_users, totals.total_technicians, recent.active_technicians_today
+        FROM totals, recent
         """
 
-        customer_stats = {
-            "total_customers": 0,
-            "customers_with_repairs": 0,
-            "active_customers_30d": 0,
-            "new_customers_today": 0,
-            "new_customers_week": 0
-        }
+        user_stats = self._empty_user_stats()
 
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
+        row = await asyncio.to_thread(self._fetchone, query)
+        if row:
+            user_stats["total_users"] = row[0] or 0
+            user_stats["total_technicians"] = row[1] or 0
+            user_stats["active_technicians_today"] = row[2] or 0
 
-                    if row:
-                        customer_stats["total_customers"] = row[0] or 0
-                        customer_stats["customers_with_repairs"] = row[1] or 0
+        return user_stats
 
+    async def get_customer_activity(self) -> Dict[str, Any]:
+        """Get simplified customer activity metrics (cached for the health check interval)."""
+        try:
+            return await self._totals_cache.get_or_set("customer_activity", self._query_customer_activity)
         except Exception as e:
             logger.error(f"Failed to get customer activity: {e}")
 
+        return self._empty_customer_stats()
+
+    async def _query_customer_activity(self) -> Dict[str, Any]:
+        """Query customer activity metrics."""
+        query = """
+        SELECT
+            (SELECT COUNT(*) FROM core_customer) as total_customers,
+            (
+                SELECT COUNT(*) FROM (
+                    SELECT DISTINCT customer_id
+                    FROM technician_portal_repair
+                    WHERE customer_id IS NOT NULL
+                )
+            ) as customers_with_repairs
+        """
+
+        customer_stats = self._empty_customer_stats()
+
+        row = await asyncio.to_thread(self._fetchone, query)
+        if row:
+            customer_stats["total_customers"] = row[0] or 0
+            customer_stats["customers_with_repairs"] = row[1] or 0
+
         return customer_stats
 
     async def get_technician_performance(self) -> List[Dict[str, Any]]:
-        """Get simplified technician performance metrics."""
+        """Get simplified technician performance metrics from the summary."""
+        try:
+            return await self._summary_cache.get_or_set("technician_performance", self._refresh_technician_summary)
+        except Exception as e:
+            logger.error(f"Failed to get technician performance: {e}")
+
+        return []
+
+    async def _refresh_technician_summary(self) -> List[Dict[str, Any]]:
+        """Recompute the technician performance summary."""
         query = """
         SELECT
-            t.id,
+            t.id as technician_id,
             u.username,
             COUNT(r.id) as total_repairs,
-            COUNT(CASE WHEN r.queue_status = 'COMPLETED' THEN 1 END) as completed_repairs,
-            MAX(r.repair_date) as last_repair_date
+            SUM(CASE WHEN r.queue_status = 'COMPLETED' THEN 1 ELSE 0 END) as completed_repairs,
+            MAX(r.repair_date) as last_repair_date,
+            CAST(COALESCE(ROUND(
+                100.0 * SUM(CASE WHEN r.queue_status = 'COMPLETED' THEN 1 ELSE 0 END) / NULLIF(COUNT(r.id), 0), 2
+            ), 0.0) AS DOUBLE PRECISION) as completion_rate
         FROM technician_portal_technician t
         JOIN auth_user u ON t.user_id = u.id
         LEFT JOIN technician_portal_repair r ON r.technician_id = t.id
@@ -114,26 +167,10 @@ class ActivityMonitor:
         LIMIT 20
         """
 
-        technicians = []
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        technicians.append({
-                            "technician_id": row[0],
-                            "username": row[1],
-                            "total_repairs": row[2] or 0,
-                            "completed_repairs": row[3] or 0,
-                            "last_repair_date": row[4],
-                            "completion_rate": round((row[3] or 0) / max(row[2] or 1, 1) * 100, 2)
-                        })
-
-        except Exception as e:
-            logger.error(f"Failed to get technician performance: {e}")
+        # Rows are keyed by the column aliases above
+        technicians = await asyncio.to_thread(self._fetchall, query)
 
+        self.technician_summary_refreshed_at = datetime.now()
         return technicians
 
     async def check_health(self) -> HealthCheckResult:
@@ -142,6 +179,8 @@ class ActivityMonitor:
             user_activity = await self.get_active_users()
 
             if user_activity.get("active_technicians_today", 0) == 0:
+                # Don't keep serving a degraded reading from cache
+                self._totals_cache.invalidate("active_users")
                 return HealthCheckResult(
                     component="activity",
                     status="degraded",
@@ -168,6 +207,7 @@ class ActivityMonitor:
 
     async def monitor(self) -> Dict[str, Any]:
         """Perform comprehensive activity monitoring."""
+        timestamp = datetime.now().isoformat()
         results = {}
 
         # Run monitoring tasks
@@ -185,8 +225,12 @@ class ActivityMonitor:
                 "user_activity": user_activity,
                 "customer_activity": customer_activity,
                 "technician_performance": technician_performance,
-                "health": health.dict() if health else None,
-                "timestamp": datetime.now().isoformat()
+                "technician_performance_refreshed_at": (
+                    self.technician_summary_refreshed_at.isoformat()
+                    if self.technician_summary_refreshed_at else None
+                ),
+                "health": health.model_dump() if health else None,
+                "timestamp": timestamp
             }
 
             # Check for issues
@@ -204,7 +248,7 @@ class ActivityMonitor:
             logger.error(f"Activity monitoring failed: {e}")
             results = {
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         return results
\ No newline at end of file
@@ -7,19 +7,76 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 from collections import deque, defaultdict
+from dataclasses import asdict, dataclass
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Liveness-only endpoints use HEAD since their bodies are never read
+_HEALTH_ENDPOINT = {"path": "/health/", "method": "HEAD", "name": "Health Check", "portal": "all"}
+
+
+@dataclass(slots=True)
+class EndpointResult:
+    """Outcome of probing one endpoint; converted to a dict only for output."""
+
+    endpoint: str
+    name: str
+    portal: str
+    method: str
+    timestamp: str
+    status_code: Optional[int] = None
+    response_time_ms: Optional[float] = None
+    success: bool = False
+    error: Optional[str] = None
+
+
+class _ResponseTimeWindow:
+    """Bounded window of response times that keeps a running sum.
+
+    The samples live in a private deque so only ``append`` and ``extend``
+    can change them, keeping ``total`` in step with its contents.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._samples = deque(maxlen=maxlen)
+        self._total = 0.0
+
+    @property
+    def maxlen(self) -> int:
+        return self._samples.maxlen
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(self, value: float):
+        if len(self._samples) == self._samples.maxlen:
+            self._total -= self._samples[0]
+        self._samples.append(value)
+        self._total += value
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def average(self) -> float:
+        return self._total / len(self._samples) if self._samples else 0
+
 
 class APIMonitor:
     """Monitor API endpoint performance and health."""
 
     def __init__(self):
+        settings = get_settings()
         self.thresholds = settings.thresholds
-        self.base_url = "http://localhost:8000"  # Default, can be overridden
+        self.max_concurrent_requests = settings.monitoring.api_max_concurrent_requests
 
         # Define RS Systems API endpoints to monitor
         self.endpoints = [
@@ -49,81 +106,119 @@ class APIMonitor:
             },
             {
                 "path": "/api/swagger/",
-                "method": "GET",
+                "method": "HEAD",
                 "name": "API Documentation",
                 "portal": "all"
             }
         ]
 
+        self.base_url = "http://localhost:8000"  # Default, can be overridden
+
         # Metrics storage (in-memory for now)
-        self.response_times = defaultdict(lambda: deque(maxlen=1000))
+        self.response_times = defaultdict(_ResponseTimeWindow)
         self.error_counts = defaultdict(int)
         self.request_counts = defaultdict(int)
         self.last_check = {}
-
-    async def check_endpoint(self, endpoint: Dict[str, str]) -> Dict[str, Any]:
-        """Check a single API endpoint."""
-        url = f"{self.base_url}{endpoint['path']}"
-        start_time = time.time()
-
-        result = {
-            "endpoint": endpoint["path"],
-            "name": endpoint["name"],
-            "portal": endpoint["portal"],
-            "method": endpoint["method"],
-            "timestamp": datetime.now().isoformat()
+        self._health_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
+
+        # Shared across checks so connections are kept alive between probes
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str):
+        # Endpoint URLs are built once here rather than on every probe
+        self._base_url = value
+        self._endpoint_urls = {
+            endpoint["path"]: f"{value}{endpoint['path']}"
+            for endpoint in (*self.endpoints, _HEALTH_ENDPOINT)
         }
 
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        # A session is bound to the loop that created it, so a monitor reused
+        # under a new event loop (one asyncio.run per call) gets a fresh one
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def check_endpoint(self, endpoint: Dict[str, str], timestamp: Optional[str] = None) -> EndpointResult:
+        """Check a single API endpoint.
+
+        ``timestamp`` lets a monitoring pass stamp all of its results alike;
+        standalone calls take the current time.
+        """
+        url = self._endpoint_urls.get(endpoint["path"]) or f"{self.base_url}{endpoint['path']}"
+        start_ns = time.perf_counter_ns()
+
+        result = EndpointResult(
+            endpoint=endpoint["path"],
+            name=endpoint["name"],
+            portal=endpoint["portal"],
+            method=endpoint["method"],
+            timestamp=timestamp or datetime.now().isoformat()
+        )
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=endpoint["method"],
-                    url=url,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = (time.time() - start_time) * 1000
-
-                    result.update({
-                        "status_code": response.status,
-                        "response_time_ms": round(response_time, 2),
-                        "success": 200 <= response.status < 400,
-                        "error": None
-                    })
-
-                    # Store metrics
-                    self.response_times[endpoint["path"]].append(response_time)
-                    self.request_counts[endpoint["path"]] += 1
-
-                    if response.status >= 400:
-                        self.error_counts[endpoint["path"]] += 1
-                        result["error"] = f"HTTP {response.status}"
+            session = await self._ensure_session()
+            async with session.request(
+                method=endpoint["method"],
+                url=url,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                response_time = (time.perf_counter_ns() - start_ns) / 1e6
+
+                result.status_code = response.status
+                result.response_time_ms = round(response_time, 2)
+                result.success = 200 <= response.status < 400
+
+                # Store metrics
+                self.response_times[endpoint["path"]].append(response_time)
+                self.request_counts[endpoint["path"]] += 1
+
+                if response.status >= 400:
+                    self.error_counts[endpoint["path"]] += 1
+                    result.error = f"HTTP {response.status}"
 
         except asyncio.TimeoutError:
-            result.update({
-                "status_code": None,
-                "response_time_ms": None,
-                "success": False,
-                "error": "Timeout"
-            })
+            result.error = "Timeout"
             self.error_counts[endpoint["path"]] += 1
 
-        except Exception as e:
-            result.update({
-                "status_code": None,
-                "response_time_ms": None,
-                "success": False,
-                "error": str(e)
-            })
+        except aiohttp.ClientError as e:
+            result.error = str(e)
             self.error_counts[endpoint["path"]] += 1
 
         self.last_check[endpoint["path"]] = datetime.now()
         return result
 
-    async def check_all_endpoints(self) -> List[Dict[str, Any]]:
+    async def check_all_endpoints(self, timestamp: Optional[str] = None) -> List[EndpointResult]:
         """Check all configured endpoints concurrently."""
-        tasks = [self.check_endpoint(endpoint) for endpoint in self.endpoints]
-        results = await asyncio.gather(*tasks)
-        return results
+        timestamp = timestamp or datetime.now().isoformat()
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def check_bounded(endpoint: Dict[str, str]) -> EndpointResult:
+            async with semaphore:
+                return await self.check_endpoint(endpoint, timestamp)
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(check_bounded(endpoint)) for endpoint in self.endpoints]
+
+        return [task.result() for task in tasks]
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate aggregate API metrics."""
@@ -137,66 +232,76 @@ class APIMonitor:
             }
         }
 
-        total_response_times = []
+        # One pass over the endpoints accumulates the per-endpoint and summary
+        # figures together; each window maintains its own sum
+        total_response_time = 0.0
+        total_samples = 0
+        total_requests = 0
+        total_errors = 0
 
-        for path in self.response_times:
-            times = list(self.response_times[path])
-            if times:
-                avg_time = sum(times) / len(times)
-                total_response_times.extend(times)
-            else:
-                avg_time = 0
+        for path, times in self.response_times.items():
+            avg_time = times.average()
+            total_response_time += times.total
+            total_samples += len(times)
 
-            requests = self.request_counts[path]
-            errors = self.error_counts[path]
+            requests = self.request_counts.get(path, 0)
+            errors = self.error_counts.get(path, 0)
             error_rate = (errors / requests * 100) if requests > 0 else 0
+            last_check = self.last_check.get(path)
 
             metrics["endpoints"][path] = {
                 "request_count": requests,
                 "error_count": errors,
                 "error_rate_pct": round(error_rate, 2),
                 "average_response_time_ms": round(avg_time, 2),
-                "last_check": self.last_check.get(path, "").isoformat() if self.last_check.get(path) else None
+                "last_check": last_check.isoformat() if last_check else None
             }
 
-            metrics["summary"]["total_requests"] += requests
-            metrics["summary"]["total_errors"] += errors
+            total_requests += requests
+            total_errors += errors
 
         # Calculate summary metrics
-        if total_response_times:
-            metrics["summary"]["average_response_time_ms"] = round(
-                sum(total_response_times) / len(total_response_times), 2
-            )
+        summary = metrics["summary"]
+        summary["total_requests"] = total_requests
+        summary["total_errors"] = total_errors
 
-        if metrics["summary"]["total_requests"] > 0:
-            metrics["summary"]["error_rate_pct"] = round(
-                metrics["summary"]["total_errors"] / metrics["summary"]["total_requests"] * 100, 2
-            )
+        if total_samples:
+            summary["average_response_time_ms"] = round(total_response_time / total_samples, 2)
+
+        if total_requests > 0:
+            summary["error_rate_pct"] = round(total_errors / total_requests * 100, 2)
 
         return metrics
 
-    async def check_health(self) -> HealthCheckResult:
+    async def check_health(self, force_refresh: bool = False) -> HealthCheckResult:
+        """Perform API health check (cached for the health check interval)."""
+        result = await self._health_cache.get_or_set("check_health", self._check_health, force_refresh)
+        if result.status != "healthy":
+            # Re-check on the next call instead of reporting a blip for the whole interval
+            self._health_cache.invalidate("check_health")
+        return result
+
+    async def _check_health(self) -> HealthCheckResult:
         """Perform API health check."""
         # Check a simple health endpoint
-        health_endpoint = {"path": "/health/", "method": "GET", "name": "Health Check", "portal": "all"}
-        result = await self.check_endpoint(health_endpoint)
+        result = await self.check_endpoint(_HEALTH_ENDPOINT)
 
-        if result["success"]:
+        if result.success:
             status = "healthy"
             message = "API is responding normally"
-        elif result["error"] == "Timeout":
+        elif result.error == "Timeout":
             status = "degraded"
             message = "API is responding slowly"
         else:
             status = "unhealthy"
-            message = f"API health check failed: {result.get('error', 'Unknown error')}"
+            message = f"API health check failed: {result.error or 'Unknown error'}"
 
         return HealthCheckResult(
             component="api",
             status=status,
             message=message,
-            response_time_ms=result.get("response_time_ms"),
-            details=result
+            response_time_ms=result.response_time_ms,
+            details=asdict(result)
         )
 
     def check_thresholds(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -239,9 +344,12 @@ class APIMonitor:
 
     async def monitor(self) -> Dict[str, Any]:
         """Perform comprehensive API monitoring."""
+        timestamp = datetime.now().isoformat()
         try:
-            # Check all endpoints
-            endpoint_results = await self.check_all_endpoints()
+            # Probe the endpoints and the health endpoint together
+            endpoint_results, health = await asyncio.gather(
+                self.check_all_endpoints(timestamp), self.check_health()
+            )
 
             # Calculate metrics
             metrics = self.calculate_metrics()
@@ -249,23 +357,20 @@ class APIMonitor:
             # Check thresholds
             issues = self.check_thresholds(metrics)
 
-            # Get health status
-            health = await self.check_health()
-
             return {
-                "health": health.dict(),
-                "endpoint_results": endpoint_results,
+                "health": health.model_dump(),
+                "endpoint_results": [asdict(result) for result in endpoint_results],
                 "metrics": metrics,
                 "issues": issues,
                 "has_issues": len(issues) > 0,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
             logger.error(f"API monitoring failed: {e}")
             return {
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     def reset_metrics(self):
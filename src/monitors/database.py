@@ -1,9 +1,12 @@
 """Database monitoring adapter that auto-detects database type."""
 
+import asyncio
 import logging
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult, SystemMetrics
 
 logger = logging.getLogger(__name__)
@@ -13,10 +16,17 @@ class DatabaseMonitor:
     """Unified database monitor that auto-detects database type."""
 
     def __init__(self):
+        settings = get_settings()
         self.config = settings.database
         self.thresholds = settings.thresholds
+        # Shared with QueueMonitor so one GROUP BY serves both monitors
+        self._repair_status_cache = AsyncTTLCache(settings.monitoring.interval_seconds)
+        self._health_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
+        # Concurrent callers of the fused snapshot share one query
+        self._snapshot_cache = AsyncTTLCache(settings.monitoring.interval_seconds)
         self.adapter = None
         self._initialize_adapter()
+        self._bind_adapter_methods()
 
     def _initialize_adapter(self):
         """Initialize appropriate database adapter based on URL."""
@@ -36,18 +46,42 @@ class DatabaseMonitor:
                 logger.info("Defaulting to SQLite monitor")
                 from .database_sqlite import SQLiteMonitor
                 self.adapter = SQLiteMonitor()
-        except Exception as e:
+        except ImportError as e:
+            # The adapters handle their own connection errors; only a missing
+            # driver falls back here, so genuine bugs still surface
             logger.error(f"Failed to initialize database adapter: {e}")
             # Try SQLite as fallback
             try:
                 from .database_sqlite import SQLiteMonitor
                 self.adapter = SQLiteMonitor()
                 logger.info("Initialized SQLite monitor as fallback")
-            except Exception as fallback_error:
+            except ImportError as fallback_error:
                 logger.error(f"Failed to initialize fallback SQLite monitor: {fallback_error}")
                 self.adapter = None
 
-    async def check_health(self) -> Optional[HealthCheckResult]:
+    def _bind_adapter_methods(self):
+        """Resolve the optional adapter methods once instead of probing per call."""
+        adapter = self.adapter
+        # SQLite adapter has get_table_sizes, PostgreSQL has get_table_stats
+        self._table_stats_fn = (
+            getattr(adapter, 'get_table_stats', None) or getattr(adapter, 'get_table_sizes', None)
+        )
+        self._repair_summary_fn = getattr(adapter, 'get_repair_status_summary', None)
+        self._performance_metrics_fn = getattr(adapter, 'get_performance_metrics', None)
+        self._evaluate_snapshot_fn = getattr(adapter, 'evaluate_snapshot', None)
+        self._snapshot_fn = getattr(adapter, 'get_full_snapshot', None)
+        self._get_connection_fn = getattr(adapter, 'get_connection', None)
+        self._close_fn = getattr(adapter, 'close', None)
+
+    async def check_health(self, force_refresh: bool = False) -> Optional[HealthCheckResult]:
+        """Perform database health check (cached for the health check interval)."""
+        result = await self._health_cache.get_or_set("check_health", self._check_health, force_refresh)
+        if result is None or result.status != "healthy":
+            # Re-check on the next call instead of reporting a blip for the whole interval
+            self._health_cache.invalidate("check_health")
+        return result
+
+    async def _check_health(self) -> Optional[HealthCheckResult]:
         """Perform database health check."""
         if not self.adapter:
             return HealthCheckResult(
@@ -92,13 +126,9 @@ class DatabaseMonitor:
         if not self.adapter:
             return []
         try:
-            # SQLite adapter has get_table_sizes, PostgreSQL has get_table_stats
-            if hasattr(self.adapter, 'get_table_stats'):
-                return await self.adapter.get_table_stats()
-            elif hasattr(self.adapter, 'get_table_sizes'):
-                return await self.adapter.get_table_sizes()
-            else:
-                return []
+            if self._table_stats_fn:
+                return await self._table_stats_fn()
+            return []
         except Exception as e:
             logger.error(f"Failed to get table stats: {e}")
             return []
@@ -113,49 +143,44 @@ class DatabaseMonitor:
             logger.error(f"Failed to check locks: {e}")
             return []
 
-    async def get_repair_status_distribution(self) -> Dict[str, int]:
-        """Get distribution of repairs by status."""
-        if not self.adapter:
-            return {}
+    async def get_full_snapshot(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get health, slow queries, connection, table and lock stats from one query.
+
+        Cached for one monitoring interval, so callers wanting several of
+        these sections pay for a single database round trip.
+        """
+        if not self._snapshot_fn:
+            return {"error": "No database adapter available"}
 
         try:
-            # For SQLite, we need to query the Django database directly
-            if hasattr(self.adapter, 'get_connection'):
-                with self.adapter.get_connection() as conn:
-                    cursor = conn.cursor()
-                    # Try to query the repair table
-                    try:
-                        cursor.execute("""
-                            SELECT queue_status, COUNT(*) as count
-                            FROM technician_portal_repair
-                            GROUP BY queue_status
-                        """)
-                        rows = cursor.fetchall()
-
-                        distribution = {}
-                        for row in rows:
-                            distribution[row[0]] = row[1]
-                        return distribution
-                    except Exception as table_error:
-                        logger.debug(f"Table technician_portal_repair might not exist: {table_error}")
-                        return {}
-
-            # Fallback for PostgreSQL adapter
-            if hasattr(self.adapter, 'get_repair_status_distribution'):
-                return await self.adapter.get_repair_status_distribution()
+            return await self._snapshot_cache.get_or_set("snapshot", self._snapshot_fn, force_refresh)
+        except Exception as e:
+            logger.error(f"Failed to get database snapshot: {e}")
+            return {"error": str(e)}
 
+    async def get_repair_status_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get repair counts and ages by status, cached for one monitoring interval."""
+        if not self._repair_summary_fn:
             return {}
+
+        try:
+            return await self._repair_status_cache.get_or_set("repair_status", self._repair_summary_fn)
         except Exception as e:
-            logger.error(f"Failed to get repair status distribution: {e}")
+            logger.error(f"Failed to get repair status summary: {e}")
             return {}
 
+    async def get_repair_status_distribution(self) -> Dict[str, int]:
+        """Get distribution of repairs by status."""
+        summary = await self.get_repair_status_summary()
+        return {status: data["count"] for status, data in summary.items()}
+
     async def get_performance_metrics(self) -> Optional[SystemMetrics]:
         """Get database performance metrics."""
         if not self.adapter:
             return None
         try:
-            if hasattr(self.adapter, 'get_performance_metrics'):
-                return await self.adapter.get_performance_metrics()
+            if self._performance_metrics_fn:
+                return await self._performance_metrics_fn()
             else:
                 # Basic metrics for adapters without this method
                 health = await self.check_health()
@@ -176,17 +201,23 @@ class DatabaseMonitor:
         if not self.adapter:
             return {"error": "No database adapter available"}
 
-        # If adapter has its own monitor method, use it
-        if hasattr(self.adapter, 'monitor'):
+        # Build on the cached snapshot so monitor() and get_full_snapshot()
+        # callers within one interval share a single query
+        if self._snapshot_fn and self._evaluate_snapshot_fn:
             try:
-                return await self.adapter.monitor()
+                snapshot, repair_dist = await asyncio.gather(
+                    self.get_full_snapshot(), self.get_repair_status_distribution()
+                )
+                if "error" in snapshot:
+                    results = self._skipped_results(snapshot["error"])
+                else:
+                    results = self._evaluate_snapshot_fn(snapshot)
+                results["repair_distribution"] = repair_dist
+                return results
             except Exception as e:
                 logger.error(f"Adapter monitor failed: {e}")
 
         # Otherwise, build monitoring result from individual methods
-        import asyncio
-        from datetime import datetime
-
         results = {}
 
         # Run monitoring tasks
@@ -208,7 +239,7 @@ class DatabaseMonitor:
                     results[key] = None
                 else:
                     if key == "health" and result:
-                        results[key] = result.dict()
+                        results[key] = result.model_dump()
                     else:
                         results[key] = result
 
@@ -231,14 +262,32 @@ class DatabaseMonitor:
 
         return results
 
+    @staticmethod
+    def _skipped_results(error: str) -> Dict[str, Any]:
+        """Report an unreachable database without running the individual probes."""
+        # Every probe shares the one snapshot query, so an outage skips them all
+        message = f"Database health check failed: {error}"
+        return {
+            "health": HealthCheckResult(
+                component="database",
+                status="unhealthy",
+                message=message,
+                response_time_ms=None
+            ).model_dump(),
+            "skipped": True,
+            "issues": [message],
+            "has_issues": True,
+            "timestamp": datetime.now().isoformat()
+        }
+
     def get_connection(self):
         """Get a database connection (pass-through to adapter)."""
-        if self.adapter and hasattr(self.adapter, 'get_connection'):
-            return self.adapter.get_connection()
+        if self._get_connection_fn:
+            return self._get_connection_fn()
         else:
             raise Exception("No database adapter available or adapter doesn't support connections")
 
     def close(self):
         """Close database connections."""
-        if self.adapter and hasattr(self.adapter, 'close'):
-            self.adapter.close()
\ No newline at end of file
+        if self._close_fn:
+            self._close_fn()
\ No newline at end of file
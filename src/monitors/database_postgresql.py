@@ -2,57 +2,271 @@
 
 import asyncio
 import psycopg2
+import psycopg2.extensions
 import psycopg2.pool
+from psycopg2.extras import RealDictCursor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
+import re
+import threading
+import time
 from contextlib import contextmanager
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult, SystemMetrics
 
 logger = logging.getLogger(__name__)
 
+_PREPARE_PLACEHOLDER = re.compile(r"\$\d+")
+
+# Key RS Systems tables whose pg_stat_user_tables counters are reported
+_MONITORED_TABLES = [
+    'technician_portal_repair',
+    'core_customer',
+    'auth_user',
+    'rewards_referrals_reward',
+    'technician_portal_technician'
+]
+
+# Pooled connections idle for longer than this are pinged on checkout, so a
+# connection dropped by a server restart is replaced instead of failing the
+# next query; ones reused within a single monitoring pass skip the round trip
+_STALE_CONNECTION_SECONDS = 5.0
+
+# Query fragments shared by the individual checks and the fused snapshot, so
+# a fix to one section applies to both
+_ACTIVITY_SQL = """
+    SELECT
+        pid,
+        datname,
+        usename,
+        client_addr,
+        state,
+        query,
+        query_start,
+        EXTRACT(EPOCH FROM (now() - query_start)) * 1000 as duration_ms
+    FROM pg_stat_activity
+"""
+
+# Expects the slow-query threshold in milliseconds as $1
+_SLOW_QUERIES_SQL = """
+    SELECT
+        LEFT(query, 500) as query,
+        state,
+        query_start as start_time,
+        round(duration_ms::numeric, 2) as duration_ms,
+        usename as "user",
+        datname as database,
+        client_addr as client_address
+    FROM activity
+    WHERE state != 'idle'
+        AND pid != pg_backend_pid()
+        AND duration_ms > $1
+    ORDER BY duration_ms DESC
+    LIMIT 20
+"""
+
+# Connection counts over the activity CTE, with the slow queries as a JSON array
+_ACTIVITY_COLUMNS_SQL = """
+    count(*) FILTER (WHERE datname = current_database()) as total_connections,
+    count(*) FILTER (WHERE datname = current_database() AND state = 'active') as active_connections,
+    count(*) FILTER (WHERE datname = current_database() AND state = 'idle') as idle_connections,
+    count(*) FILTER (WHERE datname = current_database() AND state = 'idle in transaction') as idle_in_transaction,
+    max(duration_ms) FILTER (WHERE datname = current_database()) as longest_query_ms,
+    current_setting('max_connections')::int as max_connections,
+    (SELECT COALESCE(json_agg(slow ORDER BY duration_ms DESC), '[]') FROM slow) as slow_queries
+"""
+
+# Callers add the WHERE clause, since the table list is a different parameter in each query
+_TABLE_STATS_SQL = """
+    SELECT
+        schemaname as schema,
+        relname as "table",
+        n_tup_ins as inserts,
+        n_tup_upd as updates,
+        n_tup_del as deletes,
+        n_live_tup as live_tuples,
+        n_dead_tup as dead_tuples,
+        last_vacuum,
+        last_autovacuum
+    FROM pg_stat_user_tables
+"""
+
+_LOCKS_SQL = """
+    SELECT
+        blocked_activity.pid AS blocked_pid,
+        blocked_activity.usename AS blocked_user,
+        blocking_activity.pid AS blocking_pid,
+        blocking_activity.usename AS blocking_user,
+        LEFT(blocked_activity.query, 200) AS blocked_query,
+        LEFT(blocking_activity.query, 200) AS blocking_query,
+        EXTRACT(EPOCH FROM (now() - blocked_activity.query_start)) * 1000 as blocked_duration_ms
+    FROM pg_catalog.pg_stat_activity blocked_activity
+    CROSS JOIN LATERAL unnest(pg_catalog.pg_blocking_pids(blocked_activity.pid)) AS blocker(pid)
+    JOIN pg_catalog.pg_stat_activity blocking_activity ON blocking_activity.pid = blocker.pid
+"""
+
+_ACTIVITY_STATS_SQL = f"""
+WITH activity AS ({_ACTIVITY_SQL}),
+slow AS ({_SLOW_QUERIES_SQL})
+SELECT {_ACTIVITY_COLUMNS_SQL}
+FROM activity
+"""
+
+# The same catalog reads as the activity, table stats and lock queries, fused
+# so a remote server costs one network round trip; the row-valued sections
+# come back as JSON arrays
+_FULL_SNAPSHOT_SQL = f"""
+WITH activity AS ({_ACTIVITY_SQL}),
+slow AS ({_SLOW_QUERIES_SQL}),
+tables AS ({_TABLE_STATS_SQL} WHERE relname = ANY($2)),
+locks AS ({_LOCKS_SQL})
+SELECT {_ACTIVITY_COLUMNS_SQL},
+    (SELECT COALESCE(json_agg(tables ORDER BY "table"), '[]') FROM tables) as table_stats,
+    (SELECT COALESCE(json_agg(locks), '[]') FROM locks) as locks
+FROM activity
+"""
+
+
+def _with_bloat_ratio(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the dead-to-live tuple percentage to a table stats row."""
+    row["bloat_ratio"] = round(row["dead_tuples"] / max(row["live_tuples"], 1) * 100, 2)
+    return row
+
+
+def _format_lock(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a blocked/blocking lock row."""
+    row["blocked_query"] = row["blocked_query"] or None
+    row["blocking_query"] = row["blocking_query"] or None
+    row["blocked_duration_ms"] = round(row["blocked_duration_ms"] or 0, 2)
+    return row
+
+
+class _MonitorConnection(psycopg2.extensions.connection):
+    """Pooled connection that remembers which statements it has prepared."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+        self.created_at = time.monotonic()
+        self.idle_since = None
+
 
 class PostgreSQLMonitor:
     """Monitor PostgreSQL database performance and health."""
 
     def __init__(self):
+        settings = get_settings()
         self.config = settings.database
         self.thresholds = settings.thresholds
+        # pg_stat_user_tables counters drift on a minute scale, not per poll
+        self._table_stats_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
         self.connection_pool = None
+        # psycopg2's pool raises when exhausted instead of blocking, so
+        # callers wait on a semaphore sized to the pool
+        self._connection_slots = threading.BoundedSemaphore(self.config.connection_pool_size)
+        self._pool_stats_lock = threading.Lock()
+        self._connections_in_use = 0
+        self.pool_high_water_mark = 0
         self._initialize_pool()
 
     def _initialize_pool(self):
         """Initialize PostgreSQL connection pool."""
         try:
             self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                minconn=2,
+                minconn=1,
                 maxconn=self.config.connection_pool_size,
-                dsn=self.config.database_url
+                dsn=self.config.database_url,
+                connection_factory=_MonitorConnection,
+                # Let the kernel notice a dead server instead of a query
+                # hanging on the socket until it times out
+                keepalives=1,
+                keepalives_idle=self.config.keepalives_idle_seconds,
+                keepalives_interval=10,
+                keepalives_count=5
             )
             logger.info("PostgreSQL connection pool initialized")
-        except Exception as e:
+        except psycopg2.Error as e:
             logger.error(f"Failed to initialize PostgreSQL connection pool: {e}")
             self.connection_pool = None
 
     @contextmanager
     def get_connection(self):
-        """Get a database connection from the pool."""
+        """Get a database connection from the pool, waiting for a free slot."""
         if not self.connection_pool:
             raise Exception("Connection pool not initialized")
 
+        if not self._connection_slots.acquire(timeout=self.config.query_timeout_seconds):
+            raise psycopg2.pool.PoolError("Timed out waiting for a pooled connection")
+
         conn = None
         try:
-            conn = self.connection_pool.getconn()
+            with self._pool_stats_lock:
+                self._connections_in_use += 1
+                self.pool_high_water_mark = max(self.pool_high_water_mark, self._connections_in_use)
+            conn = self._checkout_live_connection()
             yield conn
         finally:
             if conn:
-                self.connection_pool.putconn(conn)
+                conn.idle_since = time.monotonic()
+                recycle = conn.idle_since - conn.created_at >= self.config.pool_recycle_seconds
+                self.connection_pool.putconn(conn, close=recycle)
+            with self._pool_stats_lock:
+                self._connections_in_use -= 1
+            self._connection_slots.release()
+
+    def _checkout_live_connection(self):
+        """Take a connection from the pool, discarding any the server has dropped."""
+        while True:
+            conn = self.connection_pool.getconn()
+            if (
+                not self.config.pool_pre_ping
+                or conn.idle_since is None
+                or time.monotonic() - conn.idle_since < _STALE_CONNECTION_SECONDS
+            ):
+                return conn
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                return conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                logger.warning("Discarding broken pooled PostgreSQL connection")
+                self.connection_pool.putconn(conn, close=True)
+
+    def _execute_prepared(self, cursor, name: str, query: str, params: Optional[tuple] = None):
+        """Execute a monitoring query through a per-connection prepared statement.
+
+        The polled queries never change, so each pooled connection parses and
+        plans them once and later polls only send EXECUTE. Placeholders in
+        ``query`` use PREPARE's ``$n`` syntax, each appearing once and in order.
+
+        Session-level prepared statements don't survive pgbouncer's
+        transaction pooling, so with DB_PREPARED_STATEMENTS=false the query
+        is sent as plain SQL instead.
+        """
+        if not self.config.prepared_statements:
+            cursor.execute(_PREPARE_PLACEHOLDER.sub("%s", query), params)
+            return
+
+        conn = cursor.connection
+        if name not in conn.prepared_statements:
+            cursor.execute(f"PREPARE {name} AS {query}")
+            conn.prepared_statements.add(name)
+
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cursor.execute(f"EXECUTE {name}({placeholders})", params)
+        else:
+            cursor.execute(f"EXECUTE {name}")
 
     async def check_health(self) -> HealthCheckResult:
         """Perform comprehensive database health check."""
-        start_time = datetime.now()
+        return await asyncio.to_thread(self._check_health_sync)
+
+    def _check_health_sync(self) -> HealthCheckResult:
+        start_ns = time.perf_counter_ns()
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
@@ -60,7 +274,7 @@ class PostgreSQLMonitor:
                     cursor.execute("SELECT 1")
                     cursor.fetchone()
 
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.perf_counter_ns() - start_ns) / 1e6
 
             return HealthCheckResult(
                 component="database",
@@ -84,250 +298,183 @@ class PostgreSQLMonitor:
 
     async def get_slow_queries(self, threshold_ms: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get slow queries from PostgreSQL."""
-        threshold = threshold_ms or self.thresholds.db_query_ms
-
-        query = """
-        SELECT
-            query,
-            state,
-            query_start,
-            EXTRACT(EPOCH FROM (now() - query_start)) * 1000 as duration_ms,
-            usename,
-            datname,
-            client_addr
-        FROM pg_stat_activity
-        WHERE state != 'idle'
-            AND query NOT LIKE 'SELECT query%'
-            AND EXTRACT(EPOCH FROM (now() - query_start)) * 1000 > %s
-        ORDER BY duration_ms DESC
-        LIMIT 20
-        """
-
-        slow_queries = []
-        try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query, (threshold,))
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        slow_queries.append({
-                            "query": row[0][:500],  # Truncate long queries
-                            "state": row[1],
-                            "start_time": row[2].isoformat() if row[2] else None,
-                            "duration_ms": round(row[3], 2),
-                            "user": row[4],
-                            "database": row[5],
-                            "client_address": row[6]
-                        })
-        except Exception as e:
-            logger.error(f"Failed to get slow queries: {e}")
-
+        slow_queries, _ = await self.get_activity_stats(threshold_ms)
         return slow_queries
 
     async def get_connection_stats(self) -> Dict[str, Any]:
         """Get database connection statistics."""
-        query = """
-        SELECT
-            count(*) as total_connections,
-            count(*) FILTER (WHERE state = 'active') as active_connections,
-            count(*) FILTER (WHERE state = 'idle') as idle_connections,
-            count(*) FILTER (WHERE state = 'idle in transaction') as idle_in_transaction,
-            max(EXTRACT(EPOCH FROM (now() - query_start)) * 1000) as longest_query_ms
-        FROM pg_stat_activity
-        WHERE datname = current_database()
-        """
+        _, connection_stats = await self.get_activity_stats()
+        return connection_stats
 
+    async def get_activity_stats(self, threshold_ms: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Get slow queries and connection statistics from one pg_stat_activity read."""
+        threshold = threshold_ms or self.thresholds.db_query_ms
+        return await asyncio.to_thread(self._get_activity_stats_sync, threshold)
+
+    def _get_activity_stats_sync(self, threshold: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        # Connection counts and the slow-query list come from the same
+        # pg_stat_activity snapshot, so one round trip returns both; the
+        # slow queries ride along as a JSON array
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    self._execute_prepared(cursor, "rs_monitor_activity", _ACTIVITY_STATS_SQL, (threshold,))
                     row = cursor.fetchone()
-
-                    total = row[0] or 0
-                    pool_usage_pct = (total / self.config.connection_pool_size * 100) if self.config.connection_pool_size > 0 else 0
-
-                    return {
-                        "total_connections": total,
-                        "active_connections": row[1] or 0,
-                        "idle_connections": row[2] or 0,
-                        "idle_in_transaction": row[3] or 0,
-                        "longest_query_ms": round(row[4] or 0, 2),
-                        "pool_size": self.config.connection_pool_size,
-                        "pool_usage_pct": round(pool_usage_pct, 2)
-                    }
+                    return row["slow_queries"], self._connection_stats_from_row(row)
         except Exception as e:
-            logger.error(f"Failed to get connection stats: {e}")
-            return {}
+            logger.error(f"Failed to get activity stats: {e}")
+            return [], {}
+
+    def _connection_stats_from_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape the pg_stat_activity connection counts returned by a monitoring query."""
+        total = row["total_connections"] or 0
+        max_connections = row["max_connections"]
+        # The local pool is deliberately small, so usage is
+        # measured against the server's connection limit
+        pool_usage_pct = (total / max_connections * 100) if max_connections else 0
+
+        return {
+            "total_connections": total,
+            "active_connections": row["active_connections"] or 0,
+            "idle_connections": row["idle_connections"] or 0,
+            "idle_in_transaction": row["idle_in_transaction"] or 0,
+            "longest_query_ms": round(row["longest_query_ms"] or 0, 2),
+            "max_connections": max_connections,
+            "pool_size": self.config.connection_pool_size,
+            "pool_in_use": self._connections_in_use,
+            "pool_high_water_mark": self.pool_high_water_mark,
+            "pool_usage_pct": round(pool_usage_pct, 2)
+        }
 
     async def get_table_stats(self) -> List[Dict[str, Any]]:
-        """Get statistics for key RS Systems tables."""
-        tables = [
-            'technician_portal_repair',
-            'core_customer',
-            'auth_user',
-            'rewards_referrals_reward',
-            'technician_portal_technician'
-        ]
-
-        stats = []
-        query = """
-        SELECT
-            schemaname,
-            tablename,
-            n_tup_ins as inserts,
-            n_tup_upd as updates,
-            n_tup_del as deletes,
-            n_live_tup as live_tuples,
-            n_dead_tup as dead_tuples,
-            last_vacuum,
-            last_autovacuum
-        FROM pg_stat_user_tables
-        WHERE tablename = %s
-        """
-
+        """Get statistics for key RS Systems tables (cached for the health check interval)."""
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    for table in tables:
-                        cursor.execute(query, (table,))
-                        row = cursor.fetchone()
-
-                        if row:
-                            stats.append({
-                                "schema": row[0],
-                                "table": row[1],
-                                "inserts": row[2],
-                                "updates": row[3],
-                                "deletes": row[4],
-                                "live_tuples": row[5],
-                                "dead_tuples": row[6],
-                                "last_vacuum": row[7].isoformat() if row[7] else None,
-                                "last_autovacuum": row[8].isoformat() if row[8] else None,
-                                "bloat_ratio": round(row[6] / max(row[5], 1) * 100, 2)
-                            })
+            return await self._table_stats_cache.get_or_set(
+                "table_stats", lambda: asyncio.to_thread(self._get_table_stats_sync)
+            )
         except Exception as e:
             logger.error(f"Failed to get table stats: {e}")
+            return []
+
+    def _get_table_stats_sync(self) -> List[Dict[str, Any]]:
+        stats = []
+        query = f"{_TABLE_STATS_SQL} WHERE relname = ANY($1) ORDER BY relname"
+
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute_prepared(cursor, "rs_monitor_table_stats", query, (_MONITORED_TABLES,))
+
+                for row in cursor.fetchall():
+                    for column in ("last_vacuum", "last_autovacuum"):
+                        row[column] = row[column].isoformat() if row[column] else None
+                    stats.append(_with_bloat_ratio(row))
 
         return stats
 
     async def check_locks(self) -> List[Dict[str, Any]]:
         """Check for database locks."""
-        query = """
-        SELECT
-            blocked_locks.pid AS blocked_pid,
-            blocked_activity.usename AS blocked_user,
-            blocking_locks.pid AS blocking_pid,
-            blocking_activity.usename AS blocking_user,
-            blocked_activity.query AS blocked_query,
-            blocking_activity.query AS blocking_query,
-            EXTRACT(EPOCH FROM (now() - blocked_activity.query_start)) * 1000 as blocked_duration_ms
-        FROM pg_catalog.pg_locks blocked_locks
-        JOIN pg_catalog.pg_stat_activity blocked_activity ON blocked_activity.pid = blocked_locks.pid
-        JOIN pg_catalog.pg_locks blocking_locks
-            ON blocking_locks.locktype = blocked_locks.locktype
-            AND blocking_locks.database IS NOT DISTINCT FROM blocked_locks.database
-            AND blocking_locks.relation IS NOT DISTINCT FROM blocked_locks.relation
-            AND blocking_locks.page IS NOT DISTINCT FROM blocked_locks.page
-            AND blocking_locks.tuple IS NOT DISTINCT FROM blocked_locks.tuple
-            AND blocking_locks.virtualxid IS NOT DISTINCT FROM blocked_locks.virtualxid
-            AND blocking_locks.transactionid IS NOT DISTINCT FROM blocked_locks.transactionid
-            AND blocking_locks.classid IS NOT DISTINCT FROM blocked_locks.classid
-            AND blocking_locks.objid IS NOT DISTINCT FROM blocked_locks.objid
-            AND blocking_locks.objsubid IS NOT DISTINCT FROM blocked_locks.objsubid
-            AND blocking_locks.pid != blocked_locks.pid
-        JOIN pg_catalog.pg_stat_activity blocking_activity ON blocking_activity.pid = blocking_locks.pid
-        WHERE NOT blocked_locks.granted
-        """
+        return await asyncio.to_thread(self._check_locks_sync)
 
+    def _check_locks_sync(self) -> List[Dict[str, Any]]:
         locks = []
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        locks.append({
-                            "blocked_pid": row[0],
-                            "blocked_user": row[1],
-                            "blocking_pid": row[2],
-                            "blocking_user": row[3],
-                            "blocked_query": row[4][:200] if row[4] else None,
-                            "blocking_query": row[5][:200] if row[5] else None,
-                            "blocked_duration_ms": round(row[6] or 0, 2)
-                        })
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    self._execute_prepared(cursor, "rs_monitor_locks", _LOCKS_SQL)
+
+                    locks = [_format_lock(row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Failed to check locks: {e}")
 
         return locks
 
-    async def get_repair_status_distribution(self) -> Dict[str, int]:
-        """Get distribution of repairs by status."""
+    async def get_repair_status_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get repair counts and ages grouped by status."""
+        return await asyncio.to_thread(self._get_repair_status_summary_sync)
+
+    def _get_repair_status_summary_sync(self) -> Dict[str, Dict[str, Any]]:
         query = """
-        SELECT queue_status, COUNT(*) as count
+        SELECT
+            queue_status,
+            COUNT(*) as count,
+            AVG(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as average_age_hours,
+            MAX(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as max_age_hours,
+            MIN(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as min_age_hours
         FROM technician_portal_repair
         GROUP BY queue_status
         """
 
-        distribution = {}
-        try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        distribution[row[0]] = row[1]
-        except Exception as e:
-            logger.error(f"Failed to get repair status distribution: {e}")
+        # Errors propagate so DatabaseMonitor's shared cache doesn't keep an
+        # empty summary for DatabaseMonitor and QueueMonitor alike
+        summary = {}
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute_prepared(cursor, "rs_monitor_repair_status", query)
 
-        return distribution
+                for row in cursor.fetchall():
+                    status = row.pop("queue_status")
+                    for column in ("average_age_hours", "max_age_hours", "min_age_hours"):
+                        row[column] = round(row[column] or 0, 2)
+                    summary[status] = row
 
-    async def monitor(self) -> Dict[str, Any]:
-        """Perform comprehensive database monitoring."""
-        results = {}
+        return summary
 
-        # Run all monitoring tasks concurrently
-        tasks = [
-            self.check_health(),
-            self.get_slow_queries(),
-            self.get_connection_stats(),
-            self.get_table_stats(),
-            self.check_locks(),
-            self.get_repair_status_distribution()
-        ]
+    async def get_full_snapshot(self) -> Dict[str, Any]:
+        """Get health, activity, table and lock stats in one round trip.
 
-        try:
-            health, slow_queries, conn_stats, table_stats, locks, repair_dist = await asyncio.gather(*tasks)
-
-            results = {
-                "health": health.dict() if health else None,
-                "slow_queries": slow_queries,
-                "connection_stats": conn_stats,
-                "table_stats": table_stats,
-                "locks": locks,
-                "repair_distribution": repair_dist,
-                "timestamp": datetime.now().isoformat()
-            }
-
-            # Check for issues
-            issues = []
-            if slow_queries:
-                issues.append(f"Found {len(slow_queries)} slow queries")
-
-            if conn_stats.get("pool_usage_pct", 0) > self.thresholds.db_connections_pct:
-                issues.append(f"High connection pool usage: {conn_stats.get('pool_usage_pct')}%")
-
-            if locks:
-                issues.append(f"Found {len(locks)} database locks")
-
-            results["issues"] = issues
-            results["has_issues"] = len(issues) > 0
-
-        except Exception as e:
-            logger.error(f"PostgreSQL monitoring failed: {e}")
-            results["error"] = str(e)
+        Raises if the database can't be reached, so callers can report the
+        outage instead of a snapshot full of empty sections.
+        """
+        return await asyncio.to_thread(self._get_full_snapshot_sync, self.thresholds.db_query_ms)
+
+    def _get_full_snapshot_sync(self, threshold: int) -> Dict[str, Any]:
+        start_ns = time.perf_counter_ns()
+        with self.get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                self._execute_prepared(cursor, "rs_monitor_snapshot", _FULL_SNAPSHOT_SQL, (threshold, _MONITORED_TABLES))
+                row = cursor.fetchone()
+        response_time = (time.perf_counter_ns() - start_ns) / 1e6
+
+        return {
+            "health": HealthCheckResult(
+                component="database",
+                status="healthy",
+                message="PostgreSQL database is responding normally",
+                response_time_ms=response_time,
+                details={
+                    "connection_pool_size": self.config.connection_pool_size,
+                    "response_time_ms": response_time,
+                    "database_type": "postgresql"
+                }
+            ).model_dump(),
+            "slow_queries": row["slow_queries"],
+            "connection_stats": self._connection_stats_from_row(row),
+            "table_stats": [_with_bloat_ratio(table) for table in row["table_stats"]],
+            "locks": [_format_lock(lock) for lock in row["locks"]]
+        }
+
+    def evaluate_snapshot(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the monitoring result and issues from an already fetched snapshot."""
+        # Copy so a cached snapshot isn't modified
+        results = dict(snapshot)
+        results["timestamp"] = datetime.now().isoformat()
+        slow_queries = results["slow_queries"]
+        conn_stats = results["connection_stats"]
+        locks = results["locks"]
+
+        # Check for issues
+        issues = []
+        if slow_queries:
+            issues.append(f"Found {len(slow_queries)} slow queries")
+
+        if conn_stats.get("pool_usage_pct", 0) > self.thresholds.db_connections_pct:
+            issues.append(f"High connection pool usage: {conn_stats.get('pool_usage_pct')}%")
+
+        if locks:
+            issues.append(f"Found {len(locks)} database locks")
+
+        results["issues"] = issues
+        results["has_issues"] = len(issues) > 0
 
         return results
 
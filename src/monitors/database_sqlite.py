@@ -7,21 +7,84 @@ from typing import Dict, List, Any, Optional
 import logging
 from contextlib import contextmanager
 import os
+import threading
+import time
 
-from ..config import settings
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult, SystemMetrics
 
 logger = logging.getLogger(__name__)
 
+# Applied once to the shared connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Indexes backing the repair-table filters and GROUP BYs used by the
+# monitors. customer_id is left out because Django already indexes FKs.
+_MONITORING_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS rs_monitor_repair_date ON technician_portal_repair (repair_date)",
+    "CREATE INDEX IF NOT EXISTS rs_monitor_repair_tech ON technician_portal_repair (technician_id, queue_status, repair_date)",
+    "CREATE INDEX IF NOT EXISTS rs_monitor_repair_status ON technician_portal_repair (queue_status)",
+)
+
+
+class _CursorWrapper:
+    """SQLite cursor usable directly or in a ``with`` block, like psycopg2's."""
+
+    def __init__(self, connection):
+        self._cursor = connection.cursor()
+
+    def __enter__(self):
+        return self._cursor
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._cursor.close()
+
+    def execute(self, *args, **kwargs):
+        return self._cursor.execute(*args, **kwargs)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+
+class _ConnectionWrapper:
+    """Expose the shared SQLite connection with a psycopg2-style cursor()."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def cursor(self):
+        return _CursorWrapper(self._conn)
+
+    def close(self):
+        # The shared connection is closed by SQLiteMonitor.close()
+        pass
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
 
 class SQLiteMonitor:
     """Monitor SQLite database performance and health."""
 
     def __init__(self):
+        settings = get_settings()
         self.config = settings.database
         self.thresholds = settings.thresholds
+        self.features = settings.features
         self.db_path = self._extract_db_path()
         self.connection = None
+        self._lock = threading.RLock()
         self._initialize_connection()
 
     def _extract_db_path(self) -> str:
@@ -34,115 +97,190 @@ class SQLiteMonitor:
         return url
 
     def _initialize_connection(self):
-        """Initialize SQLite connection."""
+        """Open the shared SQLite connection."""
         try:
             if not os.path.exists(self.db_path):
                 logger.error(f"SQLite database not found at: {self.db_path}")
                 return
 
-            # Test connection
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
+            # One connection for the monitor's lifetime keeps SQLite's page
+            # cache warm across checks; access is serialized by self._lock.
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn.execute("SELECT 1").fetchone()
+            self.connection = conn
+
+            if self.features.enable_index_creation:
+                self._create_indexes()
 
             logger.info(f"SQLite connection initialized for: {self.db_path}")
         except Exception as e:
             logger.error(f"Failed to initialize SQLite connection: {e}")
 
+    def _create_indexes(self):
+        """Create the indexes used by the monitoring queries if they are missing."""
+        try:
+            with self.connection:
+                for statement in _MONITORING_INDEXES:
+                    self.connection.execute(statement)
+            logger.info("SQLite monitoring indexes ensured")
+        except Exception as e:
+            logger.error(f"Failed to create SQLite monitoring indexes: {e}")
+
     @contextmanager
     def get_connection(self):
-        """Get a database connection compatible with PostgreSQL-style usage."""
-        conn = None
+        """Get the shared database connection, wrapped for PostgreSQL-style usage."""
+        if self.connection is None:
+            self._initialize_connection()
+            if self.connection is None:
+                raise Exception("SQLite connection not initialized")
+
+        with self._lock:
+            try:
+                yield _ConnectionWrapper(self.connection)
+            except Exception as e:
+                logger.error(f"SQLite connection error: {e}")
+                raise
+
+    def close(self):
+        """Close the shared SQLite connection."""
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+    def _query_health(self, cursor) -> HealthCheckResult:
+        """Run the health check queries on an open cursor."""
+        start_ns = time.perf_counter_ns()
+
+        # Simple health check query
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+
+        # Get database size
+        db_size = os.path.getsize(self.db_path) / (1024 * 1024)  # Size in MB
+
+        # Check if database is locked
+        cursor.execute("PRAGMA database_list")
+        db_info = cursor.fetchall()
+
+        response_time = (time.perf_counter_ns() - start_ns) / 1e6
+
+        return HealthCheckResult(
+            component="database",
+            status="healthy",
+            message="SQLite database is responding normally",
+            response_time_ms=response_time,
+            details={
+                "database_path": self.db_path,
+                "database_size_mb": round(db_size, 2),
+                "response_time_ms": response_time,
+                "database_info": [dict(row) for row in db_info] if db_info else []
+            }
+        )
+
+    def _query_connection_stats(self, cursor) -> Dict[str, Any]:
+        """Collect page and schema statistics on an open cursor."""
+        # Get basic database stats
+        cursor.execute("PRAGMA page_count")
+        page_count = cursor.fetchone()[0]
+
+        cursor.execute("PRAGMA page_size")
+        page_size = cursor.fetchone()[0]
+
+        cursor.execute("PRAGMA cache_size")
+        cache_size = cursor.fetchone()[0]
+
+        cursor.execute("PRAGMA journal_mode")
+        journal_mode = cursor.fetchone()[0]
+
+        cursor.execute("PRAGMA locking_mode")
+        locking_mode = cursor.fetchone()[0]
+
+        # Get table information
+        cursor.execute("""
+            SELECT name, type
+            FROM sqlite_master
+            WHERE type IN ('table', 'index')
+        """)
+        schema_objects = cursor.fetchall()
+
+        return {
+            "database_path": self.db_path,
+            "database_size_bytes": page_count * page_size,
+            "page_count": page_count,
+            "page_size": page_size,
+            "cache_size": cache_size,
+            "journal_mode": journal_mode,
+            "locking_mode": locking_mode,
+            "tables": [row[0] for row in schema_objects if row[1] == 'table'],
+            "indexes": [row[0] for row in schema_objects if row[1] == 'index']
+        }
+
+    def _query_table_sizes(self, cursor) -> List[Dict[str, Any]]:
+        """Count the rows of every user table on an open cursor."""
+        # Get all tables
+        cursor.execute("""
+            SELECT name
+            FROM sqlite_master
+            WHERE type = 'table'
+            AND name NOT LIKE 'sqlite_%'
+        """)
+        tables = cursor.fetchall()
+
+        table_stats = []
+        for table in tables:
+            table_name = table[0]
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            row_count = cursor.fetchone()[0]
+
+            table_stats.append({
+                "table_name": table_name,
+                "row_count": row_count
+            })
+
+        return sorted(table_stats, key=lambda x: x["row_count"], reverse=True)
+
+    def _query_repair_status_summary(self, cursor) -> Dict[str, Dict[str, Any]]:
+        """Count repairs and their ages by queue status on an open cursor."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-
-            # Create a wrapper that makes cursor compatible with 'with' statement
-            class CursorContextManager:
-                def __init__(self, connection):
-                    self.connection = connection
-                    self.cursor = None
-
-                def cursor(self):
-                    return self
-
-                def __enter__(self):
-                    self.cursor = self.connection.cursor()
-                    return self.cursor
-
-                def __exit__(self, exc_type, exc_val, exc_tb):
-                    if self.cursor:
-                        self.cursor.close()
-
-                def execute(self, *args, **kwargs):
-                    if self.cursor:
-                        return self.cursor.execute(*args, **kwargs)
-
-                def fetchall(self):
-                    if self.cursor:
-                        return self.cursor.fetchall()
-
-                def fetchone(self):
-                    if self.cursor:
-                        return self.cursor.fetchone()
-
-            # Wrap the connection
-            class ConnectionWrapper:
-                def __init__(self, conn):
-                    self._conn = conn
-
-                def cursor(self):
-                    return CursorContextManager(self._conn)
-
-                def close(self):
-                    self._conn.close()
-
-                def commit(self):
-                    self._conn.commit()
-
-                def rollback(self):
-                    self._conn.rollback()
-
-            yield ConnectionWrapper(conn)
-        except Exception as e:
-            logger.error(f"SQLite connection error: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
+            cursor.execute("""
+                SELECT
+                    queue_status,
+                    COUNT(*) as count,
+                    AVG((julianday('now') - julianday(repair_date)) * 24) as avg_age_hours,
+                    MAX((julianday('now') - julianday(repair_date)) * 24) as max_age_hours,
+                    MIN((julianday('now') - julianday(repair_date)) * 24) as min_age_hours
+                FROM technician_portal_repair
+                GROUP BY queue_status
+            """)
+            return {
+                row[0]: {
+                    "count": row[1],
+                    "average_age_hours": round(row[2] or 0, 2),
+                    "max_age_hours": round(row[3] or 0, 2),
+                    "min_age_hours": round(row[4] or 0, 2)
+                }
+                for row in cursor.fetchall()
+            }
+        except sqlite3.OperationalError as table_error:
+            # A database without the repair table has nothing to summarize;
+            # other errors (e.g. a locked database) propagate
+            if "no such table" not in str(table_error):
+                raise
+            logger.debug(f"Table technician_portal_repair might not exist: {table_error}")
+            return {}
 
     async def check_health(self) -> HealthCheckResult:
         """Perform SQLite database health check."""
-        start_time = datetime.now()
+        return await asyncio.to_thread(self._check_health_sync)
+
+    def _check_health_sync(self) -> HealthCheckResult:
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                # Simple health check query
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
-
-                # Get database size
-                db_size = os.path.getsize(self.db_path) / (1024 * 1024)  # Size in MB
-
-                # Check if database is locked
-                cursor.execute("PRAGMA database_list")
-                db_info = cursor.fetchall()
-
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
-
-            return HealthCheckResult(
-                component="database",
-                status="healthy",
-                message="SQLite database is responding normally",
-                response_time_ms=response_time,
-                details={
-                    "database_path": self.db_path,
-                    "database_size_mb": round(db_size, 2),
-                    "response_time_ms": response_time,
-                    "database_info": [dict(row) for row in db_info] if db_info else []
-                }
-            )
+                return self._query_health(conn.cursor())
         except Exception as e:
             logger.error(f"SQLite health check failed: {e}")
             return HealthCheckResult(
@@ -161,97 +299,87 @@ class SQLiteMonitor:
 
     async def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection statistics."""
+        return await asyncio.to_thread(self._connection_stats_sync)
+
+    def _connection_stats_sync(self) -> Dict[str, Any]:
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get basic database stats
-                cursor.execute("PRAGMA page_count")
-                page_count = cursor.fetchone()[0]
-
-                cursor.execute("PRAGMA page_size")
-                page_size = cursor.fetchone()[0]
-
-                cursor.execute("PRAGMA cache_size")
-                cache_size = cursor.fetchone()[0]
-
-                # Get table information
-                cursor.execute("""
-                    SELECT name, type
-                    FROM sqlite_master
-                    WHERE type IN ('table', 'index')
-                """)
-                schema_objects = cursor.fetchall()
-
-                return {
-                    "database_path": self.db_path,
-                    "database_size_bytes": page_count * page_size,
-                    "page_count": page_count,
-                    "page_size": page_size,
-                    "cache_size": cache_size,
-                    "tables": [row[0] for row in schema_objects if row[1] == 'table'],
-                    "indexes": [row[0] for row in schema_objects if row[1] == 'index']
-                }
+                return self._query_connection_stats(conn.cursor())
         except Exception as e:
             logger.error(f"Failed to get connection stats: {e}")
             return {"error": str(e)}
 
     async def get_table_sizes(self) -> List[Dict[str, Any]]:
         """Get sizes of all tables in the database."""
+        return await asyncio.to_thread(self._table_sizes_sync)
+
+    def _table_sizes_sync(self) -> List[Dict[str, Any]]:
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get all tables
-                cursor.execute("""
-                    SELECT name
-                    FROM sqlite_master
-                    WHERE type = 'table'
-                    AND name NOT LIKE 'sqlite_%'
-                """)
-                tables = cursor.fetchall()
-
-                table_stats = []
-                for table in tables:
-                    table_name = table[0]
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                    row_count = cursor.fetchone()[0]
-
-                    table_stats.append({
-                        "table_name": table_name,
-                        "row_count": row_count
-                    })
-
-                return sorted(table_stats, key=lambda x: x["row_count"], reverse=True)
+                return self._query_table_sizes(conn.cursor())
         except Exception as e:
             logger.error(f"Failed to get table sizes: {e}")
             return []
 
     async def check_locks(self) -> List[Dict[str, Any]]:
-        """Check for database locks."""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+        """Check for database locks - not directly available in SQLite."""
+        # SQLite has no view of other connections' locks (PRAGMA lock_status
+        # needs a debug build); journal and locking modes are reported with
+        # the connection stats instead
+        return []
 
-                # Check if database is in WAL mode
-                cursor.execute("PRAGMA journal_mode")
-                journal_mode = cursor.fetchone()[0]
+    async def get_repair_status_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get repair counts and ages grouped by status."""
+        return await asyncio.to_thread(self._repair_status_summary_sync)
 
-                # Check lock status
-                cursor.execute("PRAGMA locking_mode")
-                locking_mode = cursor.fetchone()[0]
+    def _repair_status_summary_sync(self) -> Dict[str, Dict[str, Any]]:
+        with self.get_connection() as conn:
+            return self._query_repair_status_summary(conn.cursor())
 
-                return [{
-                    "journal_mode": journal_mode,
-                    "locking_mode": locking_mode,
-                    "message": "SQLite lock monitoring is limited compared to PostgreSQL"
-                }]
-        except Exception as e:
-            logger.error(f"Failed to check locks: {e}")
-            return []
+    def _monitor_batch(self) -> Dict[str, Any]:
+        """Run every monitoring query in one read transaction (blocking)."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                return {
+                    "health": self._query_health(cursor).model_dump(),
+                    "slow_queries": [],
+                    "connection_stats": self._query_connection_stats(cursor),
+                    "table_stats": self._query_table_sizes(cursor),
+                    "locks": []
+                }
+            finally:
+                conn.commit()
+
+    async def get_full_snapshot(self) -> Dict[str, Any]:
+        """Get health, activity, table and lock stats in one read transaction."""
+        return await asyncio.to_thread(self._monitor_batch)
+
+    def evaluate_snapshot(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the monitoring result and issues from an already fetched snapshot."""
+        # Copy so a cached snapshot isn't modified
+        results = dict(snapshot)
+        results["timestamp"] = datetime.now().isoformat()
+
+        # Check for issues
+        issues = []
+        if results["slow_queries"]:
+            issues.append(f"Found {len(results['slow_queries'])} slow queries")
+
+        if results["locks"]:
+            issues.append(f"Found {len(results['locks'])} database locks")
+
+        results["issues"] = issues
+        results["has_issues"] = len(issues) > 0
+
+        return results
 
     async def get_performance_metrics(self) -> SystemMetrics:
         """Get database performance metrics."""
+        return await asyncio.to_thread(self._performance_metrics_sync)
+
+    def _performance_metrics_sync(self) -> SystemMetrics:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
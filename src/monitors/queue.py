@@ -6,75 +6,68 @@ from typing import Dict, List, Any, Optional
 import logging
 import psycopg2
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import RepairStatus, HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Statuses a repair can still be waiting in. Matching a positive list instead
+# of NOT IN the finished statuses lets the planner use an index on
+# queue_status, e.g. a partial index on repair_date covering these values.
+_OPEN_STATUSES = [
+    status.value for status in RepairStatus
+    if status not in (RepairStatus.COMPLETED, RepairStatus.DENIED)
+]
+_OPEN_STATUSES_SQL = ", ".join(f"'{status}'" for status in _OPEN_STATUSES)
+
 
 class QueueMonitor:
     """Monitor repair queue health and performance."""
 
     def __init__(self, db_monitor):
         self.db_monitor = db_monitor  # Reuse database connection from DatabaseMonitor
+        settings = get_settings()
+        self.config = settings.database
         self.thresholds = settings.thresholds
+        # Processing times and throughput cover days of history, so they are
+        # recomputed at most once per summary refresh interval
+        self._history_cache = AsyncTTLCache(settings.monitoring.summary_refresh_seconds)
+        # Per-repair and per-technician scans are reused for one monitoring
+        # interval, like the status summary shared with DatabaseMonitor
+        self._snapshot_cache = AsyncTTLCache(settings.monitoring.interval_seconds)
+        self._health_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
+
+    def refresh(self):
+        """Drop cached queue aggregates and health so the next call re-queries."""
+        self._snapshot_cache.invalidate()
+        self._history_cache.invalidate()
+        self._health_cache.invalidate()
 
     async def get_queue_status(self) -> Dict[str, Any]:
         """Get current repair queue status."""
-        # Check database type
-        is_sqlite = 'sqlite' in settings.database.database_url.lower()
+        # DatabaseMonitor already groups the repair table by status for its
+        # distribution; reuse that scan and drop the finished repairs
+        summary = await self.db_monitor.get_repair_status_summary()
+        return {
+            status: status_data
+            for status, status_data in summary.items()
+            if status is not None and status != 'COMPLETED'
+        }
 
-        if is_sqlite:
-            # SQLite-compatible query
-            query = """
-            SELECT
-                queue_status,
-                COUNT(*) as count,
-                AVG((julianday('now') - julianday(repair_date)) * 24) as avg_age_hours,
-                MAX((julianday('now') - julianday(repair_date)) * 24) as max_age_hours,
-                MIN((julianday('now') - julianday(repair_date)) * 24) as min_age_hours
-            FROM technician_portal_repair
-            WHERE queue_status != 'COMPLETED'
-            GROUP BY queue_status
-            """
-        else:
-            # PostgreSQL query
-            query = """
-            SELECT
-                queue_status,
-                COUNT(*) as count,
-                AVG(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as avg_age_hours,
-                MAX(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as max_age_hours,
-                MIN(EXTRACT(EPOCH FROM (now() - created_at)) / 3600) as min_age_hours
-            FROM technician_portal_repair
-            WHERE queue_status != 'COMPLETED'
-            GROUP BY queue_status
-            """
-
-        queue_status = {}
+    async def get_stuck_repairs(self) -> List[Dict[str, Any]]:
+        """Identify repairs that have been stuck in the same status for too long."""
         try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        status = row[0]
-                        queue_status[status] = {
-                            "count": row[1],
-                            "average_age_hours": round(row[2] or 0, 2),
-                            "max_age_hours": round(row[3] or 0, 2),
-                            "min_age_hours": round(row[4] or 0, 2)
-                        }
+            return await self._snapshot_cache.get_or_set(
+                "stuck_repairs", lambda: asyncio.to_thread(self._get_stuck_repairs_sync)
+            )
         except Exception as e:
-            logger.error(f"Failed to get queue status: {e}")
-
-        return queue_status
+            logger.error(f"Failed to get stuck repairs: {e}")
+            return []
 
-    async def get_stuck_repairs(self) -> List[Dict[str, Any]]:
-        """Identify repairs that have been stuck in the same status for too long."""
+    def _get_stuck_repairs_sync(self) -> List[Dict[str, Any]]:
         threshold_hours = self.thresholds.queue_stuck_hours
-        is_sqlite = 'sqlite' in settings.database.database_url.lower()
+        is_sqlite = 'sqlite' in self.config.database_url.lower()
 
         if is_sqlite:
             # SQLite-compatible query
@@ -93,7 +86,7 @@ class QueueMonitor:
             LEFT JOIN core_customer c ON r.customer_id = c.id
             LEFT JOIN technician_portal_technician t ON r.technician_id = t.id
             LEFT JOIN auth_user u ON t.user_id = u.id
-            WHERE r.queue_status NOT IN ('COMPLETED', 'DENIED')
+            WHERE r.queue_status IN ({_OPEN_STATUSES_SQL})
                 AND r.repair_date < datetime('now', '-{threshold_hours} hours')
             ORDER BY r.updated_at ASC
             LIMIT 50
@@ -117,42 +110,51 @@ class QueueMonitor:
             LEFT JOIN core_customer c ON r.customer_id = c.id
             LEFT JOIN technician_portal_technician t ON r.technician_id = t.id
             LEFT JOIN auth_user u ON t.user_id = u.id
-            WHERE r.queue_status NOT IN ('COMPLETED', 'DENIED')
-                AND r.repair_date < now() - interval '%s hours'
+            WHERE r.queue_status = ANY(%s)
+                AND r.repair_date < now() - make_interval(hours => %s)
             ORDER BY r.repair_date ASC
             LIMIT 50
             """
-            query_params = (threshold_hours,)
+            query_params = (_OPEN_STATUSES, threshold_hours)
 
-        stuck_repairs = []
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    if query_params:
-                        cursor.execute(query, query_params)
-                    else:
-                        cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        stuck_repairs.append({
-                            "repair_id": row[0],
-                            "unit_number": row[1],
-                            "status": row[2],
-                            "created_at": row[3].isoformat() if row[3] else None,
-                            "updated_at": row[4].isoformat() if row[4] else None,
-                            "customer_name": row[5],
-                            "technician_id": row[6],
-                            "technician_name": row[7],
-                            "stuck_hours": round(row[8] or 0, 2)
-                        })
-        except Exception as e:
-            logger.error(f"Failed to get stuck repairs: {e}")
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor() as cursor:
+                if query_params:
+                    cursor.execute(query, query_params)
+                else:
+                    cursor.execute(query)
+
+                stuck_repairs = [
+                    {
+                        "repair_id": repair_id,
+                        "unit_number": unit_number,
+                        "status": status,
+                        "created_at": created_at.isoformat() if created_at else None,
+                        "updated_at": updated_at.isoformat() if updated_at else None,
+                        "customer_name": customer_name,
+                        "technician_id": technician_id,
+                        "technician_name": technician_name,
+                        "stuck_hours": round(stuck_hours or 0, 2)
+                    }
+                    for (
+                        repair_id, unit_number, status, created_at, updated_at,
+                        customer_name, technician_id, technician_name, stuck_hours
+                    ) in cursor.fetchall()
+                ]
 
         return stuck_repairs
 
     async def get_processing_times(self) -> Dict[str, Any]:
         """Calculate average processing times between status transitions."""
+        try:
+            return await self._history_cache.get_or_set(
+                "processing_times", lambda: asyncio.to_thread(self._get_processing_times_sync)
+            )
+        except Exception as e:
+            logger.error(f"Failed to get processing times: {e}")
+            return {}
+
+    def _get_processing_times_sync(self) -> Dict[str, Any]:
         query = """
         WITH status_transitions AS (
             SELECT
@@ -178,73 +180,88 @@ class QueueMonitor:
         """
 
         processing_times = {}
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
-
-                    if row:
-                        processing_times = {
-                            "average_completion_hours": round(row[0] or 0, 2),
-                            "min_completion_hours": round(row[1] or 0, 2),
-                            "max_completion_hours": round(row[2] or 0, 2),
-                            "median_completion_hours": round(row[3] or 0, 2),
-                            "p95_completion_hours": round(row[4] or 0, 2)
-                        }
-        except Exception as e:
-            logger.error(f"Failed to get processing times: {e}")
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                row = cursor.fetchone()
+
+                if row:
+                    processing_times = {
+                        "average_completion_hours": round(row[0] or 0, 2),
+                        "min_completion_hours": round(row[1] or 0, 2),
+                        "max_completion_hours": round(row[2] or 0, 2),
+                        "median_completion_hours": round(row[3] or 0, 2),
+                        "p95_completion_hours": round(row[4] or 0, 2)
+                    }
 
         return processing_times
 
     async def get_technician_queue_load(self) -> List[Dict[str, Any]]:
         """Get queue load per technician."""
+        try:
+            return await self._snapshot_cache.get_or_set(
+                "technician_load", lambda: asyncio.to_thread(self._get_technician_queue_load_sync)
+            )
+        except Exception as e:
+            logger.error(f"Failed to get technician queue load: {e}")
+            return []
+
+    def _get_technician_queue_load_sync(self) -> List[Dict[str, Any]]:
         query = """
         SELECT
             t.id as technician_id,
             u.username as technician_name,
             COUNT(r.id) as total_repairs,
-            SUM(CASE WHEN r.queue_status = 'IN_PROGRESS' THEN 1 ELSE 0 END) as in_progress,
-            SUM(CASE WHEN r.queue_status = 'PENDING' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN r.queue_status = 'APPROVED' THEN 1 ELSE 0 END) as approved,
-            AVG(CASE
-                WHEN r.queue_status = 'IN_PROGRESS' THEN
-                    EXTRACT(EPOCH FROM (now() - r.updated_at)) / 3600
-                ELSE NULL
-            END) as avg_in_progress_hours
+            COUNT(*) FILTER (WHERE r.queue_status = 'IN_PROGRESS') as in_progress,
+            COUNT(*) FILTER (WHERE r.queue_status = 'PENDING') as pending,
+            COUNT(*) FILTER (WHERE r.queue_status = 'APPROVED') as approved,
+            AVG(EXTRACT(EPOCH FROM (now() - r.updated_at)) / 3600)
+                FILTER (WHERE r.queue_status = 'IN_PROGRESS') as avg_in_progress_hours
         FROM technician_portal_technician t
         JOIN auth_user u ON t.user_id = u.id
         LEFT JOIN technician_portal_repair r ON t.id = r.technician_id
-            AND r.queue_status NOT IN ('COMPLETED', 'DENIED')
+            AND r.queue_status = ANY(%s)
         GROUP BY t.id, u.username
         HAVING COUNT(r.id) > 0
         ORDER BY total_repairs DESC
         """
 
-        technician_load = []
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
-
-                    for row in rows:
-                        technician_load.append({
-                            "technician_id": row[0],
-                            "technician_name": row[1],
-                            "total_active_repairs": row[2],
-                            "in_progress": row[3],
-                            "pending": row[4],
-                            "approved": row[5],
-                            "avg_in_progress_hours": round(row[6] or 0, 2) if row[6] else None
-                        })
-        except Exception as e:
-            logger.error(f"Failed to get technician queue load: {e}")
+        with self.db_monitor.get_connection() as conn:
+            # One row per technician with open work; a server-side cursor
+            # streams them instead of materializing the whole result
+            with conn.cursor(name="technician_queue_load") as cursor:
+                cursor.itersize = 200
+                cursor.execute(query, (_OPEN_STATUSES,))
+
+                technician_load = [
+                    {
+                        "technician_id": technician_id,
+                        "technician_name": technician_name,
+                        "total_active_repairs": total_repairs,
+                        "in_progress": in_progress,
+                        "pending": pending,
+                        "approved": approved,
+                        "avg_in_progress_hours": round(avg_in_progress_hours, 2) if avg_in_progress_hours else None
+                    }
+                    for (
+                        technician_id, technician_name, total_repairs,
+                        in_progress, pending, approved, avg_in_progress_hours
+                    ) in cursor
+                ]
 
         return technician_load
 
     async def get_queue_throughput(self) -> Dict[str, Any]:
         """Calculate queue throughput metrics."""
+        try:
+            return await self._history_cache.get_or_set(
+                "throughput", lambda: asyncio.to_thread(self._get_queue_throughput_sync)
+            )
+        except Exception as e:
+            logger.error(f"Failed to get queue throughput: {e}")
+            return {}
+
+    def _get_queue_throughput_sync(self) -> Dict[str, Any]:
         query = """
         WITH daily_stats AS (
             SELECT
@@ -264,58 +281,40 @@ class QueueMonitor:
         """
 
         throughput = {}
-        try:
-            with self.db_monitor.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(query)
-                    row = cursor.fetchone()
-
-                    if row:
-                        throughput = {
-                            "avg_daily_requests": round(row[0] or 0, 2),
-                            "avg_daily_completions": round(row[1] or 0, 2),
-                            "total_requests_7d": row[2] or 0,
-                            "total_completions_7d": row[3] or 0,
-                            "completion_rate_pct": round(
-                                (row[3] / row[2] * 100) if row[2] and row[2] > 0 else 0, 2
-                            )
-                        }
-        except Exception as e:
-            logger.error(f"Failed to get queue throughput: {e}")
+        with self.db_monitor.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                row = cursor.fetchone()
+
+                if row:
+                    throughput = {
+                        "avg_daily_requests": round(row[0] or 0, 2),
+                        "avg_daily_completions": round(row[1] or 0, 2),
+                        "total_requests_7d": row[2] or 0,
+                        "total_completions_7d": row[3] or 0,
+                        "completion_rate_pct": round(
+                            (row[3] / row[2] * 100) if row[2] and row[2] > 0 else 0, 2
+                        )
+                    }
 
         return throughput
 
-    async def check_health(self) -> HealthCheckResult:
+    async def check_health(self, force_refresh: bool = False) -> HealthCheckResult:
+        """Check overall queue health (cached for the health check interval)."""
+        result = await self._health_cache.get_or_set("check_health", self._check_health, force_refresh)
+        if result.status != "healthy":
+            # Re-check on the next call instead of reporting a blip for the whole interval
+            self._health_cache.invalidate("check_health")
+        return result
+
+    async def _check_health(self) -> HealthCheckResult:
         """Check overall queue health."""
         try:
-            queue_status = await self.get_queue_status()
-            stuck_repairs = await self.get_stuck_repairs()
-
-            total_pending = sum(
-                status_data["count"]
-                for status, status_data in queue_status.items()
-                if status in ["PENDING", "REQUESTED", "APPROVED"]
-            )
-
-            if stuck_repairs:
-                status = "degraded"
-                message = f"Found {len(stuck_repairs)} stuck repairs"
-            elif total_pending > self.thresholds.pending_repairs:
-                status = "degraded"
-                message = f"High pending repair count: {total_pending}"
-            else:
-                status = "healthy"
-                message = "Queue is processing normally"
-
-            return HealthCheckResult(
-                component="queue",
-                status=status,
-                message=message,
-                details={
-                    "total_pending": total_pending,
-                    "stuck_repairs_count": len(stuck_repairs)
-                }
+            queue_status, stuck_repairs = await asyncio.gather(
+                self.get_queue_status(),
+                self.get_stuck_repairs()
             )
+            return self.evaluate_health(queue_status, stuck_repairs)
         except Exception as e:
             logger.error(f"Queue health check failed: {e}")
             return HealthCheckResult(
@@ -324,6 +323,38 @@ class QueueMonitor:
                 message=f"Queue health check failed: {str(e)}"
             )
 
+    def evaluate_health(
+        self,
+        queue_status: Dict[str, Any],
+        stuck_repairs: List[Dict[str, Any]]
+    ) -> HealthCheckResult:
+        """Derive queue health from already-fetched queue data."""
+        total_pending = sum(
+            status_data["count"]
+            for status, status_data in queue_status.items()
+            if status in ["PENDING", "REQUESTED", "APPROVED"]
+        )
+
+        if stuck_repairs:
+            status = "degraded"
+            message = f"Found {len(stuck_repairs)} stuck repairs"
+        elif total_pending > self.thresholds.pending_repairs:
+            status = "degraded"
+            message = f"High pending repair count: {total_pending}"
+        else:
+            status = "healthy"
+            message = "Queue is processing normally"
+
+        return HealthCheckResult(
+            component="queue",
+            status=status,
+            message=message,
+            details={
+                "total_pending": total_pending,
+                "stuck_repairs_count": len(stuck_repairs)
+            }
+        )
+
     def check_thresholds(
         self,
         queue_status: Dict[str, Any],
@@ -385,8 +416,7 @@ class QueueMonitor:
                 self.get_stuck_repairs(),
                 self.get_processing_times(),
                 self.get_technician_queue_load(),
-                self.get_queue_throughput(),
-                self.check_health()
+                self.get_queue_throughput()
             ]
 
             (
@@ -394,15 +424,16 @@ class QueueMonitor:
                 stuck_repairs,
                 processing_times,
                 technician_load,
-                throughput,
-                health
+                throughput
             ) = await asyncio.gather(*tasks)
 
+            health = self.evaluate_health(queue_status, stuck_repairs)
+
             # Check thresholds
             issues = self.check_thresholds(queue_status, stuck_repairs, throughput)
 
             return {
-                "health": health.dict(),
+                "health": health.model_dump(),
                 "queue_status": queue_status,
                 "stuck_repairs": stuck_repairs,
                 "processing_times": processing_times,
@@ -1,24 +1,105 @@
 """AWS S3 storage monitoring for RS Systems."""
 
 import asyncio
+import csv
+import gzip
+import heapq
+import io
+import json
+import operator
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import unquote_plus
 import logging
 
-from ..config import settings
+from ..cache import AsyncTTLCache
+from ..config import get_settings
 from ..models.django_models import HealthCheckResult
 
 logger = logging.getLogger(__name__)
 
+# Bucket prefixes reported separately; everything else is counted as "other/"
+_PHOTO_PREFIXES = ("damage-photos/before/", "damage-photos/after/")
+_OTHER_PREFIX = "other/"
+# Error codes S3 returns when a bucket setting has simply never been configured
+_NOT_CONFIGURED_ERROR_CODES = frozenset({
+    "ServerSideEncryptionConfigurationNotFoundError",
+    "NoSuchLifecycleConfiguration",
+    "NoSuchPublicAccessBlockConfiguration",
+})
+_object_size = operator.itemgetter('Size')
+_BYTES_PER_MB = 1024 * 1024
+_BYTES_PER_GB = 1024 ** 3
+# Largest files kept per scan
+_LARGE_FILES_LIMIT = 50
+# Prefix listings and config lookups fan out across threads, so allow more
+# pooled connections than botocore's default of 10; adaptive retries back off
+# when S3 throttles, and the timeouts keep one slow call from stalling monitor()
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30
+)
+# Weight of the newest reading in the bucket size baseline (EWMA)
+_BASELINE_ALPHA = 0.2
+# AWS S3 Standard pricing (approximate, varies by region), folded into
+# per-GB rates and fixed request costs for typical RS Systems usage
+_STORAGE_COST_PER_GB = 0.023  # First 50 TB / month
+_TRANSFER_COST_PER_STORED_GB = 0.1 * 0.09  # Assume 10% of storage is transferred out at $0.09/GB
+_PUT_REQUESTS_COST = round(1000 / 1000 * 0.005, 2)  # ~1000 new photos uploaded at $0.005 per 1000
+_GET_REQUESTS_COST = round(5000 / 1000 * 0.0004, 2)  # ~5000 photos viewed at $0.0004 per 1000
+# Folders that contain a photo prefix and must be walked rather than listed whole
+_PHOTO_PREFIX_PARENTS = frozenset(
+    prefix[:i + 1]
+    for prefix in _PHOTO_PREFIXES
+    for i, char in enumerate(prefix[:-1])
+    if char == '/'
+)
+
+
+def _keep_largest(heap: List[Tuple[int, str, Dict[str, Any]]], obj: Dict[str, Any]):
+    """Track ``obj`` in a min-heap holding at most the largest files seen so far."""
+    entry = (obj['Size'], obj['Key'], obj)
+    if len(heap) < _LARGE_FILES_LIMIT:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+@lru_cache(maxsize=4)
+def _s3_client(access_key_id: str, secret_access_key: str, region: str):
+    """Build an S3 client once per credential set; boto3 clients are thread-safe."""
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        config=_S3_CLIENT_CONFIG
+    )
+
 
 class StorageMonitor:
     """Monitor AWS S3 storage usage and performance."""
 
     def __init__(self):
+        settings = get_settings()
         self.aws_config = settings.aws
         self.thresholds = settings.thresholds
+        # Bucket settings change on the order of days, so the five config
+        # lookups are reused across monitoring cycles
+        self._config_cache = AsyncTTLCache(settings.monitoring.s3_config_refresh_seconds)
+        # Listing the bucket is the expensive part of a storage check and its
+        # totals move slowly, so a scan is reused for one summary refresh interval
+        self._scan_cache = AsyncTTLCache(settings.monitoring.summary_refresh_seconds)
+        self._health_cache = AsyncTTLCache(settings.monitoring.health_check_interval_seconds)
+        # Smoothed bucket size from earlier checks, used to spot sudden growth
+        self._baseline_size_gb: Optional[float] = None
         self.s3_client = None
         self._initialize_s3_client()
 
@@ -26,11 +107,10 @@ class StorageMonitor:
         """Initialize S3 client with configured credentials."""
         try:
             if self.aws_config.access_key_id and self.aws_config.secret_access_key:
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.aws_config.access_key_id,
-                    aws_secret_access_key=self.aws_config.secret_access_key,
-                    region_name=self.aws_config.region
+                self.s3_client = _s3_client(
+                    self.aws_config.access_key_id,
+                    self.aws_config.secret_access_key,
+                    self.aws_config.region
                 )
                 logger.info("S3 client initialized successfully")
             else:
@@ -38,129 +118,288 @@ class StorageMonitor:
         except Exception as e:
             logger.error(f"Failed to initialize S3 client: {e}")
 
+    def refresh(self):
+        """Drop the cached bucket scan, configuration and health so the next call re-queries S3."""
+        self._config_cache.invalidate()
+        self._scan_cache.invalidate()
+        self._health_cache.invalidate()
+
     async def get_bucket_size(self) -> Dict[str, Any]:
         """Get total size and object count for the S3 bucket."""
         if not self.s3_client:
             return {"error": "S3 client not initialized"}
 
+        bucket_stats, _ = await self._scan_bucket()
+        return bucket_stats
+
+    async def get_large_files(self, size_threshold_mb: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get list of files exceeding size threshold."""
+        if not self.s3_client:
+            return []
+
+        if not size_threshold_mb or size_threshold_mb >= self.thresholds.photo_size_mb:
+            # The regular scan already holds the largest files over the default
+            # threshold, so a higher one is just a filter over them
+            _, large_files = await self._scan_bucket()
+            if not size_threshold_mb:
+                return large_files
+            return [large_file for large_file in large_files if large_file["size_mb"] > size_threshold_mb]
+
+        # A lower threshold needs files the regular scan skipped
+        _, large_files = await self._scan_bucket(size_threshold_mb)
+        return large_files
+
+    async def _scan_bucket(self, size_threshold_mb: Optional[int] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Return size totals and large files, rescanning at most once per refresh interval.
+
+        Without a threshold this is the regular scan at the photo size
+        threshold, the only one that feeds the growth baseline.
+        """
+        cache_key = self.aws_config.s3_bucket_name
+        if size_threshold_mb is not None:
+            cache_key = f"{cache_key}:{size_threshold_mb}"
+        bucket_stats, large_files = await self._scan_cache.get_or_set(
+            cache_key,
+            lambda: self._run_bucket_scan(
+                self.thresholds.photo_size_mb if size_threshold_mb is None else size_threshold_mb,
+                update_baseline=size_threshold_mb is None
+            )
+        )
+        if "error" in bucket_stats:
+            # Retry on the next call rather than keeping a failed scan for the refresh interval
+            self._scan_cache.invalidate(cache_key)
+        return bucket_stats, large_files
+
+    async def _run_bucket_scan(
+        self, size_threshold_mb: int, update_baseline: bool = True
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """List the bucket once, collecting size totals and large files together."""
+        threshold_bytes = size_threshold_mb * _BYTES_PER_MB
         bucket_stats = {
             "total_size_bytes": 0,
             "total_size_gb": 0,
             "object_count": 0,
             "by_prefix": {}
         }
+        large_files = []
 
         try:
-            # Get bucket objects
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(Bucket=self.aws_config.s3_bucket_name)
-
-            prefixes = {
-                "damage-photos/before/": {"size": 0, "count": 0},
-                "damage-photos/after/": {"size": 0, "count": 0},
-                "other/": {"size": 0, "count": 0}
-            }
+            inventory = None
+            if self.aws_config.s3_inventory_prefix:
+                inventory = await asyncio.to_thread(self._scan_inventory_sync, threshold_bytes)
 
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        bucket_stats["total_size_bytes"] += obj['Size']
-                        bucket_stats["object_count"] += 1
-
-                        # Categorize by prefix
-                        key = obj['Key']
-                        categorized = False
-                        for prefix in prefixes:
-                            if key.startswith(prefix):
-                                prefixes[prefix]["size"] += obj['Size']
-                                prefixes[prefix]["count"] += 1
-                                categorized = True
-                                break
-
-                        if not categorized:
-                            prefixes["other/"]["size"] += obj['Size']
-                            prefixes["other/"]["count"] += 1
-
-            bucket_stats["total_size_gb"] = round(bucket_stats["total_size_bytes"] / (1024**3), 2)
-
-            # Convert prefix sizes to GB
-            for prefix, data in prefixes.items():
+            if inventory:
+                bucket_stats["inventory_date"], prefix_totals = inventory
+            else:
+                # One listing per prefix, run concurrently; S3 does the filtering
+                prefix_totals = await asyncio.gather(
+                    *[self._scan_prefix(prefix, threshold_bytes) for prefix in _PHOTO_PREFIXES],
+                    self._scan_other_prefixes(threshold_bytes)
+                )
+
+            for prefix, data in zip(_PHOTO_PREFIXES + (_OTHER_PREFIX,), prefix_totals):
+                bucket_stats["total_size_bytes"] += data["size"]
+                bucket_stats["object_count"] += data["count"]
                 bucket_stats["by_prefix"][prefix] = {
-                    "size_gb": round(data["size"] / (1024**3), 2),
+                    "size_gb": round(data["size"] / _BYTES_PER_GB, 2),
                     "object_count": data["count"]
                 }
+                large_files.extend(data["large_files"])
+
+            bucket_stats["total_size_gb"] = round(bucket_stats["total_size_bytes"] / _BYTES_PER_GB, 2)
+
+            # Fold each fresh measurement into the growth baseline exactly once;
+            # calls served from the cached scan reuse the baseline recorded here
+            baseline = self._baseline_size_gb
+            current = bucket_stats["total_size_gb"]
+            bucket_stats["baseline_size_gb"] = round(baseline, 2) if baseline is not None else None
+            if update_baseline:
+                self._baseline_size_gb = (
+                    current if baseline is None
+                    else _BASELINE_ALPHA * current + (1 - _BASELINE_ALPHA) * baseline
+                )
+
+            # Merge the per-prefix heaps, largest first
+            large_files = [
+                {
+                    "key": obj['Key'],
+                    "size_mb": round(obj['Size'] / _BYTES_PER_MB, 2),
+                    "last_modified": obj['LastModified'].isoformat() if 'LastModified' in obj else None,
+                    "storage_class": obj.get('StorageClass', 'STANDARD')
+                }
+                for _, _, obj in heapq.nlargest(_LARGE_FILES_LIMIT, large_files)
+            ]
 
         except ClientError as e:
-            logger.error(f"Failed to get bucket size: {e}")
+            logger.error(f"Failed to scan bucket: {e}")
             bucket_stats["error"] = str(e)
+            large_files = []
         except Exception as e:
-            logger.error(f"Unexpected error getting bucket size: {e}")
+            logger.error(f"Unexpected error scanning bucket: {e}")
             bucket_stats["error"] = str(e)
+            large_files = []
 
-        return bucket_stats
+        return bucket_stats, large_files
 
-    async def get_large_files(self, size_threshold_mb: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get list of files exceeding size threshold."""
-        if not self.s3_client:
-            return []
+    def _scan_inventory_sync(self, threshold_bytes: int) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """Total the bucket from its latest S3 Inventory report.
 
-        threshold = size_threshold_mb or self.thresholds.photo_size_mb
-        threshold_bytes = threshold * 1024 * 1024
-        large_files = []
+        Returns the report date and per-prefix totals in the same shape as the
+        listing scan, or None when no usable CSV inventory is found so the
+        caller can fall back to listing the bucket.
+        """
+        inventory_bucket = self.aws_config.s3_inventory_bucket or self.aws_config.s3_bucket_name
+        inventory_prefix = self.aws_config.s3_inventory_prefix.rstrip('/') + '/'
 
         try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(Bucket=self.aws_config.s3_bucket_name)
-
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        if obj['Size'] > threshold_bytes:
-                            large_files.append({
-                                "key": obj['Key'],
-                                "size_mb": round(obj['Size'] / (1024 * 1024), 2),
-                                "last_modified": obj['LastModified'].isoformat(),
-                                "storage_class": obj.get('StorageClass', 'STANDARD')
-                            })
-
-            # Sort by size descending
-            large_files.sort(key=lambda x: x['size_mb'], reverse=True)
-
-            # Limit to top 50
-            large_files = large_files[:50]
+            # Reports live in one folder per day, named by ISO timestamp
+            _, folders = self._list_level_sync(inventory_prefix, bucket=inventory_bucket)
+            report_folders = sorted(
+                folder for folder in folders if folder[len(inventory_prefix):][:1].isdigit()
+            )
+            if not report_folders:
+                logger.warning(f"No S3 inventory reports found under {inventory_prefix}")
+                return None
 
-        except Exception as e:
-            logger.error(f"Failed to get large files: {e}")
+            latest = report_folders[-1]
+            response = self.s3_client.get_object(Bucket=inventory_bucket, Key=f"{latest}manifest.json")
+            manifest = json.loads(response['Body'].read())
 
-        return large_files
+            if manifest.get('fileFormat') != 'CSV':
+                logger.warning(
+                    f"Unsupported S3 inventory format {manifest.get('fileFormat')}, listing bucket instead"
+                )
+                return None
+
+            columns = [column.strip() for column in manifest['fileSchema'].split(',')]
+            data_bucket = manifest.get('destinationBucket', inventory_bucket).rsplit(':', 1)[-1]
+            other = len(_PHOTO_PREFIXES)
+            sizes = [0] * (other + 1)
+            counts = [0] * (other + 1)
+            large_files = [[] for _ in range(other + 1)]
+
+            for data_file in manifest['files']:
+                body = self.s3_client.get_object(Bucket=data_bucket, Key=data_file['key'])['Body']
+                with gzip.GzipFile(fileobj=body) as compressed:
+                    for row in csv.reader(io.TextIOWrapper(compressed, encoding='utf-8')):
+                        record = dict(zip(columns, row))
+                        # Delete markers and non-current versions have no size to count
+                        if (
+                            not record.get('Size')
+                            or record.get('IsDeleteMarker') == 'true'
+                            or record.get('IsLatest') == 'false'
+                        ):
+                            continue
+
+                        key = unquote_plus(record['Key'])
+                        size = int(record['Size'])
+                        index = other
+                        if key.startswith(_PHOTO_PREFIXES):
+                            index = next(i for i, prefix in enumerate(_PHOTO_PREFIXES) if key.startswith(prefix))
+
+                        sizes[index] += size
+                        counts[index] += 1
+                        if size > threshold_bytes:
+                            _keep_largest(large_files[index], self._inventory_object(key, size, record))
+
+            totals = [
+                {"size": size, "count": count, "large_files": candidates}
+                for size, count, candidates in zip(sizes, counts, large_files)
+            ]
+            return latest[len(inventory_prefix):].rstrip('/'), totals
+
+        except (ClientError, KeyError, ValueError, OSError) as e:
+            logger.warning(f"Failed to read S3 inventory, listing bucket instead: {e}")
+            return None
+
+    @staticmethod
+    def _inventory_object(key: str, size: int, row: Dict[str, str]) -> Dict[str, Any]:
+        """Convert an inventory CSV row into a list_objects_v2-style object."""
+        obj = {'Key': key, 'Size': size}
+        if row.get('LastModifiedDate'):
+            obj['LastModified'] = datetime.fromisoformat(row['LastModifiedDate'].replace('Z', '+00:00'))
+        if row.get('StorageClass'):
+            obj['StorageClass'] = row['StorageClass']
+        return obj
+
+    async def _scan_prefix(self, prefix: str, threshold_bytes: int) -> Dict[str, Any]:
+        """Total everything under ``prefix`` and keep the objects over the threshold."""
+        return await asyncio.to_thread(self._scan_prefix_sync, prefix, threshold_bytes)
+
+    def _scan_prefix_sync(self, prefix: str, threshold_bytes: int) -> Dict[str, Any]:
+        total_size = count = 0
+        large_files = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+
+        for page in paginator.paginate(Bucket=self.aws_config.s3_bucket_name, Prefix=prefix):
+            contents = page.get('Contents')
+            if not contents:
+                continue
+
+            # Sum the page with C-level builtins and only walk it in Python
+            # when it actually holds a large file
+            sizes = list(map(_object_size, contents))
+            count += len(sizes)
+            total_size += sum(sizes)
+            if max(sizes) > threshold_bytes:
+                for obj, size in zip(contents, sizes):
+                    if size > threshold_bytes:
+                        _keep_largest(large_files, obj)
+
+        return {"size": total_size, "count": count, "large_files": large_files}
+
+    async def _scan_other_prefixes(self, threshold_bytes: int, parent: str = "") -> Dict[str, Any]:
+        """Scan the objects outside the photo prefixes without listing inside them.
+
+        Walks the key hierarchy one level at a time, only descending into
+        folders that contain a photo prefix; any other folder is scanned with
+        its own prefix listing.
+        """
+        keys, folders = await asyncio.to_thread(self._list_level_sync, parent)
+        totals = {"size": sum(map(_object_size, keys)), "count": len(keys), "large_files": []}
+        for obj in keys:
+            if obj['Size'] > threshold_bytes:
+                _keep_largest(totals["large_files"], obj)
+
+        tasks = []
+        for folder in folders:
+            if folder in _PHOTO_PREFIXES:
+                continue
+            if folder in _PHOTO_PREFIX_PARENTS:
+                tasks.append(self._scan_other_prefixes(threshold_bytes, folder))
+            else:
+                tasks.append(self._scan_prefix(folder, threshold_bytes))
 
-    async def estimate_costs(self, size_gb: float) -> Dict[str, float]:
-        """Estimate monthly S3 storage costs."""
-        # AWS S3 Standard pricing (approximate, varies by region)
-        pricing = {
-            "storage_per_gb": 0.023,  # First 50 TB / month
-            "requests_per_1000": {
-                "PUT": 0.005,
-                "GET": 0.0004
-            },
-            "data_transfer_per_gb": 0.09  # Internet data transfer out
-        }
+        for subtotal in await asyncio.gather(*tasks):
+            totals["size"] += subtotal["size"]
+            totals["count"] += subtotal["count"]
+            for candidate in subtotal["large_files"]:
+                _keep_largest(totals["large_files"], candidate[2])
 
-        # Estimate based on typical usage patterns for RS Systems
-        estimated_requests = {
-            "PUT": 1000,  # New photos uploaded
-            "GET": 5000   # Photos viewed
-        }
+        return totals
+
+    def _list_level_sync(
+        self, parent: str, bucket: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """List the keys and sub-folders directly under ``parent``."""
+        keys, folders = [], []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+
+        for page in paginator.paginate(
+            Bucket=bucket or self.aws_config.s3_bucket_name, Prefix=parent, Delimiter='/'
+        ):
+            keys.extend(page.get('Contents') or ())
+            folders.extend(common['Prefix'] for common in page.get('CommonPrefixes') or ())
+
+        return keys, folders
 
+    async def estimate_costs(self, size_gb: float) -> Dict[str, float]:
+        """Estimate monthly S3 storage costs."""
         costs = {
-            "storage": round(size_gb * pricing["storage_per_gb"], 2),
-            "put_requests": round(
-                (estimated_requests["PUT"] / 1000) * pricing["requests_per_1000"]["PUT"], 2
-            ),
-            "get_requests": round(
-                (estimated_requests["GET"] / 1000) * pricing["requests_per_1000"]["GET"], 2
-            ),
-            "data_transfer": round(size_gb * 0.1 * pricing["data_transfer_per_gb"], 2)  # Assume 10% transfer
+            "storage": round(size_gb * _STORAGE_COST_PER_GB, 2),
+            "put_requests": _PUT_REQUESTS_COST,
+            "get_requests": _GET_REQUESTS_COST,
+            "data_transfer": round(size_gb * _TRANSFER_COST_PER_STORED_GB, 2)
         }
 
         costs["total_estimated"] = round(sum(costs.values()), 2)
@@ -184,6 +423,16 @@ class StorageMonitor:
         if not self.s3_client:
             return {"error": "S3 client not initialized"}
 
+        config = await self._config_cache.get_or_set(
+            self.aws_config.s3_bucket_name, self._fetch_bucket_configuration
+        )
+        if "error" in config:
+            # Retry on the next call rather than keeping a failed lookup for the refresh interval
+            self._config_cache.invalidate(self.aws_config.s3_bucket_name)
+        return config
+
+    async def _fetch_bucket_configuration(self) -> Dict[str, Any]:
+        bucket = self.aws_config.s3_bucket_name
         config = {
             "versioning": False,
             "encryption": False,
@@ -191,45 +440,53 @@ class StorageMonitor:
             "public_access_blocked": False,
             "logging_enabled": False
         }
+        lookups = {
+            "versioning": (
+                self.s3_client.get_bucket_versioning,
+                lambda response: response.get('Status') == 'Enabled'
+            ),
+            "encryption": (
+                self.s3_client.get_bucket_encryption,
+                lambda response: bool(response.get('ServerSideEncryptionConfiguration'))
+            ),
+            "lifecycle_rules": (
+                self.s3_client.get_bucket_lifecycle_configuration,
+                lambda response: len(response.get('Rules', []))
+            ),
+            "public_access_blocked": (
+                self.s3_client.get_public_access_block,
+                lambda response: all([
+                    response['PublicAccessBlockConfiguration'].get('BlockPublicAcls', False),
+                    response['PublicAccessBlockConfiguration'].get('BlockPublicPolicy', False)
+                ])
+            ),
+            "logging_enabled": (
+                self.s3_client.get_bucket_logging,
+                lambda response: 'LoggingEnabled' in response
+            )
+        }
 
         try:
-            # Check versioning
-            try:
-                versioning = self.s3_client.get_bucket_versioning(Bucket=self.aws_config.s3_bucket_name)
-                config["versioning"] = versioning.get('Status') == 'Enabled'
-            except:
-                pass
-
-            # Check encryption
-            try:
-                encryption = self.s3_client.get_bucket_encryption(Bucket=self.aws_config.s3_bucket_name)
-                config["encryption"] = bool(encryption.get('ServerSideEncryptionConfiguration'))
-            except:
-                pass
-
-            # Check lifecycle rules
-            try:
-                lifecycle = self.s3_client.get_bucket_lifecycle_configuration(Bucket=self.aws_config.s3_bucket_name)
-                config["lifecycle_rules"] = len(lifecycle.get('Rules', []))
-            except:
-                pass
-
-            # Check public access block
-            try:
-                public_block = self.s3_client.get_public_access_block(Bucket=self.aws_config.s3_bucket_name)
-                config["public_access_blocked"] = all([
-                    public_block['PublicAccessBlockConfiguration'].get('BlockPublicAcls', False),
-                    public_block['PublicAccessBlockConfiguration'].get('BlockPublicPolicy', False)
-                ])
-            except:
-                pass
+            # The lookups are independent, so issue them together
+            responses = await asyncio.gather(
+                *[asyncio.to_thread(fetch, Bucket=bucket) for fetch, _ in lookups.values()],
+                return_exceptions=True
+            )
 
-            # Check logging
-            try:
-                logging_config = self.s3_client.get_bucket_logging(Bucket=self.aws_config.s3_bucket_name)
-                config["logging_enabled"] = 'LoggingEnabled' in logging_config
-            except:
-                pass
+            errors = []
+            for (setting, (_, parse)), response in zip(lookups.items(), responses):
+                if isinstance(response, ClientError):
+                    if response.response['Error']['Code'] in _NOT_CONFIGURED_ERROR_CODES:
+                        continue  # Feature is off for this bucket; keep the default
+                    errors.append(f"{setting}: {response}")
+                elif isinstance(response, Exception):
+                    errors.append(f"{setting}: {response}")
+                else:
+                    config[setting] = parse(response)
+
+            if errors:
+                logger.error(f"Failed to check bucket configuration: {'; '.join(errors)}")
+                config["error"] = "; ".join(errors)
 
         except Exception as e:
             logger.error(f"Failed to check bucket configuration: {e}")
@@ -237,7 +494,15 @@ class StorageMonitor:
 
         return config
 
-    async def check_health(self) -> HealthCheckResult:
+    async def check_health(self, force_refresh: bool = False) -> HealthCheckResult:
+        """Check S3 storage health (cached for the health check interval)."""
+        result = await self._health_cache.get_or_set("check_health", self._check_health, force_refresh)
+        if result.status != "healthy":
+            # Re-check on the next call instead of reporting a blip for the whole interval
+            self._health_cache.invalidate("check_health")
+        return result
+
+    async def _check_health(self) -> HealthCheckResult:
         """Check S3 storage health."""
         if not self.s3_client:
             return HealthCheckResult(
@@ -248,7 +513,7 @@ class StorageMonitor:
 
         try:
             # Try to head the bucket to check connectivity
-            self.s3_client.head_bucket(Bucket=self.aws_config.s3_bucket_name)
+            await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.aws_config.s3_bucket_name)
 
             return HealthCheckResult(
                 component="storage",
@@ -302,6 +567,21 @@ class StorageMonitor:
                 "threshold": self.thresholds.s3_storage_gb
             })
 
+        # Check growth against the smoothed baseline recorded with the scan
+        baseline = bucket_size.get("baseline_size_gb")
+        if "error" not in bucket_size and baseline is not None:
+            current = bucket_size.get("total_size_gb", 0)
+            growth = current - baseline
+            if growth > self.thresholds.s3_growth_gb or (growth >= 1 and current > baseline * 1.5):
+                issues.append({
+                    "type": "rapid_storage_growth",
+                    "severity": "warning",
+                    "message": f"S3 storage ({current}GB) grew {round(growth, 2)}GB above its recent baseline ({baseline}GB)",
+                    "value": current,
+                    "baseline": baseline,
+                    "threshold": self.thresholds.s3_growth_gb
+                })
+
         # Check for large files
         if large_files:
             issues.append({
@@ -326,22 +606,23 @@ class StorageMonitor:
 
     async def monitor(self) -> Dict[str, Any]:
         """Perform comprehensive S3 storage monitoring."""
+        timestamp = datetime.now().isoformat()
+
         if not self.s3_client:
             return {
                 "error": "S3 monitoring disabled - AWS credentials not configured",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         try:
             # Run all monitoring tasks
             tasks = [
-                self.get_bucket_size(),
-                self.get_large_files(),
+                self._scan_bucket(),
                 self.check_bucket_configuration(),
                 self.check_health()
             ]
 
-            bucket_size, large_files, bucket_config, health = await asyncio.gather(*tasks)
+            (bucket_size, large_files), bucket_config, health = await asyncio.gather(*tasks)
 
             # Estimate costs
             costs = await self.estimate_costs(bucket_size.get("total_size_gb", 0))
@@ -353,7 +634,7 @@ class StorageMonitor:
             issues = self.check_thresholds(bucket_size, large_files, costs)
 
             return {
-                "health": health.dict(),
+                "health": health.model_dump(),
                 "bucket_size": bucket_size,
                 "large_files": large_files[:10],  # Top 10 largest files
                 "bucket_configuration": bucket_config,
@@ -361,12 +642,12 @@ class StorageMonitor:
                 "access_patterns": access_patterns,
                 "issues": issues,
                 "has_issues": len(issues) > 0,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
             logger.error(f"S3 monitoring failed: {e}")
             return {
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
\ No newline at end of file
@@ -312,34 +312,44 @@ class RSHealthMonitorServer:
                 logger.error(f"Error handling tool call {name}: {e}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+    async def _run_monitors(self, components: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Run the enabled monitors for the given components (default: all) concurrently.
+
+        Running them side by side lets the database and queue monitors share
+        one in-flight repair status scan instead of each querying in turn.
+        """
+        monitors = {
+            "database": (self.db_monitor, settings.features.enable_database_monitoring),
+            "api": (self.api_monitor, settings.features.enable_api_monitoring),
+            "queue": (self.queue_monitor, settings.features.enable_queue_monitoring),
+            "storage": (self.storage_monitor, settings.features.enable_s3_monitoring),
+            "activity": (self.activity_monitor, settings.features.enable_activity_monitoring),
+        }
+        selected = {
+            component: monitor
+            for component, (monitor, enabled) in monitors.items()
+            if monitor and enabled and (components is None or component in components)
+        }
+        semaphore = asyncio.Semaphore(settings.monitoring.max_concurrent_monitors)
+
+        async def run(monitor):
+            async with semaphore:
+                return await monitor.monitor()
+
+        outcomes = await asyncio.gather(*(run(monitor) for monitor in selected.values()))
+        return dict(zip(selected, outcomes))
+
     async def _system_health_summary(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """Get comprehensive system health summary."""
         include_details = arguments.get("include_details", False)
         components = arguments.get("components", ["database", "api", "queue", "storage", "activity"])
 
-        results = {}
-        health_scores = {}
-
         # Run enabled monitors
-        if "database" in components and self.db_monitor and settings.features.enable_database_monitoring:
-            results["database"] = await self.db_monitor.monitor()
-            health_scores["database"] = 100 if not results["database"].get("has_issues") else 75
-
-        if "api" in components and self.api_monitor and settings.features.enable_api_monitoring:
-            results["api"] = await self.api_monitor.monitor()
-            health_scores["api"] = 100 if not results["api"].get("has_issues") else 75
-
-        if "queue" in components and self.queue_monitor and settings.features.enable_queue_monitoring:
-            results["queue"] = await self.queue_monitor.monitor()
-            health_scores["queue"] = 100 if not results["queue"].get("has_issues") else 75
-
-        if "storage" in components and self.storage_monitor and settings.features.enable_s3_monitoring:
-            results["storage"] = await self.storage_monitor.monitor()
-            health_scores["storage"] = 100 if not results["storage"].get("has_issues") else 75
-
-        if "activity" in components and self.activity_monitor and settings.features.enable_activity_monitoring:
-            results["activity"] = await self.activity_monitor.monitor()
-            health_scores["activity"] = 100 if not results["activity"].get("has_issues") else 75
+        results = await self._run_monitors(components)
+        health_scores = {
+            component: 100 if not result.get("has_issues") else 75
+            for component, result in results.items()
+        }
 
         # Calculate overall health score
         if health_scores:
@@ -590,53 +600,89 @@ class RSHealthMonitorServer:
         return [TextContent(type="text", text=f"Alert {alert_id} has been resolved.")]
 
     async def _monitoring_loop(self, interval: int):
-        """Background monitoring loop."""
+        """Background monitoring loop.
+
+        ``interval`` is the fastest cadence. While every component stays
+        healthy with no issues the wait grows by half each cycle, up to
+        MONITORING_MAX_INTERVAL_SECONDS; any change, or anything unhealthy,
+        drops straight back to ``interval``. The S3 listing has its own,
+        slower refresh (SUMMARY_REFRESH_SECONDS) independent of this loop.
+        """
         logger.info(f"Starting monitoring loop with {interval}s interval")
+        max_interval = max(interval, settings.monitoring.max_interval_seconds)
+        current_interval = interval
+        previous_state = None
 
         while self.is_monitoring:
             try:
                 # Run all monitors
-                results = {}
-
-                if self.db_monitor and settings.features.enable_database_monitoring:
-                    results["database"] = await self.db_monitor.monitor()
+                results = await self._run_monitors()
 
-                if self.api_monitor and settings.features.enable_api_monitoring:
-                    results["api"] = await self.api_monitor.monitor()
-
-                if self.queue_monitor and settings.features.enable_queue_monitoring:
-                    results["queue"] = await self.queue_monitor.monitor()
-
-                if self.storage_monitor and settings.features.enable_s3_monitoring:
-                    results["storage"] = await self.storage_monitor.monitor()
-
-                if self.activity_monitor and settings.features.enable_activity_monitoring:
-                    results["activity"] = await self.activity_monitor.monitor()
+                state = self._health_state(results)
+                if state == previous_state and self._is_quiet(state):
+                    current_interval = min(max_interval, current_interval * 1.5)
+                else:
+                    current_interval = interval
+                previous_state = state
 
                 # Process results for alerts
                 await self.alert_manager.process_monitor_results(results)
 
-                logger.debug("Monitoring cycle completed")
+                logger.debug(f"Monitoring cycle completed, next in {current_interval:.0f}s")
 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
+                current_interval = interval
 
             # Wait for next cycle
-            await asyncio.sleep(interval)
+            await asyncio.sleep(current_interval)
 
         logger.info("Monitoring loop stopped")
 
+    @staticmethod
+    def _health_state(results: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a monitoring cycle to each component's status and issue count."""
+        state = {}
+        for component, result in results.items():
+            health = result.get("health")
+            state[component] = (
+                health.get("status") if isinstance(health, dict) else None,
+                len(result.get("issues") or []),
+                "error" in result,
+            )
+        return state
+
+    @staticmethod
+    def _is_quiet(state: Dict[str, Any]) -> bool:
+        """Whether every component is healthy with no issues or errors."""
+        return all(
+            status in ("healthy", None) and not issue_count and not errored
+            for status, issue_count, errored in state.values()
+        )
+
     async def cleanup(self):
         """Cleanup resources."""
         if self.is_monitoring:
             await self._stop_monitoring({})
 
+        if self.api_monitor:
+            await self.api_monitor.close()
+
         if self.db_monitor:
             self.db_monitor.close()
 
         logger.info("RS Health Monitor server cleanup completed")
 
 
+def install_event_loop_policy():
+    """Run asyncio on uvloop's libuv-based event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 async def main():
     """Main entry point for the MCP server."""
     if not settings.validate():
@@ -666,4 +712,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_event_loop_policy()
     asyncio.run(main())
\ No newline at end of file
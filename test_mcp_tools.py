@@ -2,7 +2,11 @@
 """Comprehensive test of all MCP tools from end-user perspective."""
 
 import asyncio
+import contextlib
+import contextvars
+import io
 import json
+import sys
 import time
 import logging
 from datetime import datetime
@@ -12,11 +16,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+_test_output: contextvars.ContextVar[io.StringIO] = contextvars.ContextVar("test_output")
+
+
+class _PerTestStdout:
+    """Send print() output to the buffer of whichever test task is running."""
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+
+    def write(self, text):
+        return _test_output.get(self._fallback).write(text)
+
+    def flush(self):
+        _test_output.get(self._fallback).flush()
+
+
 class MCPToolsTester:
     """Test all MCP tools to validate end-user experience."""
 
+    _server = None
+
     def __init__(self):
-        self.server = RSHealthMonitorServer()
+        # Monitors open DB pools and AWS clients on construction, so every
+        # tester in the process shares one server
+        if MCPToolsTester._server is None:
+            MCPToolsTester._server = RSHealthMonitorServer()
+        self.server = MCPToolsTester._server
         self.test_results = {}
         self.performance_metrics = {}
 
@@ -32,16 +58,10 @@ class MCPToolsTester:
 
     async def measure_performance(self, tool_name: str, coro):
         """Measure performance of a tool execution."""
-        start_time = time.time()
-        try:
-            result = await coro
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            return result, response_time
-        except Exception as e:
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000
-            raise e
+        start_ns = time.perf_counter_ns()
+        result = await coro
+        response_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to milliseconds
+        return result, response_time
 
     async def test_system_health_summary(self):
         """Test: Get comprehensive system health summary."""
@@ -295,6 +315,13 @@ class MCPToolsTester:
             print(f"❌ Error: {str(e)}")
             self.log_test_result("background_monitoring", "FAIL", str(e))
 
+    async def _run_captured(self, test) -> str:
+        """Run one test, returning everything it printed."""
+        buffer = io.StringIO()
+        _test_output.set(buffer)  # Each gathered task has its own context
+        await test()
+        return buffer.getvalue()
+
     async def run_comprehensive_test(self):
         """Run all MCP tools tests."""
         print("🚀 Starting Comprehensive MCP Tools Testing")
@@ -303,15 +330,28 @@ class MCPToolsTester:
         print(f"🗄️  Database: {self.server.db_monitor.config.database_url if self.server.db_monitor else 'Not available'}")
         print("=" * 80)
 
-        # Run all tests
-        await self.test_system_health_summary()
-        await self.test_database_performance()
-        await self.test_repair_queue()
-        await self.test_api_performance()
-        await self.test_s3_usage()
-        await self.test_user_activity()
-        await self.test_alerts_management()
-        await self.test_background_monitoring()
+        # Run all tests concurrently; each one's output is buffered and
+        # printed in order once they finish
+        tests = [
+            self.test_system_health_summary,
+            self.test_database_performance,
+            self.test_repair_queue,
+            self.test_api_performance,
+            self.test_s3_usage,
+            self.test_user_activity,
+            self.test_alerts_management,
+            self.test_background_monitoring,
+        ]
+        with contextlib.redirect_stdout(_PerTestStdout(sys.stdout)):
+            outputs = await asyncio.gather(
+                *[self._run_captured(test) for test in tests], return_exceptions=True
+            )
+
+        for test, output in zip(tests, outputs):
+            if isinstance(output, Exception):
+                print(f"\n❌ {test.__name__} crashed: {output}")
+            else:
+                print(output, end="")
 
         # Print summary
         self.print_test_summary()
@@ -4,120 +4,143 @@
 import asyncio
 import json
 import logging
-from src.server import RSHealthMonitorServer
+import sys
+from src.config import settings
+from src.server import RSHealthMonitorServer, install_event_loop_policy
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def test_server():
-    """Test the MCP server functionality."""
-    logger.info("Initializing RS Health Monitor Server...")
-    server = RSHealthMonitorServer()
+class _JSON:
+    """Log argument that pretty-prints its value only if the record is emitted."""
 
-    # Test health check
-    logger.info("\n=== Testing System Health Summary ===")
-    try:
-        if server.db_monitor:
-            health = await server.db_monitor.check_health()
-            logger.info(f"Database Health: {health.status}")
-            logger.info(f"Message: {health.message}")
-            if health.details:
-                logger.info(f"Details: {json.dumps(health.details, indent=2)}")
-        else:
-            logger.warning("Database monitor not available")
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
+    def __init__(self, value):
+        self.value = value
 
-    # Test connection stats
-    logger.info("\n=== Testing Database Connection Stats ===")
-    try:
-        if server.db_monitor:
-            stats = await server.db_monitor.get_connection_stats()
-            logger.info(f"Connection Stats: {json.dumps(stats, indent=2)}")
-        else:
-            logger.warning("Database monitor not available")
-    except Exception as e:
-        logger.error(f"Connection stats failed: {e}")
+    def __str__(self):
+        return json.dumps(self.value, indent=2, default=str)
 
-    # Test table stats
-    logger.info("\n=== Testing Table Statistics ===")
-    try:
-        if server.db_monitor:
-            table_stats = await server.db_monitor.get_table_stats()
-            logger.info(f"Found {len(table_stats)} tables")
-            for table in table_stats[:5]:  # Show first 5 tables
-                logger.info(f"  Table: {table.get('table_name', 'unknown')}, Rows: {table.get('row_count', 0)}")
-        else:
-            logger.warning("Database monitor not available")
-    except Exception as e:
-        logger.error(f"Table stats failed: {e}")
 
-    # Test repair status distribution
-    logger.info("\n=== Testing Repair Status Distribution ===")
-    try:
-        if server.db_monitor:
-            distribution = await server.db_monitor.get_repair_status_distribution()
-            if distribution:
-                logger.info(f"Repair Status Distribution: {json.dumps(distribution, indent=2)}")
-            else:
-                logger.info("No repair data found (table might not exist)")
-        else:
-            logger.warning("Database monitor not available")
-    except Exception as e:
-        logger.error(f"Repair distribution failed: {e}")
+# Probes return (format, *args) log lines so nothing is formatted unless
+# INFO records are actually emitted
+async def _probe_db_health(server):
+    health = await server.db_monitor.check_health()
+    lines = [("Database Health: %s", health.status), ("Message: %s", health.message)]
+    if health.details:
+        lines.append(("Details: %s", _JSON(health.details)))
+    return lines
 
-    # Test API monitor
-    logger.info("\n=== Testing API Monitor ===")
-    try:
-        if server.api_monitor:
-            health = await server.api_monitor.check_health()
-            logger.info(f"API Health: {health.status}")
-            logger.info(f"Message: {health.message}")
-        else:
-            logger.warning("API monitor not available")
-    except Exception as e:
-        logger.error(f"API monitor failed: {e}")
 
-    # Test queue monitor
-    logger.info("\n=== Testing Queue Monitor ===")
-    try:
-        if server.queue_monitor:
-            queue_health = await server.queue_monitor.check_health()
-            logger.info(f"Queue Health: {queue_health.status}")
-            logger.info(f"Message: {queue_health.message}")
-        else:
-            logger.warning("Queue monitor not available")
-    except Exception as e:
-        logger.error(f"Queue monitor failed: {e}")
+async def _probe_conn_stats(server):
+    # Shares one cached snapshot query with the table stats probe
+    snapshot = await server.db_monitor.get_full_snapshot()
+    stats = snapshot.get("connection_stats", snapshot)
+    return [("Connection Stats: %s", _JSON(stats))]
 
-    # Test activity monitor
-    logger.info("\n=== Testing Activity Monitor ===")
-    try:
-        if server.activity_monitor:
-            activity = await server.activity_monitor.check_health()
-            logger.info(f"Activity Monitor Health: {activity.status}")
-            logger.info(f"Message: {activity.message}")
+
+async def _probe_table_stats(server):
+    snapshot = await server.db_monitor.get_full_snapshot()
+    table_stats = snapshot.get("table_stats", [])
+    lines = [("Found %d tables", len(table_stats))]
+    for table in table_stats[:5]:  # Show first 5 tables
+        lines.append(("  Table: %s, Rows: %s", table.get('table_name', 'unknown'), table.get('row_count', 0)))
+    return lines
+
+
+async def _probe_repair_dist(server):
+    distribution = await server.db_monitor.get_repair_status_distribution()
+    if distribution:
+        return [("Repair Status Distribution: %s", _JSON(distribution))]
+    return [("No repair data found (table might not exist)",)]
+
+
+async def _probe_api(server):
+    health = await server.api_monitor.check_health()
+    return [("API Health: %s", health.status), ("Message: %s", health.message)]
+
+
+async def _probe_queue(server):
+    queue_health = await server.queue_monitor.check_health()
+    return [("Queue Health: %s", queue_health.status), ("Message: %s", queue_health.message)]
+
+
+async def _probe_activity(server):
+    activity = await server.activity_monitor.check_health()
+    return [("Activity Monitor Health: %s", activity.status), ("Message: %s", activity.message)]
+
+
+async def _probe_alerts(server):
+    alerts = server.alert_manager.get_active_alerts()
+    lines = [("Active alerts: %d", len(alerts))]
+    for alert in alerts[:3]:  # Show first 3 alerts
+        lines.append(("  Alert: %s - %s", alert.get('component', 'unknown'), alert.get('severity', 'unknown')))
+    return lines
+
+
+# (section title, server attribute, probe, unavailable message, failure message)
+PROBES = [
+    ("System Health Summary", "db_monitor", _probe_db_health,
+     "Database monitor not available", "Health check failed"),
+    ("Database Connection Stats", "db_monitor", _probe_conn_stats,
+     "Database monitor not available", "Connection stats failed"),
+    ("Table Statistics", "db_monitor", _probe_table_stats,
+     "Database monitor not available", "Table stats failed"),
+    ("Repair Status Distribution", "db_monitor", _probe_repair_dist,
+     "Database monitor not available", "Repair distribution failed"),
+    ("API Monitor", "api_monitor", _probe_api,
+     "API monitor not available", "API monitor failed"),
+    ("Queue Monitor", "queue_monitor", _probe_queue,
+     "Queue monitor not available", "Queue monitor failed"),
+    ("Activity Monitor", "activity_monitor", _probe_activity,
+     "Activity monitor not available", "Activity monitor failed"),
+    ("Alert Manager", "alert_manager", _probe_alerts,
+     "Alert manager not available", "Alert manager failed"),
+]
+
+
+async def run_probes(server):
+    """Run every available probe against ``server`` and log the results."""
+    # The probes are independent, so run the available ones concurrently and
+    # report them in order afterwards
+    available = [probe for probe in PROBES if getattr(server, probe[1], None)]
+    outcomes = await asyncio.gather(
+        *[probe(server) for _, _, probe, _, _ in available], return_exceptions=True
+    )
+    results = {probe[0]: outcome for probe, outcome in zip(available, outcomes)}
+
+    for title, _, _, unavailable, failure in PROBES:
+        logger.info("\n=== Testing %s ===", title)
+        if title not in results:
+            logger.warning(unavailable)
+        elif isinstance(results[title], Exception):
+            logger.error("%s: %s", failure, results[title])
         else:
-            logger.warning("Activity monitor not available")
-    except Exception as e:
-        logger.error(f"Activity monitor failed: {e}")
+            for line in results[title]:
+                logger.info(*line)
+
+
+async def test_server(rounds: int = 1):
+    """Test the MCP server functionality.
+
+    Later rounds reuse the same server, so they run against its warm
+    connection pool, HTTP session and caches.
+    """
+    logger.info("Initializing RS Health Monitor Server...")
+    server = RSHealthMonitorServer()
 
-    # Test alert manager
-    logger.info("\n=== Testing Alert Manager ===")
     try:
-        if server.alert_manager:
-            alerts = server.alert_manager.get_active_alerts()
-            logger.info(f"Active alerts: {len(alerts)}")
-            for alert in alerts[:3]:  # Show first 3 alerts
-                logger.info(f"  Alert: {alert.get('component', 'unknown')} - {alert.get('severity', 'unknown')}")
-        else:
-            logger.warning("Alert manager not available")
-    except Exception as e:
-        logger.error(f"Alert manager failed: {e}")
+        for round_number in range(rounds):
+            if round_number:
+                await asyncio.sleep(settings.monitoring.interval_seconds)
+            await run_probes(server)
+    finally:
+        await server.cleanup()
 
     logger.info("\n=== Server Test Complete ===")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_server())
\ No newline at end of file
+    # Optional argument: number of probe rounds, one monitoring interval apart
+    install_event_loop_policy()
+    asyncio.run(test_server(int(sys.argv[1]) if len(sys.argv) > 1 else 1))
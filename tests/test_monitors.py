@@ -2,16 +2,28 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, MagicMock
+import sqlite3
+import threading
+import gzip
+import io
+import json
+import time
+import psycopg2
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime
+from botocore.exceptions import ClientError
 
 from src.monitors.database import DatabaseMonitor
+from src.monitors.database_postgresql import PostgreSQLMonitor
 from src.monitors.api import APIMonitor
 from src.monitors.queue import QueueMonitor
 from src.monitors.storage import StorageMonitor
 from src.monitors.activity import ActivityMonitor
+from src.monitors import activity_simple
 from src.alerts import AlertManager
-from src.config import settings
+from src.cache import AsyncTTLCache
+from src.models.django_models import HealthCheckResult
+from src.config import settings, get_settings, AlertConfig
 
 
 class TestDatabaseMonitor:
@@ -59,6 +71,223 @@ class TestDatabaseMonitor:
             assert isinstance(slow_queries, list)
 
 
+class TestPostgreSQLMonitor:
+    """Test PostgreSQL connection pool handling."""
+
+    @pytest.mark.asyncio
+    async def test_pool_recycles_dead_connections(self):
+        """Test that a pooled connection dropped by the server is replaced."""
+        dead_conn = MagicMock(idle_since=time.monotonic() - 60, created_at=time.monotonic())
+        dead_conn.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError("server closed the connection unexpectedly")
+        )
+        live_conn = MagicMock(idle_since=None, created_at=time.monotonic())
+
+        with patch('src.monitors.database_postgresql.psycopg2.pool.ThreadedConnectionPool') as mock_pool:
+            mock_pool.return_value.getconn.side_effect = [dead_conn, live_conn]
+            monitor = PostgreSQLMonitor()
+
+            result = await monitor.check_health()
+
+        assert result.status == "healthy"
+        mock_pool.return_value.putconn.assert_any_call(dead_conn, close=True)
+        mock_pool.return_value.putconn.assert_called_with(live_conn, close=False)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_uses_one_query(self):
+        """Test that the snapshot gathers every section through one pooled query."""
+        conn = MagicMock(idle_since=None, created_at=time.monotonic(), prepared_statements=set())
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = {
+            "total_connections": 3,
+            "active_connections": 1,
+            "idle_connections": 2,
+            "idle_in_transaction": 0,
+            "longest_query_ms": 12.5,
+            "max_connections": 100,
+            "slow_queries": [],
+            "table_stats": [{"table": "auth_user", "live_tuples": 10, "dead_tuples": 1}],
+            "locks": []
+        }
+
+        with patch('src.monitors.database_postgresql.psycopg2.pool.ThreadedConnectionPool') as mock_pool:
+            mock_pool.return_value.getconn.return_value = conn
+            monitor = PostgreSQLMonitor()
+
+            results = monitor.evaluate_snapshot(await monitor.get_full_snapshot())
+
+        assert mock_pool.return_value.getconn.call_count == 1
+        assert results["health"]["status"] == "healthy"
+        assert results["connection_stats"]["total_connections"] == 3
+        assert results["table_stats"][0]["bloat_ratio"] == 10.0
+        assert results["has_issues"] is False
+
+
+def _create_sqlite_db(path):
+    """Create a small RS Systems schema with a couple of technicians and repairs."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE auth_user (id INTEGER PRIMARY KEY, username TEXT);
+        CREATE TABLE technician_portal_technician (id INTEGER PRIMARY KEY, user_id INT);
+        CREATE TABLE core_customer (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE technician_portal_repair (
+            id INTEGER PRIMARY KEY, technician_id INT, customer_id INT, unit_number TEXT,
+            queue_status TEXT, repair_date TIMESTAMP
+        );
+        INSERT INTO auth_user (id, username) VALUES (1, 'alice'), (2, 'bob');
+        INSERT INTO technician_portal_technician (id, user_id) VALUES (1, 1), (2, 2);
+        INSERT INTO core_customer (id, name) VALUES (1, 'Acme');
+        INSERT INTO technician_portal_repair (technician_id, customer_id, unit_number, queue_status, repair_date)
+        VALUES
+            (1, 1, 'U1', 'COMPLETED', datetime('now', '-2 hours')),
+            (1, 1, 'U2', 'PENDING', datetime('now', '-1 hours')),
+            (2, 1, 'U3', 'IN_PROGRESS', datetime('now', '-3 hours'));
+    """)
+    conn.commit()
+    conn.close()
+
+
+class TestSQLiteMonitor:
+    """Test the SQLite adapter against a temporary database."""
+
+    @pytest.fixture
+    def sqlite_db_monitor(self, tmp_path, monkeypatch):
+        """Create a DatabaseMonitor backed by a temporary SQLite database."""
+        path = tmp_path / "db.sqlite3"
+        _create_sqlite_db(path)
+        monkeypatch.setattr(get_settings().database, "database_url", f"sqlite:///{path}")
+        monitor = DatabaseMonitor()
+        yield monitor
+        monitor.close()
+
+    @pytest.mark.asyncio
+    async def test_healthy_database_reports_no_issues(self, sqlite_db_monitor):
+        """Test that a healthy SQLite database raises no monitoring issues."""
+        results = await sqlite_db_monitor.monitor()
+
+        assert results["health"]["status"] == "healthy"
+        assert results["locks"] == []
+        assert results["connection_stats"]["journal_mode"] == "wal"
+        assert results["issues"] == []
+        assert results["has_issues"] is False
+
+    @pytest.mark.asyncio
+    async def test_checks_wait_for_the_connection_off_the_event_loop(self, sqlite_db_monitor):
+        """Test that a check blocked on the shared connection doesn't stall the loop."""
+        lock = sqlite_db_monitor.adapter._lock
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_connection():
+            with lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_connection)
+        holder.start()
+        held.wait(5)
+        try:
+            check = asyncio.ensure_future(sqlite_db_monitor.adapter.check_health())
+            await asyncio.sleep(0.05)
+            # The loop kept running while the check waited for the lock
+            assert not check.done()
+        finally:
+            release.set()
+            holder.join()
+
+        assert (await check).status == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_failed_repair_summary_is_not_shared(self, sqlite_db_monitor):
+        """Test that a failed status summary isn't cached for the queue monitor."""
+        sqlite_db_monitor._repair_summary_fn = AsyncMock(side_effect=[
+            sqlite3.OperationalError("database is locked"), {"PENDING": {"count": 1}}
+        ])
+
+        assert await sqlite_db_monitor.get_repair_status_distribution() == {}
+        assert await sqlite_db_monitor.get_repair_status_distribution() == {"PENDING": 1}
+
+    @pytest.mark.asyncio
+    async def test_monitor_payload(self, sqlite_db_monitor):
+        """Test the batched monitor payload and the snapshot it is built from."""
+        results = await sqlite_db_monitor.monitor()
+
+        assert set(results) >= {
+            "health", "slow_queries", "connection_stats", "table_stats", "locks",
+            "repair_distribution", "issues", "has_issues", "timestamp"
+        }
+        assert results["slow_queries"] == []
+        assert results["repair_distribution"] == {"COMPLETED": 1, "PENDING": 1, "IN_PROGRESS": 1}
+        tables = {table["table_name"]: table for table in results["table_stats"]}
+        assert tables["technician_portal_repair"]["row_count"] == 3
+
+        snapshot = await sqlite_db_monitor.get_full_snapshot()
+        assert snapshot["health"]["status"] == "healthy"
+        assert snapshot["connection_stats"]["journal_mode"] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_monitor_shares_the_cached_snapshot(self, sqlite_db_monitor):
+        """Test that monitor() and get_full_snapshot() share one query per interval."""
+        snapshot_fn = AsyncMock(wraps=sqlite_db_monitor.adapter.get_full_snapshot)
+        sqlite_db_monitor._snapshot_fn = snapshot_fn
+
+        first = await sqlite_db_monitor.monitor()
+        second = await sqlite_db_monitor.monitor()
+        snapshot = await sqlite_db_monitor.get_full_snapshot()
+
+        assert snapshot_fn.await_count == 1
+        assert first["table_stats"] == second["table_stats"] == snapshot["table_stats"]
+        # Issues are added to the results, not to the cached snapshot
+        assert "issues" not in snapshot
+
+    @pytest.mark.asyncio
+    async def test_monitor_skips_probes_when_snapshot_fails(self, sqlite_db_monitor):
+        """Test that an unreachable database is reported without per-probe queries."""
+        sqlite_db_monitor._snapshot_fn = AsyncMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+
+        results = await sqlite_db_monitor.monitor()
+
+        assert results["skipped"] is True
+        assert results["health"]["status"] == "unhealthy"
+        assert results["has_issues"] is True
+        assert "disk I/O error" in results["issues"][0]
+
+    @pytest.mark.asyncio
+    async def test_activity_technician_summary(self, sqlite_db_monitor):
+        """Test the technician summary rows the server's activity monitor reports."""
+        activity_monitor = activity_simple.ActivityMonitor(sqlite_db_monitor)
+
+        technicians = await activity_monitor.get_technician_performance()
+
+        assert [row["username"] for row in technicians] == ["alice", "bob"]
+        alice = technicians[0]
+        assert alice["technician_id"] == 1
+        assert isinstance(alice["total_repairs"], int) and alice["total_repairs"] == 2
+        assert isinstance(alice["completed_repairs"], int) and alice["completed_repairs"] == 1
+        assert isinstance(alice["completion_rate"], float) and alice["completion_rate"] == 50.0
+        assert isinstance(alice["last_repair_date"], str)
+        assert technicians[1]["completion_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_activity_monitor_payload(self, sqlite_db_monitor):
+        """Test the activity monitor payload and issues on SQLite."""
+        activity_monitor = activity_simple.ActivityMonitor(sqlite_db_monitor)
+
+        results = await activity_monitor.monitor()
+
+        assert "error" not in results
+        assert results["user_activity"]["total_users"] == 2
+        assert results["user_activity"]["total_technicians"] == 2
+        assert results["user_activity"]["active_technicians_today"] == 2
+        assert results["customer_activity"]["total_customers"] == 1
+        assert results["customer_activity"]["customers_with_repairs"] == 1
+        assert len(results["technician_performance"]) == 2
+        assert results["technician_performance_refreshed_at"] is not None
+        assert results["health"]["status"] == "healthy"
+        assert results["issues"] == []
+        assert results["has_issues"] is False
+
+
 class TestAPIMonitor:
     """Test API monitoring functionality."""
 
@@ -70,15 +299,47 @@ class TestAPIMonitor:
     @pytest.mark.asyncio
     async def test_health_check(self, api_monitor):
         """Test API health check."""
-        with patch('aiohttp.ClientSession') as mock_session:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_session.return_value.__aenter__.return_value.request.return_value.__aenter__.return_value = mock_response
+        mock_response = Mock()
+        mock_response.status = 200
+
+        with patch.object(api_monitor, '_session') as mock_session:
+            mock_session.closed = False
+            api_monitor._session_loop = asyncio.get_running_loop()
+            mock_session.request.return_value.__aenter__.return_value = mock_response
 
             result = await api_monitor.check_health()
+            await api_monitor.check_health(force_refresh=True)
 
             assert result.component == "api"
-            assert result.status in ["healthy", "degraded", "unhealthy"]
+            assert result.status == "healthy"
+            # Both checks go through the one shared session
+            assert mock_session.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self, api_monitor):
+        """Test that checks on one event loop share a single HTTP session."""
+        try:
+            session = await api_monitor._ensure_session()
+            assert await api_monitor._ensure_session() is session
+        finally:
+            await api_monitor.close()
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_parallel_probes(self, api_monitor):
+        """Test that endpoint probes overlap instead of running back to back."""
+        async def slow_check(endpoint, timestamp=None):
+            await asyncio.sleep(0.05)
+            return endpoint["path"]
+
+        with patch.object(api_monitor, 'check_endpoint', side_effect=slow_check):
+            start = time.perf_counter()
+            results = await api_monitor.check_all_endpoints()
+            elapsed = time.perf_counter() - start
+
+        assert results == [endpoint["path"] for endpoint in api_monitor.endpoints]
+        assert elapsed < 0.05 * len(api_monitor.endpoints)
 
     def test_calculate_metrics(self, api_monitor):
         """Test metrics calculation."""
@@ -94,6 +355,16 @@ class TestAPIMonitor:
         assert metrics["summary"]["total_requests"] == 3
         assert metrics["summary"]["total_errors"] == 1
 
+    def test_average_uses_evicting_window(self, api_monitor):
+        """Test that evicted samples drop out of the running average."""
+        window = api_monitor.response_times["/api/test/"]
+        window.extend([5000] + [100] * window.maxlen)
+        api_monitor.request_counts["/api/test/"] = window.maxlen + 1
+
+        metrics = api_monitor.calculate_metrics()
+
+        assert metrics["endpoints"]["/api/test/"]["average_response_time_ms"] == 100
+
 
 class TestQueueMonitor:
     """Test queue monitoring functionality."""
@@ -108,13 +379,99 @@ class TestQueueMonitor:
     async def test_health_check(self, mock_queue_monitor):
         """Test queue health check."""
         # Mock the methods
-        mock_queue_monitor.get_queue_status = Mock(return_value={"PENDING": {"count": 5}})
-        mock_queue_monitor.get_stuck_repairs = Mock(return_value=[])
+        mock_queue_monitor.get_queue_status = AsyncMock(return_value={"PENDING": {"count": 5}})
+        mock_queue_monitor.get_stuck_repairs = AsyncMock(return_value=[])
 
         result = await mock_queue_monitor.check_health()
 
         assert result.component == "queue"
         assert result.status in ["healthy", "degraded", "unhealthy"]
+        assert result.details["total_pending"] == 5
+        mock_queue_monitor.get_queue_status.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_result_is_not_cached(self, mock_queue_monitor):
+        """Test that an unhealthy check is re-run while a healthy one is reused."""
+        mock_queue_monitor._check_health = AsyncMock(side_effect=[
+            HealthCheckResult(component="queue", status="unhealthy", message="Queue check failed"),
+            HealthCheckResult(component="queue", status="healthy", message="Queue is healthy")
+        ])
+
+        assert (await mock_queue_monitor.check_health()).status == "unhealthy"
+        assert (await mock_queue_monitor.check_health()).status == "healthy"
+        assert (await mock_queue_monitor.check_health()).status == "healthy"
+        assert mock_queue_monitor._check_health.await_count == 2
+
+    def test_evaluate_health_from_fetched_data(self, mock_queue_monitor):
+        """Test that health is derived from data without re-querying."""
+        result = mock_queue_monitor.evaluate_health(
+            {"PENDING": {"count": 5}, "IN_PROGRESS": {"count": 500}},
+            [{"repair_id": 1}]
+        )
+
+        assert result.status == "degraded"
+        assert result.details == {"total_pending": 5, "stuck_repairs_count": 1}
+        mock_queue_monitor.db_monitor.get_connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_throughput_query_is_not_cached(self, mock_queue_monitor):
+        """Test that a transient query failure is retried on the next call."""
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value.fetchone.return_value = (2.0, 1.0, 10, 3)
+        mock_queue_monitor.db_monitor.get_connection.side_effect = [
+            psycopg2.OperationalError("connection reset"), MagicMock(__enter__=Mock(return_value=conn))
+        ]
+
+        assert await mock_queue_monitor.get_queue_throughput() == {}
+
+        throughput = await mock_queue_monitor.get_queue_throughput()
+        assert throughput["completion_rate_pct"] == 30.0
+
+    @pytest.mark.asyncio
+    async def test_failed_stuck_repairs_query_is_not_cached(self, mock_queue_monitor):
+        """Test that a failed stuck-repairs query doesn't read as an empty queue."""
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value.fetchall.return_value = [
+            (7, "U7", "IN_PROGRESS", datetime.now(), datetime.now(), "Acme", 1, "alice", 72.0)
+        ]
+        mock_queue_monitor.db_monitor.get_connection.side_effect = [
+            psycopg2.OperationalError("connection reset"), MagicMock(__enter__=Mock(return_value=conn))
+        ]
+
+        assert await mock_queue_monitor.get_stuck_repairs() == []
+
+        stuck = await mock_queue_monitor.get_stuck_repairs()
+        assert [repair["repair_id"] for repair in stuck] == [7]
+
+
+def _fake_list_objects(objects):
+    """Build a paginate() stand-in that honours Prefix and Delimiter like S3."""
+    def paginate(Bucket, Prefix="", Delimiter=None, **kwargs):
+        contents, folders = [], set()
+        for obj in objects:
+            if not obj['Key'].startswith(Prefix):
+                continue
+            rest = obj['Key'][len(Prefix):]
+            if Delimiter and Delimiter in rest:
+                folders.add(Prefix + rest.split(Delimiter)[0] + Delimiter)
+            else:
+                contents.append(obj)
+        page = {'CommonPrefixes': [{'Prefix': folder} for folder in sorted(folders)]}
+        if contents:
+            page['Contents'] = contents
+        return [page]
+    return paginate
+
+
+def _stub_bucket_configuration(s3_client):
+    """Give the bucket config lookups realistic responses."""
+    s3_client.get_bucket_versioning.return_value = {'Status': 'Enabled'}
+    s3_client.get_bucket_encryption.return_value = {'ServerSideEncryptionConfiguration': {'Rules': []}}
+    s3_client.get_bucket_lifecycle_configuration.return_value = {'Rules': [{'ID': 'expire-thumbnails'}]}
+    s3_client.get_public_access_block.return_value = {
+        'PublicAccessBlockConfiguration': {'BlockPublicAcls': True, 'BlockPublicPolicy': True}
+    }
+    s3_client.get_bucket_logging.return_value = {}
 
 
 class TestStorageMonitor:
@@ -139,18 +496,27 @@ class TestStorageMonitor:
         assert result.component == "storage"
         assert result.status in ["healthy", "unhealthy"]
 
+    @pytest.mark.asyncio
+    async def test_health_check_cached(self, mock_storage_monitor):
+        """Test that repeated health checks within the TTL reuse the probe."""
+        mock_storage_monitor.s3_client.head_bucket.return_value = {}
+
+        await mock_storage_monitor.check_health()
+        await mock_storage_monitor.check_health()
+        assert mock_storage_monitor.s3_client.head_bucket.call_count == 1
+
+        await mock_storage_monitor.check_health(force_refresh=True)
+        assert mock_storage_monitor.s3_client.head_bucket.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_bucket_size(self, mock_storage_monitor):
         """Test bucket size calculation."""
         # Mock paginator
         mock_paginator = Mock()
-        mock_page = {
-            'Contents': [
-                {'Key': 'test1.jpg', 'Size': 1024},
-                {'Key': 'test2.jpg', 'Size': 2048}
-            ]
-        }
-        mock_paginator.paginate.return_value = [mock_page]
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'test1.jpg', 'Size': 1024},
+            {'Key': 'test2.jpg', 'Size': 2048}
+        ])
         mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
 
         result = await mock_storage_monitor.get_bucket_size()
@@ -159,6 +525,202 @@ class TestStorageMonitor:
         assert result["total_size_bytes"] == 3072
         assert result["object_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_get_bucket_size_by_prefix(self, mock_storage_monitor):
+        """Test that each prefix is listed by S3 rather than filtered locally."""
+        mock_paginator = Mock()
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'damage-photos/before/1.jpg', 'Size': 1024},
+            {'Key': 'damage-photos/after/1.jpg', 'Size': 2048},
+            {'Key': 'damage-photos/thumbs/1.jpg', 'Size': 512},
+            {'Key': 'exports/report.csv', 'Size': 256},
+            {'Key': 'readme.txt', 'Size': 128}
+        ])
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+
+        result = await mock_storage_monitor.get_bucket_size()
+
+        assert result["total_size_bytes"] == 3968
+        assert result["object_count"] == 5
+        assert result["by_prefix"]["damage-photos/before/"]["object_count"] == 1
+        assert result["by_prefix"]["damage-photos/after/"]["object_count"] == 1
+        assert result["by_prefix"]["other/"]["object_count"] == 3
+        listed_prefixes = [call.kwargs.get('Prefix') for call in mock_paginator.paginate.call_args_list]
+        assert "damage-photos/before/" in listed_prefixes
+        assert "" in listed_prefixes
+
+        # A second lookup within the refresh interval reuses the scan
+        calls = mock_paginator.paginate.call_count
+        await mock_storage_monitor.get_large_files()
+        assert mock_paginator.paginate.call_count == calls
+
+    @pytest.mark.asyncio
+    async def test_get_large_files(self, mock_storage_monitor):
+        """Test large files are collected from the same listing, largest first."""
+        mock_paginator = Mock()
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'damage-photos/before/small.jpg', 'Size': 1024, 'LastModified': datetime.now()},
+            {'Key': 'damage-photos/after/big.jpg', 'Size': 8 * 1024 * 1024, 'LastModified': datetime.now()},
+            {'Key': 'exports/huge.zip', 'Size': 20 * 1024 * 1024, 'LastModified': datetime.now()}
+        ])
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+
+        result = await mock_storage_monitor.get_large_files(size_threshold_mb=5)
+
+        assert [f["key"] for f in result] == ['exports/huge.zip', 'damage-photos/after/big.jpg']
+        assert result[0]["size_mb"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_custom_large_file_threshold_keeps_one_baseline_reading(self, mock_storage_monitor):
+        """Test that large-file lookups at other thresholds don't move the baseline."""
+        mock_paginator = Mock()
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'damage-photos/before/huge.jpg', 'Size': 40 * 1024 * 1024},
+            {'Key': 'damage-photos/after/big.jpg', 'Size': 12 * 1024 * 1024},
+            {'Key': 'exports/medium.csv', 'Size': 2 * 1024 * 1024}
+        ])
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+        default_mb = mock_storage_monitor.thresholds.photo_size_mb
+
+        await mock_storage_monitor.get_bucket_size()
+        # Far from this bucket's size, so another reading would visibly move it
+        mock_storage_monitor._baseline_size_gb = baseline = 1.0
+        calls = mock_paginator.paginate.call_count
+
+        # A higher threshold filters the regular scan instead of listing again
+        larger = await mock_storage_monitor.get_large_files(size_threshold_mb=default_mb + 20)
+        assert [f["key"] for f in larger] == ['damage-photos/before/huge.jpg']
+        assert mock_paginator.paginate.call_count == calls
+
+        # A lower one lists again, but as a lookup rather than a new reading
+        smaller = await mock_storage_monitor.get_large_files(size_threshold_mb=1)
+        assert [f["key"] for f in smaller][-1] == 'exports/medium.csv'
+        assert mock_storage_monitor._baseline_size_gb == baseline
+
+    @pytest.mark.asyncio
+    async def test_get_bucket_size_from_inventory(self, mock_storage_monitor):
+        """Test that a CSV inventory report replaces listing the bucket."""
+        mock_storage_monitor.aws_config = mock_storage_monitor.aws_config.model_copy(
+            update={"s3_inventory_prefix": "inventory/"}
+        )
+        mock_paginator = Mock()
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'inventory/2024-06-01T01-00Z/manifest.json', 'Size': 100},
+            {'Key': 'inventory/2024-06-02T01-00Z/manifest.json', 'Size': 100},
+            {'Key': 'inventory/hive/dt=2024-06-02-01-00/symlink.txt', 'Size': 10}
+        ])
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+
+        manifest = {
+            "destinationBucket": "arn:aws:s3:::rs-systems-inventory",
+            "fileFormat": "CSV",
+            "fileSchema": "Bucket, Key, Size, LastModifiedDate",
+            "files": [{"key": "inventory/data/part-0.csv.gz"}]
+        }
+        rows = (
+            '"rs-systems-media","damage-photos/before/1.jpg","1024","2024-06-01T10:00:00.000Z"\n'
+            '"rs-systems-media","damage-photos/after/big%20photo.jpg","12582912","2024-06-01T11:00:00.000Z"\n'
+            '"rs-systems-media","exports/report.csv","256","2024-06-01T12:00:00.000Z"\n'
+        )
+        objects = {
+            "inventory/2024-06-02T01-00Z/manifest.json": json.dumps(manifest).encode(),
+            "inventory/data/part-0.csv.gz": gzip.compress(rows.encode())
+        }
+        mock_storage_monitor.s3_client.get_object.side_effect = (
+            lambda Bucket, Key: {'Body': io.BytesIO(objects[Key])}
+        )
+
+        stats = await mock_storage_monitor.get_bucket_size()
+        large_files = await mock_storage_monitor.get_large_files()
+
+        assert stats["inventory_date"] == "2024-06-02T01-00Z"
+        assert stats["total_size_bytes"] == 1024 + 12582912 + 256
+        assert stats["by_prefix"]["other/"]["object_count"] == 1
+        assert large_files[0]["key"] == "damage-photos/after/big photo.jpg"
+        mock_storage_monitor.s3_client.get_object.assert_any_call(
+            Bucket="rs-systems-inventory", Key="inventory/data/part-0.csv.gz"
+        )
+
+    @pytest.mark.asyncio
+    async def test_bucket_configuration_cached(self, mock_storage_monitor):
+        """Test that bucket settings are fetched once per refresh interval."""
+        _stub_bucket_configuration(mock_storage_monitor.s3_client)
+
+        first = await mock_storage_monitor.check_bucket_configuration()
+        second = await mock_storage_monitor.check_bucket_configuration()
+
+        assert first["versioning"] is True
+        assert second == first
+        assert mock_storage_monitor.s3_client.get_bucket_versioning.call_count == 1
+
+        mock_storage_monitor.refresh()
+        await mock_storage_monitor.check_bucket_configuration()
+        assert mock_storage_monitor.s3_client.get_bucket_versioning.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bucket_configuration_errors(self, mock_storage_monitor):
+        """Test that unconfigured settings default quietly but real failures surface."""
+        _stub_bucket_configuration(mock_storage_monitor.s3_client)
+        mock_storage_monitor.s3_client.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchLifecycleConfiguration'}}, 'GetBucketLifecycleConfiguration'
+        )
+        mock_storage_monitor.s3_client.get_bucket_logging.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied'}}, 'GetBucketLogging'
+        )
+
+        config = await mock_storage_monitor.check_bucket_configuration()
+
+        assert config["lifecycle_rules"] == 0
+        assert config["versioning"] is True
+        assert config["public_access_blocked"] is True
+        assert "logging_enabled" in config["error"]
+        assert "lifecycle_rules" not in config["error"]
+
+    @pytest.mark.asyncio
+    async def test_rapid_growth_flagged_against_baseline(self, mock_storage_monitor):
+        """Test that a jump over the smoothed bucket size is reported."""
+        mock_paginator = Mock()
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+
+        for size_gb in (20, 21, 20.5, 45):
+            mock_paginator.paginate.side_effect = _fake_list_objects([
+                {'Key': 'exports/archive.tar', 'Size': int(size_gb * 1024 ** 3)}
+            ])
+            mock_storage_monitor.refresh()
+            bucket_size = await mock_storage_monitor.get_bucket_size()
+            issues = mock_storage_monitor.check_thresholds(bucket_size, [], {})
+            growth = [issue for issue in issues if issue["type"] == "rapid_storage_growth"]
+            if size_gb < 45:
+                assert not growth
+
+        assert len(growth) == 1
+        assert growth[0]["value"] == 45
+
+    @pytest.mark.asyncio
+    async def test_cached_scan_does_not_move_baseline(self, mock_storage_monitor):
+        """Test that repeated checks on one cached scan leave the baseline alone."""
+        mock_paginator = Mock()
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'exports/archive.tar', 'Size': 20 * 1024 ** 3}
+        ])
+        mock_storage_monitor.s3_client.get_paginator.return_value = mock_paginator
+        _stub_bucket_configuration(mock_storage_monitor.s3_client)
+
+        await mock_storage_monitor.monitor()
+        calls = mock_paginator.paginate.call_count
+
+        # The next scan finds the bucket at 30GB and is then served from cache
+        mock_paginator.paginate.side_effect = _fake_list_objects([
+            {'Key': 'exports/archive.tar', 'Size': 30 * 1024 ** 3}
+        ])
+        mock_storage_monitor._scan_cache.invalidate()
+        for _ in range(3):
+            result = await mock_storage_monitor.monitor()
+            assert result["bucket_size"]["baseline_size_gb"] == 20
+            assert mock_storage_monitor._baseline_size_gb == pytest.approx(22)
+
+        assert mock_paginator.paginate.call_count == calls * 2
+
 
 class TestActivityMonitor:
     """Test activity monitoring functionality."""
@@ -173,7 +735,7 @@ class TestActivityMonitor:
     async def test_health_check(self, mock_activity_monitor):
         """Test activity health check."""
         # Mock the get_active_users method
-        mock_activity_monitor.get_active_users = Mock(return_value={
+        mock_activity_monitor.get_active_users = AsyncMock(return_value={
             "total_users": 100,
             "active_users_30d": 80,
             "active_technicians_today": 5
@@ -183,6 +745,41 @@ class TestActivityMonitor:
 
         assert result.component == "activity"
         assert result.status in ["healthy", "degraded", "unhealthy"]
+        mock_activity_monitor.get_active_users.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_health_query_is_not_cached(self, mock_activity_monitor):
+        """Test that a health check on a failed user query is re-run next call."""
+        mock_activity_monitor.get_active_users = AsyncMock(side_effect=[
+            {},
+            {"active_technicians_today": 5, "activity_rate_pct": 80}
+        ])
+
+        assert (await mock_activity_monitor.check_health()).status == "degraded"
+        assert (await mock_activity_monitor.check_health()).status == "healthy"
+        assert (await mock_activity_monitor.check_health()).status == "healthy"
+        assert mock_activity_monitor.get_active_users.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_monitor_is_not_cached(self, mock_activity_monitor):
+        """Test that an outage result is retried on the next call."""
+        mock_activity_monitor.get_activity_snapshot = AsyncMock(side_effect=[
+            psycopg2.OperationalError("connection reset"),
+            {
+                "user_activity": {"active_technicians_today": 3},
+                "customer_activity": {},
+                "technician_performance": [],
+                "inactive_technicians": [],
+                "login_patterns": {}
+            }
+        ])
+
+        failed = await mock_activity_monitor.monitor()
+        assert "connection reset" in failed["error"]
+
+        results = await mock_activity_monitor.monitor()
+        assert "error" not in results
+        assert results["user_activity"] == {"active_technicians_today": 3}
 
 
 class TestAlertManager:
@@ -234,6 +831,70 @@ class TestAlertManager:
         assert "severity_breakdown" in summary
         assert "component_breakdown" in summary
 
+    @pytest.mark.asyncio
+    async def test_alert_summary_counts_track_active_alerts(self, alert_manager):
+        """Test that the summary breakdowns match the active alerts after resolves."""
+        alerts = []
+        for severity, component in [
+            ("critical", "database"), ("warning", "api"), ("warning", "database"),
+            ("info", "storage"), ("critical", "queue")
+        ]:
+            alerts.append(await alert_manager.create_alert(
+                severity=severity, component=component, title="Test Alert", message="Test message"
+            ))
+        await alert_manager.resolve_alert(alerts[0].id)
+        await alert_manager.resolve_alert(alerts[3].id)
+
+        summary = alert_manager.get_alert_summary()
+
+        active = alert_manager.get_active_alerts()
+        assert summary["active_alerts_count"] == 3
+        assert summary["severity_breakdown"] == {
+            severity: sum(alert.severity == severity for alert in active)
+            for severity in ("critical", "warning", "info")
+        }
+        assert summary["component_breakdown"] == {"api": 1, "database": 1, "queue": 1}
+        assert summary["alerts_last_24h"] == 5
+
+
+class TestAsyncTTLCache:
+    """Test the monitor result cache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_result(self):
+        """Test that concurrent lookups only compute the value once."""
+        cache = AsyncTTLCache(ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {"status": "healthy"}
+
+        results = await asyncio.gather(*[cache.get_or_set("health", compute) for _ in range(5)])
+
+        assert len(calls) == 1
+        assert all(result == {"status": "healthy"} for result in results)
+
+        cache.invalidate("health")
+        await cache.get_or_set("health", compute)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_counters(self):
+        """Test that hits, misses and forced refreshes are counted."""
+        cache = AsyncTTLCache(ttl_seconds=60)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert await cache.get_or_set("health", compute) == 1
+        assert await cache.get_or_set("health", compute) == 1
+        assert await cache.get_or_set("health", compute, force_refresh=True) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
 
 @pytest.mark.asyncio
 async def test_configuration_validation():
@@ -245,5 +906,14 @@ async def test_configuration_validation():
     assert hasattr(settings, 'alerts')
 
 
+def test_email_recipients_parsed_from_env(monkeypatch):
+    """Test that EMAIL_ALERT_TO is split into a recipient list once."""
+    monkeypatch.setenv("EMAIL_ALERT_TO", "admin@rssystems.com, tech-team@rssystems.com")
+
+    config = AlertConfig()
+
+    assert config.email_to == ["admin@rssystems.com", "tech-team@rssystems.com"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file